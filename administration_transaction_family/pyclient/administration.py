@@ -259,12 +259,23 @@ def buildSystemConfig():
     maximum_transaction_interval = config['DEFAULT']['MAXIMUM_TRANSACTION_INTERVAL'] 
     maximum_transaction_rate = config['DEFAULT']['MAXIMUM_TRANSACTION_RATE'] 
     punishment_threshold = config['DEFAULT']['PUNISHMENT_THRESHOLD'] 
+    # Search budgets and the sweep limit are optional, 0 means unlimited
+    maximum_expanded_nodes = config['DEFAULT'].get('MAXIMUM_EXPANDED_NODES', '0')
+    maximum_state_reads = config['DEFAULT'].get('MAXIMUM_STATE_READS', '0')
+    maximum_scored_edges = config['DEFAULT'].get('MAXIMUM_SCORED_EDGES', '0')
+    maximum_sweep_addresses = config['DEFAULT'].get('MAXIMUM_SWEEP_ADDRESSES', '0')
+    bidirectional_search = config['DEFAULT'].get('BIDIRECTIONAL_SEARCH', '0')
     # Build a Systemconfig object
     Systemconfig = systemconfig_pb2.Systemconfig(
         SecurityParameter = int(security_parameter),
         MaximumTransactionInterval = int(maximum_transaction_interval),
         MaximumTransactionRate = int(maximum_transaction_rate),
-        PunishmentThreshold = int(punishment_threshold)
+        PunishmentThreshold = int(punishment_threshold),
+        MaximumExpandedNodes = int(maximum_expanded_nodes),
+        MaximumStateReads = int(maximum_state_reads),
+        MaximumScoredEdges = int(maximum_scored_edges),
+        MaximumSweepAddresses = int(maximum_sweep_addresses),
+        BidirectionalSearch = int(bidirectional_search)
     )
     return Systemconfig
 
@@ -30,7 +30,6 @@ import random
 import time
 import requests
 import yaml
-import cbor
 import logging
 
 from sawtooth_signing import create_context
@@ -42,6 +41,8 @@ from sawtooth_sdk.protobuf.transaction_pb2 import Transaction
 from sawtooth_sdk.protobuf.batch_pb2 import BatchList
 from sawtooth_sdk.protobuf.batch_pb2 import BatchHeader
 from sawtooth_sdk.protobuf.batch_pb2 import Batch
+import cbor
+import transaction_envelope_pb2
 
 LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +50,12 @@ LOGGER = logging.getLogger(__name__)
 FAMILY_NAME = 'administration'
 # TF Prefix is first 6 characters of SHA-512("administration"), 5A7526
 
+# Version of the transaction envelope, the transaction processor also accepts the earlier cbor payloads
+ENVELOPE_VERSION = 1
+# Payloads are sent as cbor maps unless the client is created with envelope=True, the envelope
+# only decodes faster than cbor with a compiled protobuf backend in the transaction processor
+DEFAULT_ENVELOPE = False
+
 def _hash(data):
     return hashlib.sha512(data).hexdigest()
 
@@ -64,12 +71,13 @@ class AdministrationClient(object):
     Supports "loadAttestationPropertiesDB", "loadPolicyDB", "loadSystemConfig","loadDeviceDB" and "loadWarrantDB" functions.
     '''
 
-    def __init__(self, base_url, key_file=None):
+    def __init__(self, base_url, key_file=None, envelope=DEFAULT_ENVELOPE):
         '''Initialize the client class.
 
            Mainly getting the key pair and computing the address.
         '''
         self._base_url = base_url
+        self._envelope = envelope
 
         if key_file is None:
             self._signer = None
@@ -205,13 +213,16 @@ class AdministrationClient(object):
            Called by all submission methods.
         '''
 
-        # Assemble an action and the actual payload in a dictionary
-        transactionDictionary = {
-            'Action': action,
-            'Payload': data
-        }
-
-        payload = cbor.dumps(transactionDictionary)
+        # Assemble an action and the actual payload in the versioned envelope or a cbor map
+        if self._envelope:
+            envelope = transaction_envelope_pb2.AdministrationEnvelope(Version=ENVELOPE_VERSION)
+            if envelope.DESCRIPTOR.fields_by_name[action].message_type is None:
+                setattr(envelope, action, data)
+            else:
+                getattr(envelope, action).MergeFromString(data)
+            payload = envelope.SerializeToString()
+        else:
+            payload = cbor.dumps({'Action': action, 'Payload': data})
 
         # Create a TransactionHeader.
         header = TransactionHeader(
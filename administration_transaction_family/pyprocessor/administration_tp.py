@@ -39,6 +39,7 @@ import policies_pb2
 import systemconfig_pb2
 import devices_pb2
 import warrants_pb2
+import transaction_envelope_pb2
 
 # hard-coded for simplicity (otherwise get the URL from the args in main):
 #DEFAULT_URL = 'tcp://localhost:4004'
@@ -47,6 +48,19 @@ DEFAULT_URL = 'tcp://validator:4004'
 
 LOGGER = logging.getLogger(__name__)
 
+# Version of the protobuf transaction envelope
+ENVELOPE_VERSION = 1
+# First byte of an envelope: field 1 (Version) with wire type varint
+ENVELOPE_VERSION_TAG = b'\x08'
+# Message of the payload of each action, like the fields of the envelope
+ACTION_MESSAGES = {
+    "submitProperties": properties_pb2.PropertiesList,
+    "submitPolicy": policies_pb2.PolicyList,
+    "submitSystemConfig": systemconfig_pb2.Systemconfig,
+    "submitDevices": devices_pb2.DeviceList,
+    "submitWarrants": warrants_pb2.WarrantList,
+}
+
 FAMILY_NAME = "administration"
 # TF Prefix is first 6 characters of SHA-512("administration"), 5A7526
 
@@ -92,7 +106,7 @@ class AdministrationTransactionHandler(TransactionHandler):
         '''
 
         # Get the payload and extract the administration-specific information.
-        # Payload needs to be cbor decoded and split into action and actual (inner) payload
+        # Payload needs to be decoded from its envelope and split into action and actual (inner) payload
         header = transaction.header        
         action, payload = self._decode_transaction(transaction.payload)
 
@@ -127,8 +141,11 @@ class AdministrationTransactionHandler(TransactionHandler):
         else:
             LOGGER.info("Unhandled action. Action not legal!")
 
-    # Handle transaction decoding
+    # Handle transaction decoding, a protobuf envelope or the cbor map of earlier clients
+    # The formats are told apart by the first byte, the tag of the envelope Version field is 0x08
     def _decode_transaction(self, payload):
+        if payload[:1] == ENVELOPE_VERSION_TAG:
+            return self._decode_envelope(payload)
         try:
             content = cbor.loads(payload)
         except:
@@ -144,12 +161,39 @@ class AdministrationTransactionHandler(TransactionHandler):
         except AttributeError:
             raise InvalidTransaction('Payload must be here')
 
-        return action, payload
+        return action, self._parse_payload(action, payload)
+
+    # Parse the serialized message of an action from a cbor map, the envelope parses it with the envelope
+    def _parse_payload(self, action, payload):
+        messageType = ACTION_MESSAGES.get(action)
+        if messageType is None:
+            return payload
+        message = messageType()
+        try:
+            message.ParseFromString(payload)
+        except:
+            raise InvalidTransaction('Invalid payload serialization')
+        return message
+
+    # Decode the protobuf envelope, the action is the name of the set field
+    def _decode_envelope(self, payload):
+        envelope = transaction_envelope_pb2.AdministrationEnvelope()
+        try:
+            envelope.ParseFromString(payload)
+        except:
+            raise InvalidTransaction('Invalid payload serialization')
+
+        if envelope.Version != ENVELOPE_VERSION:
+            raise InvalidTransaction('Unsupported envelope version {}'.format(envelope.Version))
+
+        action = envelope.WhichOneof('Action')
+        if action is None:
+            raise InvalidTransaction('Action must be here')
+
+        return action, getattr(envelope, action)
 
 # Write the properties database
-def handlePropertiesSubmission(context, payload):
-    PropertiesList = properties_pb2.PropertiesList()
-    PropertiesList.ParseFromString(payload)
+def handlePropertiesSubmission(context, PropertiesList):
     address = _assembleAddress('PROPERTIES')
     state_data = PropertiesList.SerializeToString()
     LOGGER.info('State Data String: %s',
@@ -158,9 +202,7 @@ def handlePropertiesSubmission(context, payload):
     return addresses
 
 # Write the policies database
-def handlePolicySubmission(context, payload):
-    PolicyList = policies_pb2.PolicyList()
-    PolicyList.ParseFromString(payload)
+def handlePolicySubmission(context, PolicyList):
     address = _assembleAddress('POLICY')
     state_data = PolicyList.SerializeToString()
     LOGGER.info('State Data String: %s',
@@ -169,9 +211,7 @@ def handlePolicySubmission(context, payload):
     return addresses
 
 # Write the system config database
-def handleSystemConfigSubmission(context, payload):
-    SystemConfig = systemconfig_pb2.Systemconfig()
-    SystemConfig.ParseFromString(payload)
+def handleSystemConfigSubmission(context, SystemConfig):
     address = _assembleAddress('CONFIG')
     state_data = SystemConfig.SerializeToString()
     LOGGER.info('State Data String: %s',
@@ -180,9 +220,7 @@ def handleSystemConfigSubmission(context, payload):
     return addresses
 
 # Write the device database
-def handleDevicesSubmission(context, payload):
-    DeviceList = devices_pb2.DeviceList()
-    DeviceList.ParseFromString(payload)
+def handleDevicesSubmission(context, DeviceList):
     address = _assembleAddress('DEVICES')
     state_data = DeviceList.SerializeToString()
     LOGGER.info('State Data String: %s',
@@ -191,9 +229,7 @@ def handleDevicesSubmission(context, payload):
     return addresses
 
 # Write the warrants database
-def handleWarrantsSubmission(context, payload):
-    WarrantList = warrants_pb2.WarrantList()
-    WarrantList.ParseFromString(payload)
+def handleWarrantsSubmission(context, WarrantList):
     address = _assembleAddress('WARRANTS')
     state_data = WarrantList.SerializeToString()
     LOGGER.info('State Data String: %s',
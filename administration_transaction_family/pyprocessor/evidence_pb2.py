@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: evidence.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='evidence.proto',
+  package='',
+  syntax='proto3',
+  serialized_options=None,
+  serialized_pb=_b('\n\x0e\x65vidence.proto\"\xe0\x01\n\x08\x45vidence\x12\x18\n\x10VerifierIdentity\x18\x01 \x01(\t\x12\x16\n\x0eProverIdentity\x18\x02 \x01(\t\x12\x17\n\x0f\x41ttestationType\x18\x03 \x01(\t\x12\x19\n\x11ProverDeviceClass\x18\x04 \x01(\t\x12\x15\n\rProverVersion\x18\x05 \x01(\t\x12\x13\n\x0bMeasurement\x18\x06 \x01(\t\x12\x1c\n\x14isWarrantAttestation\x18\x07 \x01(\t\x12\x11\n\tTimestamp\x18\x08 \x01(\x05\x12\x11\n\tExpiresAt\x18\t \x01(\x05\",\n\x0c\x45videnceList\x12\x1c\n\tEvidences\x18\x01 \x03(\x0b\x32\t.Evidence\"\"\n\x0cIdentityList\x12\x12\n\nIdentities\x18\x01 \x03(\t\"!\n\x0c\x45xpiryBucket\x12\x11\n\tAddresses\x18\x01 \x03(\t\"\"\n\x0c\x45xpiryCursor\x12\x12\n\nNextBucket\x18\x01 \x01(\x05\"o\n\tTrustMemo\x12\x13\n\x0bReliability\x18\x01 \x01(\x01\x12\x0c\n\x04Path\x18\x02 \x01(\t\x12\x12\n\nComputedAt\x18\x03 \x01(\x05\x12\x11\n\tExpiresAt\x18\x04 \x01(\x05\x12\x18\n\x05\x45\x64ges\x18\x05 \x03(\x0b\x32\t.Evidence\"\x1e\n\tMemoIndex\x12\x11\n\tAddresses\x18\x01 \x03(\t\"C\n\x11ReachabilityEntry\x12\x1c\n\tEvidences\x18\x01 \x03(\x0b\x32\t.Evidence\x12\x10\n\x08SyncedAt\x18\x02 \x01(\x05\"\x1e\n\tCacheMiss\x12\x11\n\tTimestamp\x18\x01 \x01(\x05\x62\x06proto3')
+)
+
+
+
+
+_EVIDENCE = _descriptor.Descriptor(
+  name='Evidence',
+  full_name='Evidence',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='VerifierIdentity', full_name='Evidence.VerifierIdentity', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ProverIdentity', full_name='Evidence.ProverIdentity', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='AttestationType', full_name='Evidence.AttestationType', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ProverDeviceClass', full_name='Evidence.ProverDeviceClass', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ProverVersion', full_name='Evidence.ProverVersion', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Measurement', full_name='Evidence.Measurement', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='isWarrantAttestation', full_name='Evidence.isWarrantAttestation', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Timestamp', full_name='Evidence.Timestamp', index=7,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ExpiresAt', full_name='Evidence.ExpiresAt', index=8,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=19,
+  serialized_end=243,
+)
+
+
+_EVIDENCELIST = _descriptor.Descriptor(
+  name='EvidenceList',
+  full_name='EvidenceList',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Evidences', full_name='EvidenceList.Evidences', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=245,
+  serialized_end=289,
+)
+
+
+_IDENTITYLIST = _descriptor.Descriptor(
+  name='IdentityList',
+  full_name='IdentityList',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Identities', full_name='IdentityList.Identities', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=291,
+  serialized_end=325,
+)
+
+
+_EXPIRYBUCKET = _descriptor.Descriptor(
+  name='ExpiryBucket',
+  full_name='ExpiryBucket',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Addresses', full_name='ExpiryBucket.Addresses', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=327,
+  serialized_end=360,
+)
+
+
+_EXPIRYCURSOR = _descriptor.Descriptor(
+  name='ExpiryCursor',
+  full_name='ExpiryCursor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='NextBucket', full_name='ExpiryCursor.NextBucket', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=362,
+  serialized_end=396,
+)
+
+
+_TRUSTMEMO = _descriptor.Descriptor(
+  name='TrustMemo',
+  full_name='TrustMemo',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Reliability', full_name='TrustMemo.Reliability', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Path', full_name='TrustMemo.Path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ComputedAt', full_name='TrustMemo.ComputedAt', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ExpiresAt', full_name='TrustMemo.ExpiresAt', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Edges', full_name='TrustMemo.Edges', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=398,
+  serialized_end=509,
+)
+
+
+_MEMOINDEX = _descriptor.Descriptor(
+  name='MemoIndex',
+  full_name='MemoIndex',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Addresses', full_name='MemoIndex.Addresses', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=511,
+  serialized_end=541,
+)
+
+
+_REACHABILITYENTRY = _descriptor.Descriptor(
+  name='ReachabilityEntry',
+  full_name='ReachabilityEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Evidences', full_name='ReachabilityEntry.Evidences', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='SyncedAt', full_name='ReachabilityEntry.SyncedAt', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=543,
+  serialized_end=610,
+)
+
+
+_CACHEMISS = _descriptor.Descriptor(
+  name='CacheMiss',
+  full_name='CacheMiss',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Timestamp', full_name='CacheMiss.Timestamp', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=612,
+  serialized_end=642,
+)
+
+_EVIDENCELIST.fields_by_name['Evidences'].message_type = _EVIDENCE
+_TRUSTMEMO.fields_by_name['Edges'].message_type = _EVIDENCE
+_REACHABILITYENTRY.fields_by_name['Evidences'].message_type = _EVIDENCE
+DESCRIPTOR.message_types_by_name['Evidence'] = _EVIDENCE
+DESCRIPTOR.message_types_by_name['EvidenceList'] = _EVIDENCELIST
+DESCRIPTOR.message_types_by_name['IdentityList'] = _IDENTITYLIST
+DESCRIPTOR.message_types_by_name['ExpiryBucket'] = _EXPIRYBUCKET
+DESCRIPTOR.message_types_by_name['ExpiryCursor'] = _EXPIRYCURSOR
+DESCRIPTOR.message_types_by_name['TrustMemo'] = _TRUSTMEMO
+DESCRIPTOR.message_types_by_name['MemoIndex'] = _MEMOINDEX
+DESCRIPTOR.message_types_by_name['ReachabilityEntry'] = _REACHABILITYENTRY
+DESCRIPTOR.message_types_by_name['CacheMiss'] = _CACHEMISS
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Evidence = _reflection.GeneratedProtocolMessageType('Evidence', (_message.Message,), dict(
+  DESCRIPTOR = _EVIDENCE,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:Evidence)
+  ))
+_sym_db.RegisterMessage(Evidence)
+
+EvidenceList = _reflection.GeneratedProtocolMessageType('EvidenceList', (_message.Message,), dict(
+  DESCRIPTOR = _EVIDENCELIST,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:EvidenceList)
+  ))
+_sym_db.RegisterMessage(EvidenceList)
+
+IdentityList = _reflection.GeneratedProtocolMessageType('IdentityList', (_message.Message,), dict(
+  DESCRIPTOR = _IDENTITYLIST,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:IdentityList)
+  ))
+_sym_db.RegisterMessage(IdentityList)
+
+ExpiryBucket = _reflection.GeneratedProtocolMessageType('ExpiryBucket', (_message.Message,), dict(
+  DESCRIPTOR = _EXPIRYBUCKET,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:ExpiryBucket)
+  ))
+_sym_db.RegisterMessage(ExpiryBucket)
+
+ExpiryCursor = _reflection.GeneratedProtocolMessageType('ExpiryCursor', (_message.Message,), dict(
+  DESCRIPTOR = _EXPIRYCURSOR,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:ExpiryCursor)
+  ))
+_sym_db.RegisterMessage(ExpiryCursor)
+
+TrustMemo = _reflection.GeneratedProtocolMessageType('TrustMemo', (_message.Message,), dict(
+  DESCRIPTOR = _TRUSTMEMO,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:TrustMemo)
+  ))
+_sym_db.RegisterMessage(TrustMemo)
+
+MemoIndex = _reflection.GeneratedProtocolMessageType('MemoIndex', (_message.Message,), dict(
+  DESCRIPTOR = _MEMOINDEX,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:MemoIndex)
+  ))
+_sym_db.RegisterMessage(MemoIndex)
+
+ReachabilityEntry = _reflection.GeneratedProtocolMessageType('ReachabilityEntry', (_message.Message,), dict(
+  DESCRIPTOR = _REACHABILITYENTRY,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:ReachabilityEntry)
+  ))
+_sym_db.RegisterMessage(ReachabilityEntry)
+
+CacheMiss = _reflection.GeneratedProtocolMessageType('CacheMiss', (_message.Message,), dict(
+  DESCRIPTOR = _CACHEMISS,
+  __module__ = 'evidence_pb2'
+  # @@protoc_insertion_point(class_scope:CacheMiss)
+  ))
+_sym_db.RegisterMessage(CacheMiss)
+
+
+# @@protoc_insertion_point(module_scope)
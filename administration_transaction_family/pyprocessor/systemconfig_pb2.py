@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=_b('\n\x12systemconfig.proto\"\x8a\x01\n\x0cSystemconfig\x12\x19\n\x11SecurityParameter\x18\x01 \x01(\x05\x12\"\n\x1aMaximumTransactionInterval\x18\x02 \x01(\x05\x12\x1e\n\x16MaximumTransactionRate\x18\x03 \x01(\x05\x12\x1b\n\x13PunishmentThreshold\x18\x04 \x01(\x05\x62\x06proto3')
+  serialized_pb=_b('\n\x12systemconfig.proto\"\x9b\x02\n\x0cSystemconfig\x12\x19\n\x11SecurityParameter\x18\x01 \x01(\x05\x12\"\n\x1aMaximumTransactionInterval\x18\x02 \x01(\x05\x12\x1e\n\x16MaximumTransactionRate\x18\x03 \x01(\x05\x12\x1b\n\x13PunishmentThreshold\x18\x04 \x01(\x05\x12\x1c\n\x14MaximumExpandedNodes\x18\x05 \x01(\x05\x12\x19\n\x11MaximumStateReads\x18\x06 \x01(\x05\x12\x1a\n\x12MaximumScoredEdges\x18\x07 \x01(\x05\x12\x1d\n\x15MaximumSweepAddresses\x18\x08 \x01(\x05\x12\x1b\n\x13\x42idirectionalSearch\x18\t \x01(\x05\x62\x06proto3')
 )
 
 
@@ -61,6 +61,41 @@ _SYSTEMCONFIG = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MaximumExpandedNodes', full_name='Systemconfig.MaximumExpandedNodes', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MaximumStateReads', full_name='Systemconfig.MaximumStateReads', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MaximumScoredEdges', full_name='Systemconfig.MaximumScoredEdges', index=6,
+      number=7, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MaximumSweepAddresses', full_name='Systemconfig.MaximumSweepAddresses', index=7,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='BidirectionalSearch', full_name='Systemconfig.BidirectionalSearch', index=8,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -74,7 +109,7 @@ _SYSTEMCONFIG = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=23,
-  serialized_end=161,
+  serialized_end=306,
 )
 
 DESCRIPTOR.message_types_by_name['Systemconfig'] = _SYSTEMCONFIG
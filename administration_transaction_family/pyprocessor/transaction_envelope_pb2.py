@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: transaction_envelope.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import evidence_pb2 as evidence__pb2
+import trust_query_pb2 as trust__query__pb2
+import properties_pb2 as properties__pb2
+import policies_pb2 as policies__pb2
+import systemconfig_pb2 as systemconfig__pb2
+import devices_pb2 as devices__pb2
+import warrants_pb2 as warrants__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='transaction_envelope.proto',
+  package='',
+  syntax='proto3',
+  serialized_options=None,
+  serialized_pb=_b('\n\x1atransaction_envelope.proto\x1a\x0e\x65vidence.proto\x1a\x11trust_query.proto\x1a\x10properties.proto\x1a\x0epolicies.proto\x1a\x12systemconfig.proto\x1a\rdevices.proto\x1a\x0ewarrants.proto\"\xb2\x03\n\x13\x41ttestationEnvelope\x12\x0f\n\x07Version\x18\x01 \x01(\r\x12#\n\x0esubmitEvidence\x18\x02 \x01(\x0b\x32\t.EvidenceH\x00\x12+\n\x12submitEvidenceList\x18\x03 \x01(\x0b\x32\r.EvidenceListH\x00\x12!\n\ntrustQuery\x18\x04 \x01(\x0b\x32\x0b.TrustQueryH\x00\x12+\n\x0ftrustQueryMulti\x18\x05 \x01(\x0b\x32\x10.TrustQueryMultiH\x00\x12\'\n\nverifyPath\x18\x06 \x01(\x0b\x32\x11.PathVerificationH\x00\x12\x16\n\x0csweepExpired\x18\x07 \x01(\x0cH\x00\x12(\n\x0fmigrateEvidence\x18\t \x01(\x0b\x32\r.IdentityListH\x00\x12,\n\x13registerHotTrustors\x18\n \x01(\x0b\x32\r.IdentityListH\x00\x12.\n\x15unregisterHotTrustors\x18\x0b \x01(\x0b\x32\r.IdentityListH\x00\x42\x08\n\x06\x41\x63tionJ\x04\x08\x08\x10\tR\x0f\x63ompactEvidence\"\x80\x02\n\x16\x41\x64ministrationEnvelope\x12\x0f\n\x07Version\x18\x01 \x01(\r\x12+\n\x10submitProperties\x18\x02 \x01(\x0b\x32\x0f.PropertiesListH\x00\x12#\n\x0csubmitPolicy\x18\x03 \x01(\x0b\x32\x0b.PolicyListH\x00\x12+\n\x12submitSystemConfig\x18\x04 \x01(\x0b\x32\r.SystemconfigH\x00\x12$\n\rsubmitDevices\x18\x05 \x01(\x0b\x32\x0b.DeviceListH\x00\x12&\n\x0esubmitWarrants\x18\x06 \x01(\x0b\x32\x0c.WarrantListH\x00\x42\x08\n\x06\x41\x63tionb\x06proto3')
+  ,
+  dependencies=[evidence__pb2.DESCRIPTOR,trust__query__pb2.DESCRIPTOR,properties__pb2.DESCRIPTOR,policies__pb2.DESCRIPTOR,systemconfig__pb2.DESCRIPTOR,devices__pb2.DESCRIPTOR,warrants__pb2.DESCRIPTOR,])
+
+
+
+
+_ATTESTATIONENVELOPE = _descriptor.Descriptor(
+  name='AttestationEnvelope',
+  full_name='AttestationEnvelope',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Version', full_name='AttestationEnvelope.Version', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='submitEvidence', full_name='AttestationEnvelope.submitEvidence', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='submitEvidenceList', full_name='AttestationEnvelope.submitEvidenceList', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='trustQuery', full_name='AttestationEnvelope.trustQuery', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='trustQueryMulti', full_name='AttestationEnvelope.trustQueryMulti', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='verifyPath', full_name='AttestationEnvelope.verifyPath', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sweepExpired', full_name='AttestationEnvelope.sweepExpired', index=6,
+      number=7, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='migrateEvidence', full_name='AttestationEnvelope.migrateEvidence', index=7,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='registerHotTrustors', full_name='AttestationEnvelope.registerHotTrustors', index=8,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='unregisterHotTrustors', full_name='AttestationEnvelope.unregisterHotTrustors', index=9,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='Action', full_name='AttestationEnvelope.Action',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=151,
+  serialized_end=585,
+)
+
+
+_ADMINISTRATIONENVELOPE = _descriptor.Descriptor(
+  name='AdministrationEnvelope',
+  full_name='AdministrationEnvelope',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Version', full_name='AdministrationEnvelope.Version', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='submitProperties', full_name='AdministrationEnvelope.submitProperties', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='submitPolicy', full_name='AdministrationEnvelope.submitPolicy', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='submitSystemConfig', full_name='AdministrationEnvelope.submitSystemConfig', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='submitDevices', full_name='AdministrationEnvelope.submitDevices', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='submitWarrants', full_name='AdministrationEnvelope.submitWarrants', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='Action', full_name='AdministrationEnvelope.Action',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=588,
+  serialized_end=844,
+)
+
+_ATTESTATIONENVELOPE.fields_by_name['submitEvidence'].message_type = evidence__pb2._EVIDENCE
+_ATTESTATIONENVELOPE.fields_by_name['submitEvidenceList'].message_type = evidence__pb2._EVIDENCELIST
+_ATTESTATIONENVELOPE.fields_by_name['trustQuery'].message_type = trust__query__pb2._TRUSTQUERY
+_ATTESTATIONENVELOPE.fields_by_name['trustQueryMulti'].message_type = trust__query__pb2._TRUSTQUERYMULTI
+_ATTESTATIONENVELOPE.fields_by_name['verifyPath'].message_type = trust__query__pb2._PATHVERIFICATION
+_ATTESTATIONENVELOPE.fields_by_name['migrateEvidence'].message_type = evidence__pb2._IDENTITYLIST
+_ATTESTATIONENVELOPE.fields_by_name['registerHotTrustors'].message_type = evidence__pb2._IDENTITYLIST
+_ATTESTATIONENVELOPE.fields_by_name['unregisterHotTrustors'].message_type = evidence__pb2._IDENTITYLIST
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['submitEvidence'])
+_ATTESTATIONENVELOPE.fields_by_name['submitEvidence'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['submitEvidenceList'])
+_ATTESTATIONENVELOPE.fields_by_name['submitEvidenceList'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['trustQuery'])
+_ATTESTATIONENVELOPE.fields_by_name['trustQuery'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['trustQueryMulti'])
+_ATTESTATIONENVELOPE.fields_by_name['trustQueryMulti'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['verifyPath'])
+_ATTESTATIONENVELOPE.fields_by_name['verifyPath'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['sweepExpired'])
+_ATTESTATIONENVELOPE.fields_by_name['sweepExpired'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['migrateEvidence'])
+_ATTESTATIONENVELOPE.fields_by_name['migrateEvidence'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['registerHotTrustors'])
+_ATTESTATIONENVELOPE.fields_by_name['registerHotTrustors'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ATTESTATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ATTESTATIONENVELOPE.fields_by_name['unregisterHotTrustors'])
+_ATTESTATIONENVELOPE.fields_by_name['unregisterHotTrustors'].containing_oneof = _ATTESTATIONENVELOPE.oneofs_by_name['Action']
+_ADMINISTRATIONENVELOPE.fields_by_name['submitProperties'].message_type = properties__pb2._PROPERTIESLIST
+_ADMINISTRATIONENVELOPE.fields_by_name['submitPolicy'].message_type = policies__pb2._POLICYLIST
+_ADMINISTRATIONENVELOPE.fields_by_name['submitSystemConfig'].message_type = systemconfig__pb2._SYSTEMCONFIG
+_ADMINISTRATIONENVELOPE.fields_by_name['submitDevices'].message_type = devices__pb2._DEVICELIST
+_ADMINISTRATIONENVELOPE.fields_by_name['submitWarrants'].message_type = warrants__pb2._WARRANTLIST
+_ADMINISTRATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ADMINISTRATIONENVELOPE.fields_by_name['submitProperties'])
+_ADMINISTRATIONENVELOPE.fields_by_name['submitProperties'].containing_oneof = _ADMINISTRATIONENVELOPE.oneofs_by_name['Action']
+_ADMINISTRATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ADMINISTRATIONENVELOPE.fields_by_name['submitPolicy'])
+_ADMINISTRATIONENVELOPE.fields_by_name['submitPolicy'].containing_oneof = _ADMINISTRATIONENVELOPE.oneofs_by_name['Action']
+_ADMINISTRATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ADMINISTRATIONENVELOPE.fields_by_name['submitSystemConfig'])
+_ADMINISTRATIONENVELOPE.fields_by_name['submitSystemConfig'].containing_oneof = _ADMINISTRATIONENVELOPE.oneofs_by_name['Action']
+_ADMINISTRATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ADMINISTRATIONENVELOPE.fields_by_name['submitDevices'])
+_ADMINISTRATIONENVELOPE.fields_by_name['submitDevices'].containing_oneof = _ADMINISTRATIONENVELOPE.oneofs_by_name['Action']
+_ADMINISTRATIONENVELOPE.oneofs_by_name['Action'].fields.append(
+  _ADMINISTRATIONENVELOPE.fields_by_name['submitWarrants'])
+_ADMINISTRATIONENVELOPE.fields_by_name['submitWarrants'].containing_oneof = _ADMINISTRATIONENVELOPE.oneofs_by_name['Action']
+DESCRIPTOR.message_types_by_name['AttestationEnvelope'] = _ATTESTATIONENVELOPE
+DESCRIPTOR.message_types_by_name['AdministrationEnvelope'] = _ADMINISTRATIONENVELOPE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+AttestationEnvelope = _reflection.GeneratedProtocolMessageType('AttestationEnvelope', (_message.Message,), dict(
+  DESCRIPTOR = _ATTESTATIONENVELOPE,
+  __module__ = 'transaction_envelope_pb2'
+  # @@protoc_insertion_point(class_scope:AttestationEnvelope)
+  ))
+_sym_db.RegisterMessage(AttestationEnvelope)
+
+AdministrationEnvelope = _reflection.GeneratedProtocolMessageType('AdministrationEnvelope', (_message.Message,), dict(
+  DESCRIPTOR = _ADMINISTRATIONENVELOPE,
+  __module__ = 'transaction_envelope_pb2'
+  # @@protoc_insertion_point(class_scope:AdministrationEnvelope)
+  ))
+_sym_db.RegisterMessage(AdministrationEnvelope)
+
+
+# @@protoc_insertion_point(module_scope)
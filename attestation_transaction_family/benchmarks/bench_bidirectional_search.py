@@ -0,0 +1,118 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Benchmark of the prover-only against the bidirectional trust path search.
+
+Counts the expanded nodes of graph_search.buildPath on synthetic scale-free
+graphs whose evidences have different ages, so the edges have different
+scores. Both searches must report the same path, whose rating is the
+product of the edge scores along the path.
+'''
+
+import sys
+import time
+import random
+import logging
+import bench_common
+
+import evidence_pb2
+import address_calculator
+import graph_search
+
+SECURITY_PARAMETER = 4
+MIN_RELIABILITY = 0.5
+QUERIES = 200
+# Oldest evidence age in seconds, the DIAT score decays from 600 seconds on and expires after 1200 seconds
+MAX_EVIDENCE_AGE = 900
+
+# Builds evidences of random age for the edges, returns {(verifier, prover): evidence}
+def variedEvidences(edges, seed=6):
+    rng = random.Random(seed)
+    return {edge: bench_common.makeEvidence(edge[0], edge[1], timestamp=bench_common.BLOCK_TIME - rng.randint(0, MAX_EVIDENCE_AGE))
+            for edge in edges}
+
+# Stores the evidences in the prover evidence lists
+def storeEvidences(context, evidences):
+    lists = {}
+    for (verifier, prover), evidence in evidences.items():
+        lists.setdefault(prover, evidence_pb2.EvidenceList()).Evidences.extend([evidence])
+    for prover, evidenceList in lists.items():
+        context.state[address_calculator._assembleAddress(prover)] = evidenceList.SerializeToString()
+
+# Builds a verifier -> prover adjacency source from the edge list
+# evidences maps edges to their evidence, all edges get an evidence of makeEvidence if omitted
+def memoryForwardSource(edges, counter, evidences=None):
+    issued = {}
+    for verifier, prover in edges:
+        evidence = evidences[(verifier, prover)] if evidences is not None else bench_common.makeEvidence(verifier, prover)
+        issued.setdefault(verifier, evidence_pb2.EvidenceList()).Evidences.extend([evidence])
+
+    def forwardSource(context, nodes):
+        counter[0] += len(nodes)
+        return {node: issued.get(node, []) for node in nodes}
+    return forwardSource
+
+# Checks that the path consists of existing edges and returns the product of their scores from the prover side
+def pathRating(context, evidences, proverID, verifierID, path):
+    nodes = path.split(',') + [verifierID]
+    assert nodes[0] == proverID
+    rating = 1
+    for prover, verifier in zip(nodes, nodes[1:]):
+        assert (verifier, prover) in evidences, 'Path uses a missing edge'
+        rating *= float(graph_search.trust_query.scoreEvidenceList(
+            context, evidence_pb2.EvidenceList(Evidences=[evidences[(verifier, prover)]]))[0])
+    return rating
+
+def run(nodeCount, edgesPerNode):
+    edges = bench_common.scaleFreeEdges(nodeCount, edgesPerNode)
+    evidences = variedEvidences(edges)
+    context = bench_common.MemoryContext()
+    bench_common.loadAdministrationState(context, SECURITY_PARAMETER)
+    storeEvidences(context, evidences)
+
+    forwardExpanded = [0]
+    forwardSource = memoryForwardSource(edges, forwardExpanded, evidences)
+    totals = {'prover-only': [0, 0.0], 'bidirectional': [0, 0.0]}
+    found = 0
+    for trustor, trustee in bench_common.samplePairs(edges, QUERIES):
+        context.resetCounters()
+        start = time.perf_counter()
+        uniFound, uniRating, _, uniPath, _ = graph_search.buildPath(
+            context, trustee, trustor, SECURITY_PARAMETER, MIN_RELIABILITY)
+        totals['prover-only'][1] += time.perf_counter() - start
+        totals['prover-only'][0] += context.addressReads
+
+        context.resetCounters()
+        forwardExpanded[0] = 0
+        start = time.perf_counter()
+        biFound, biRating, _, biPath, _ = graph_search.buildPath(
+            context, trustee, trustor, SECURITY_PARAMETER, MIN_RELIABILITY, forwardSource)
+        totals['bidirectional'][1] += time.perf_counter() - start
+        totals['bidirectional'][0] += context.addressReads + forwardExpanded[0]
+
+        assert uniFound == biFound, 'Searches disagree on {} -> {}'.format(trustor, trustee)
+        if biFound:
+            found += 1
+            assert biPath == uniPath, 'Searches report different paths for {} -> {}'.format(trustor, trustee)
+            assert biRating == uniRating
+            assert abs(biRating - pathRating(context, evidences, trustee, trustor, biPath)) < 1e-12
+
+    print('{} nodes, {} edges, {} queries, {} paths found'.format(nodeCount, len(edges), QUERIES, found))
+    for mode, (expanded, seconds) in totals.items():
+        print('  {:14s} expanded nodes/query: {:8.1f}   ms/query: {:7.2f}'.format(
+            mode, expanded / QUERIES, 1000 * seconds / QUERIES))
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    for nodeCount, edgesPerNode in [(1000, 2), (5000, 3), (20000, 3)]:
+        run(nodeCount, edgesPerNode)
@@ -0,0 +1,82 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Benchmark of device-class trust queries against one query per class member.
+
+The nodes of a synthetic scale-free graph are assigned to device classes.
+For a trustor and a class, the most reliable path to any member is found
+by a search per member and by a single search from all members, both must
+report the same rating.
+'''
+
+import time
+import random
+import logging
+import bench_common
+
+import graph_search
+
+SECURITY_PARAMETER = 4
+MIN_RELIABILITY = 0.5
+QUERIES = 20
+
+def run(nodeCount, edgesPerNode, classCount):
+    edges = bench_common.scaleFreeEdges(nodeCount, edgesPerNode)
+    nodes = sorted({node for edge in edges for node in edge})
+    context = bench_common.MemoryContext()
+    bench_common.loadAdministrationState(context, SECURITY_PARAMETER)
+    bench_common.storeEdges(context, edges)
+
+    rng = random.Random(5)
+    classes = {}
+    for node in nodes:
+        classes.setdefault(rng.randrange(classCount), []).append(node)
+
+    totals = {'per member': [0, 0.0], 'multi-source': [0, 0.0]}
+    found = 0
+    for _ in range(QUERIES):
+        trustor = rng.choice(nodes)
+        members = [member for member in classes[rng.randrange(classCount)] if member != trustor]
+
+        context.resetCounters()
+        start = time.perf_counter()
+        best = 0
+        for member in members:
+            pathFound, finalRating, _, _, _ = graph_search.buildPath(context, member, trustor, SECURITY_PARAMETER, MIN_RELIABILITY)
+            if pathFound:
+                best = max(best, finalRating)
+        totals['per member'][1] += time.perf_counter() - start
+        totals['per member'][0] += context.addressReads
+
+        context.resetCounters()
+        start = time.perf_counter()
+        pathFound, finalRating, _, path, _ = graph_search.buildPathFromAny(context, members, trustor, SECURITY_PARAMETER, MIN_RELIABILITY)
+        totals['multi-source'][1] += time.perf_counter() - start
+        totals['multi-source'][0] += context.addressReads
+
+        assert pathFound == (best > 0), 'Searches disagree for trustor {}'.format(trustor)
+        if pathFound:
+            found += 1
+            assert abs(finalRating - best) < 1e-9
+            assert path.split(',')[0] in members
+
+    print('{} nodes, {} edges, {} classes, {} queries, {} paths found'.format(
+        len(nodes), len(edges), classCount, QUERIES, found))
+    for mode, (reads, seconds) in totals.items():
+        print('  {:13s} node reads/query: {:9.1f}   ms/query: {:8.2f}'.format(
+            mode, reads / QUERIES, 1000 * seconds / QUERIES))
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    for nodeCount, edgesPerNode, classCount in [(1000, 2, 10), (5000, 3, 50)]:
+        run(nodeCount, edgesPerNode, classCount)
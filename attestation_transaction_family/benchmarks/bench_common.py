@@ -0,0 +1,219 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Shared helpers for the attestation processor benchmarks.
+
+The benchmarks run the transaction processor modules against an in-memory
+state instead of a validator, so they can be executed in the processor
+container without a running network:
+    cd attestation_transaction_family/benchmarks && python3 bench_<name>.py
+'''
+
+import os
+import sys
+import csv
+import random
+import hashlib
+from decimal import Decimal
+
+import cbor
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARK_DIR, '..', 'pyprocessor'))
+ADMINISTRATION_DATA = os.path.join(BENCHMARK_DIR, '..', '..', 'administration_transaction_family', 'administration_data')
+
+import block_info_pb2
+import devices_pb2
+import evidence_pb2
+import policies_pb2
+import properties_pb2
+import systemconfig_pb2
+import address_calculator
+import storage_functions
+
+# Timestamp of the simulated latest block
+BLOCK_TIME = 1600000000
+BLOCK_NUMBER = 1000
+
+class StateEntry(object):
+    def __init__(self, address, data):
+        self.address = address
+        self.data = data
+
+class MemoryContext(object):
+    '''
+    In-memory stand-in for the Sawtooth context that counts state accesses.
+    '''
+    def __init__(self):
+        self.state = {}
+        self.events = []
+        self.roundTrips = 0
+        self.addressReads = 0
+        self.writes = 0
+
+    def get_state(self, addresses, timeout=None):
+        self.roundTrips += 1
+        self.addressReads += len(addresses)
+        return [StateEntry(address, self.state[address]) for address in addresses if self.state.get(address)]
+
+    def set_state(self, entries, timeout=None):
+        self.writes += len(entries)
+        self.state.update(entries)
+        return list(entries)
+
+    def delete_state(self, addresses, timeout=None):
+        return [address for address in addresses if self.state.pop(address, None) is not None]
+
+    def add_event(self, event_type, attributes=None, data=None, timeout=None):
+        self.events.append((event_type, attributes))
+
+    def add_receipt_data(self, data, timeout=None):
+        pass
+
+    def resetCounters(self):
+        self.roundTrips = 0
+        self.addressReads = 0
+        self.writes = 0
+
+class AuthorizingContext(MemoryContext):
+    '''
+    Memory context that rejects state accesses outside of the declared addresses, like the validator.
+    '''
+    def __init__(self):
+        super(AuthorizingContext, self).__init__()
+        self.authorize([''], [''])
+
+    def authorize(self, inputs, outputs):
+        self.inputs = inputs
+        self.outputs = outputs
+
+    def _check(self, addresses, declared, access):
+        for address in addresses:
+            if not any(address.startswith(prefix) for prefix in declared):
+                raise AssertionError('Undeclared {} of {}'.format(access, address))
+
+    def get_state(self, addresses, timeout=None):
+        self._check(addresses, self.inputs, 'read')
+        return super(AuthorizingContext, self).get_state(addresses, timeout)
+
+    def set_state(self, entries, timeout=None):
+        self._check(entries, self.outputs, 'write')
+        return super(AuthorizingContext, self).set_state(entries, timeout)
+
+    def delete_state(self, addresses, timeout=None):
+        self._check(addresses, self.outputs, 'write')
+        return super(AuthorizingContext, self).delete_state(addresses, timeout)
+
+class TransactionHeader(object):
+    '''
+    The fields of the Sawtooth transaction header read by the transaction handler.
+    '''
+    def __init__(self, signer_public_key, inputs, outputs):
+        self.signer_public_key = signer_public_key
+        self.inputs = inputs
+        self.outputs = outputs
+
+class TransactionRequest(object):
+    '''
+    Stand-in for the TpProcessRequest of the validator, so that the benchmarks need no Sawtooth protobuf messages.
+    '''
+    def __init__(self, header, payload):
+        self.header = header
+        self.payload = payload
+
+# Applies a transaction in the cbor format of the client through the transaction handler
+# An AuthorizingContext is restricted to the declared addresses for this transaction
+def applyTransaction(handler, context, action, payload, inputs=[''], outputs=['']):
+    if isinstance(context, AuthorizingContext):
+        context.authorize(inputs, outputs)
+    request = TransactionRequest(
+        header=TransactionHeader(signer_public_key='bench', inputs=inputs, outputs=outputs),
+        payload=cbor.dumps({'Action': action, 'Payload': payload}))
+    handler.apply(request, context)
+
+# Loads the attestation properties, the system config and the block info into the state
+def loadAdministrationState(context, securityParameter=4):
+    propertiesList = properties_pb2.PropertiesList()
+    with open(os.path.join(ADMINISTRATION_DATA, 'AttestationPropertiesDB.csv')) as csvfile:
+        for row in csv.DictReader(csvfile):
+            propertiesList.Properties.add(
+                AttestationType=row['AttestationType'],
+                ReliabilityScore=Decimal(row['ReliabilityScore']),
+                TimeFunction=row['TimeFunction'],
+                xmin=Decimal(row['xmin']),
+                xmax=Decimal(row['xmax']))
+    context.state[storage_functions.properties_address] = propertiesList.SerializeToString()
+    context.state[storage_functions.system_config_address] = systemconfig_pb2.Systemconfig(
+        SecurityParameter=securityParameter).SerializeToString()
+    context.state['00b10c01' + 62*'0'] = block_info_pb2.BlockInfoConfig(
+        latest_block=BLOCK_NUMBER).SerializeToString()
+    context.state['00b10c00' + hex(BLOCK_NUMBER)[2:].zfill(62)] = block_info_pb2.BlockInfo(
+        block_num=BLOCK_NUMBER, timestamp=BLOCK_TIME).SerializeToString()
+
+# Registers the nodes as devices of the evidences built by makeEvidence and loads the policies,
+# so that evidence submissions and trust queries pass the validation of the processor
+def loadDevices(context, nodes):
+    policyList = policies_pb2.PolicyList()
+    with open(os.path.join(ADMINISTRATION_DATA, 'PolicyDB.csv')) as csvfile:
+        for row in csv.DictReader(csvfile):
+            policyList.Policies.add(**row)
+    context.state[storage_functions.policy_address] = policyList.SerializeToString()
+    context.state[storage_functions.devices_address] = devices_pb2.DeviceList(Devices=[
+        devices_pb2.Device(DeviceIdentity=node, DeviceClass='Workstation', Version='1.1') for node in nodes]).SerializeToString()
+
+# Generates a directed scale-free graph by preferential attachment
+# Returns a list of (verifier, prover) edges
+def scaleFreeEdges(nodeCount, edgesPerNode, seed=1):
+    rng = random.Random(seed)
+    nodes = ['{:06X}'.format(i) for i in range(nodeCount)]
+    edges = set()
+    targets = list(nodes[:edgesPerNode])
+    repeated = []
+    for node in nodes[edgesPerNode:]:
+        for target in sorted(set(targets)):
+            # Random direction, a device attests its neighbour or is attested by it
+            if rng.random() < 0.5:
+                edges.add((node, target))
+            else:
+                edges.add((target, node))
+        repeated.extend(targets)
+        repeated.extend([node] * edgesPerNode)
+        targets = [rng.choice(repeated) for _ in range(edgesPerNode)]
+    return sorted(edges)
+
+# Builds an evidence for an edge
+def makeEvidence(verifier, prover, attestationType='DIAT', timestamp=BLOCK_TIME):
+    return evidence_pb2.Evidence(
+        VerifierIdentity=verifier,
+        ProverIdentity=prover,
+        AttestationType=attestationType,
+        ProverDeviceClass='Workstation',
+        ProverVersion='1.1',
+        Measurement='65CD9AD691',
+        isWarrantAttestation='false',
+        Timestamp=timestamp)
+
+# Stores the evidences for all edges in the prover evidence lists
+def storeEdges(context, edges, attestationType='DIAT', timestamp=BLOCK_TIME):
+    lists = {}
+    for verifier, prover in edges:
+        lists.setdefault(prover, evidence_pb2.EvidenceList()).Evidences.extend(
+            [makeEvidence(verifier, prover, attestationType, timestamp)])
+    for prover, evidenceList in lists.items():
+        context.state[address_calculator._assembleAddress(prover)] = evidenceList.SerializeToString()
+
+# Samples distinct (trustor, trustee) pairs from the nodes of a graph
+def samplePairs(edges, count, seed=2):
+    rng = random.Random(seed)
+    nodes = sorted({node for edge in edges for node in edge})
+    return [tuple(rng.sample(nodes, 2)) for _ in range(count)]
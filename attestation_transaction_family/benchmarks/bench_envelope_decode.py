@@ -0,0 +1,76 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Microbenchmark of the transaction payload decoding per format.
+
+Typical payloads are wrapped in the cbor map of the earlier clients and in
+the protobuf envelope. The transaction handler decodes both into the action
+and its parsed message, the envelope parses the message together with the
+envelope. Both formats must yield the same action and message. The cost
+depends on whether the cbor and protobuf modules run their C extensions,
+both are reported.
+'''
+
+import timeit
+import logging
+import importlib.util
+import bench_common
+
+import cbor
+from google.protobuf.internal import api_implementation
+import evidence_pb2
+import trust_query_pb2
+import transaction_envelope_pb2
+import attmgr_tp
+
+REPEATS = 5
+
+# Builds the payloads as (action, serialized message)
+def payloads():
+    evidence = bench_common.makeEvidence('0794', '098D')
+    query = trust_query_pb2.TrustQuery(Trustor='0794', Trustee='073B', MinReliability=0.5, ReadOnly=True)
+    evidenceList = evidence_pb2.EvidenceList(Evidences=[bench_common.makeEvidence('FFFFFF', '{:06X}'.format(i)) for i in range(500)])
+    return [('submitEvidence', evidence.SerializeToString()),
+            ('trustQuery', query.SerializeToString()),
+            ('submitEvidenceList', evidenceList.SerializeToString())]
+
+def encode(action, data, envelope):
+    if envelope:
+        message = transaction_envelope_pb2.AttestationEnvelope(Version=attmgr_tp.ENVELOPE_VERSION)
+        getattr(message, action).MergeFromString(data)
+        return message.SerializeToString()
+    return cbor.dumps({'Action': action, 'Payload': data})
+
+# Returns the best time per call in seconds, every repeat runs for at least 0.2 seconds
+def measure(function):
+    number, _ = timeit.Timer(function).autorange()
+    return min(timeit.repeat(function, repeat=REPEATS, number=number)) / number
+
+def run():
+    handler = attmgr_tp.AttestationTransactionHandler('fadc96')
+    cborExtension = importlib.util.find_spec('cbor._cbor') is not None
+    print('cbor C extension: {}, protobuf implementation: {}'.format(cborExtension, api_implementation.Type()))
+    for action, data in payloads():
+        print('{} ({} bytes)'.format(action, len(data)))
+        decoded = []
+        for mode, envelope in [('cbor', False), ('envelope', True)]:
+            payload = encode(action, data, envelope)
+            decoded.append(handler._decode_transaction(payload))
+            total = measure(lambda: handler._decode_transaction(payload))
+            print('  {:8s} payload bytes: {:6d}   unwrap and parse us: {:9.2f}'.format(
+                mode, len(payload), 1e6 * total))
+        assert decoded[0] == decoded[1], 'Formats decode differently for {}'.format(action)
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    run()
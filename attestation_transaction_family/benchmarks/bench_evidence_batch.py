@@ -0,0 +1,72 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Benchmark of bulk evidence ingestion with submitEvidenceList.
+
+A verifier attests all devices of a network, half of them for the first
+time. The evidences are applied through the transaction handler in
+submitEvidenceList batches of different sizes, a batch size of 1 is
+applied as single submitEvidence transactions. All runs must end in the
+same state.
+'''
+
+import time
+import logging
+import bench_common
+
+import evidence_pb2
+import attmgr_tp
+
+DEVICES = 500
+BATCH_SIZES = [1, 10, 100, 500]
+VERIFIER = 'FFFFFF'
+
+# Prepares the state with earlier evidences of the verifier for every second device
+def buildState(provers):
+    context = bench_common.MemoryContext()
+    bench_common.loadAdministrationState(context)
+    bench_common.loadDevices(context, provers + [VERIFIER])
+    handler = attmgr_tp.AttestationTransactionHandler('fadc96')
+    _apply(handler, context, 'submitEvidenceList', evidence_pb2.EvidenceList(
+        Evidences=[bench_common.makeEvidence(VERIFIER, prover) for prover in provers[::2]]).SerializeToString())
+    return handler, context
+
+def _apply(handler, context, action, payload):
+    bench_common.applyTransaction(handler, context, action, payload)
+
+def run():
+    provers = ['{:06X}'.format(i) for i in range(DEVICES)]
+    evidences = [bench_common.makeEvidence(VERIFIER, prover) for prover in provers]
+    print('{} devices attested by one verifier, {} of them for the first time'.format(DEVICES, DEVICES - len(provers[::2])))
+    states = []
+    for batchSize in BATCH_SIZES:
+        handler, context = buildState(provers)
+        context.resetCounters()
+        transactions = 0
+        start = time.perf_counter()
+        for first in range(0, DEVICES, batchSize):
+            batch = evidences[first:first + batchSize]
+            if batchSize == 1:
+                _apply(handler, context, 'submitEvidence', batch[0].SerializeToString())
+            else:
+                _apply(handler, context, 'submitEvidenceList', evidence_pb2.EvidenceList(Evidences=batch).SerializeToString())
+            transactions += 1
+        seconds = time.perf_counter() - start
+        states.append(context.state)
+        print('  batch size {:4d}   transactions: {:4d}   state round trips: {:5d}   address writes: {:5d}   ms: {:8.1f}'.format(
+            batchSize, transactions, context.roundTrips, context.writes, 1000 * seconds))
+    assert all(state == states[0] for state in states), 'Batch sizes end in different states'
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    run()
@@ -0,0 +1,73 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Benchmark of the evidence list size with and without compaction on write.
+
+Every verifier of a prover attests it repeatedly. Without compaction each
+submission is appended to the list of the prover, with compaction the list
+keeps one evidence per verifier and attestation type. Reported are the
+serialized size of a list and the time to parse it, which every trust query
+visiting the prover pays.
+'''
+
+import timeit
+import logging
+import bench_common
+
+import evidence_pb2
+import address_calculator
+import evidence_submission
+
+VERIFIERS = 20
+ATTESTATION_TYPES = ('DIAT', 'TPM')
+ROUNDS = (1, 10, 50)
+ROUND_SECONDS = 60
+PARSE_REPETITIONS = 200
+
+# Submits all rounds of attestations of one prover, appending or compacting
+def submitRounds(context, prover, rounds, compact):
+    address = address_calculator._assembleAddress(prover)
+    appended = evidence_pb2.EvidenceList()
+    for round in range(rounds):
+        for verifier in range(VERIFIERS):
+            for attestationType in ATTESTATION_TYPES:
+                evidence = bench_common.makeEvidence('{:06X}'.format(verifier), prover, attestationType,
+                                                     bench_common.BLOCK_TIME + round * ROUND_SECONDS)
+                if compact:
+                    evidence_submission._storeEvidence(context, evidence, address)
+                else:
+                    appended.Evidences.extend([evidence])
+    if not compact:
+        context.state[address] = appended.SerializeToString()
+    return context.state[address]
+
+# Returns the mean time in microseconds to parse a serialized evidence list
+def parseTime(data):
+    def parse():
+        evidence_pb2.EvidenceList().ParseFromString(data)
+    return timeit.timeit(parse, number=PARSE_REPETITIONS) / PARSE_REPETITIONS * 1e6
+
+def run():
+    print('{} verifiers, {} attestation types per prover'.format(VERIFIERS, len(ATTESTATION_TYPES)))
+    for rounds in ROUNDS:
+        for compact in (False, True):
+            context = bench_common.MemoryContext()
+            data = submitRounds(context, 'FFFFFF', rounds, compact)
+            evidenceList = evidence_pb2.EvidenceList()
+            evidenceList.ParseFromString(data)
+            print('  {:3} rounds {:10}  evidences: {:5}  size: {:7} bytes  parse: {:9.1f} us'.format(
+                rounds, 'compacted' if compact else 'appended', len(evidenceList.Evidences), len(data), parseTime(data)))
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    run()
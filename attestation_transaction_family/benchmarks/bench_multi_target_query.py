@@ -0,0 +1,94 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Benchmark of multi-target trust queries against one query per trustee.
+
+For a trustor and N trustees the paths are established by N searches from
+the trustees, by N searches that share the scored evidences and by a single
+forward search from the trustor. All three must find the same trustees with
+the same ratings.
+'''
+
+import time
+import random
+import logging
+import bench_common
+
+import graph_search
+from bench_bidirectional_search import memoryForwardSource
+
+SECURITY_PARAMETER = 4
+MIN_RELIABILITY = 0.5
+TRUSTORS = 20
+
+def run(nodeCount, edgesPerNode, targetCount):
+    edges = bench_common.scaleFreeEdges(nodeCount, edgesPerNode)
+    nodes = sorted({node for edge in edges for node in edge})
+    context = bench_common.MemoryContext()
+    bench_common.loadAdministrationState(context, SECURITY_PARAMETER)
+    bench_common.storeEdges(context, edges)
+    forwardExpanded = [0]
+    forwardSource = memoryForwardSource(edges, forwardExpanded)
+
+    rng = random.Random(4)
+    totals = {'single': [0, 0.0], 'shared cache': [0, 0.0], 'forward': [0, 0.0]}
+    found = 0
+    for _ in range(TRUSTORS):
+        trustor = rng.choice(nodes)
+        targets = {trustee: MIN_RELIABILITY for trustee in rng.sample(nodes, targetCount) if trustee != trustor}
+
+        context.resetCounters()
+        start = time.perf_counter()
+        single = {}
+        for trustee in targets:
+            pathFound, finalRating, _, path, _ = graph_search.buildPath(context, trustee, trustor, SECURITY_PARAMETER, MIN_RELIABILITY)
+            if pathFound:
+                single[trustee] = finalRating
+        totals['single'][1] += time.perf_counter() - start
+        totals['single'][0] += context.addressReads
+
+        context.resetCounters()
+        start = time.perf_counter()
+        shared = {}
+        evidenceCache = {}
+        for trustee in targets:
+            pathFound, finalRating, _, path, _ = graph_search.buildPath(context, trustee, trustor, SECURITY_PARAMETER, MIN_RELIABILITY, evidenceCache=evidenceCache)
+            if pathFound:
+                shared[trustee] = finalRating
+        totals['shared cache'][1] += time.perf_counter() - start
+        totals['shared cache'][0] += context.addressReads
+
+        context.resetCounters()
+        forwardExpanded[0] = 0
+        start = time.perf_counter()
+        forward = graph_search.buildPathsFromVerifier(context, trustor, targets, SECURITY_PARAMETER, forwardSource)
+        totals['forward'][1] += time.perf_counter() - start
+        totals['forward'][0] += context.addressReads + forwardExpanded[0]
+
+        assert set(single) == set(shared) == set(forward), 'Searches disagree for trustor {}'.format(trustor)
+        for trustee, finalRating in single.items():
+            assert abs(shared[trustee] - finalRating) < 1e-9
+            assert abs(forward[trustee][0] - finalRating) < 1e-9
+        found += len(single)
+
+    print('{} nodes, {} edges, {} trustors with {} trustees, {} paths found'.format(
+        len(nodes), len(edges), TRUSTORS, targetCount, found))
+    for mode, (reads, seconds) in totals.items():
+        print('  {:13s} node reads/query: {:8.1f}   ms/query: {:7.2f}'.format(
+            mode, reads / TRUSTORS, 1000 * seconds / TRUSTORS))
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    for nodeCount, edgesPerNode in [(1000, 2), (5000, 3)]:
+        for targetCount in [1, 20, 50]:
+            run(nodeCount, edgesPerNode, targetCount)
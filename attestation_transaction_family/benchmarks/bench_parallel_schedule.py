@@ -0,0 +1,167 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Throughput benchmark of attestation transactions under the parallel scheduler.
+
+A block of evidence submissions and trust queries is applied through the
+transaction handler, once with the address sets the client declared before
+(block-info outputs, the whole expiry index and the whole namespace for
+trust queries) and once with the precise address sets and read-only trust
+queries. The apply time of every transaction is measured and the block is
+scheduled like by the Sawtooth parallel scheduler: a transaction starts on
+a free worker once all earlier transactions it conflicts with are done, two
+transactions conflict if the outputs of one overlap the inputs or outputs
+of the other. The precise run checks every state access against the
+declared addresses.
+'''
+
+import time
+import heapq
+import random
+import logging
+import bench_common
+
+import trust_query_pb2
+import address_calculator
+import storage_functions
+import attmgr_tp
+
+NODE_COUNT = 2000
+EDGES_PER_NODE = 3
+TRANSACTIONS = 400
+# Shares of trust queries in the benchmarked blocks, the rest are evidence submissions
+QUERY_SHARES = [0.0, 0.5, 0.9]
+MIN_RELIABILITY = 0.5
+WORKERS = [1, 2, 4, 8, 16]
+
+BLOCK_INFO = ['00b10c00', '00b10c01']
+NAMESPACE = address_calculator._hash(address_calculator.FAMILY_NAME.encode('utf-8'))[0:6]
+
+# Address sets of the client before the precise declarations
+def legacyAddresses(context, action, evidence):
+    if action == 'trustQuery':
+        inputs = BLOCK_INFO + [NAMESPACE] + storage_functions.administration_addresses
+        return inputs, BLOCK_INFO + [NAMESPACE]
+    storageAddress = address_calculator._assembleEvidenceStorageAddress(evidence)
+    written = [storageAddress, NAMESPACE + 'e', address_calculator._assembleExpiryCursorAddress()]
+    if storageAddress not in context.state:
+        written.append(address_calculator._assembleManifestAddress(evidence.ProverIdentity))
+        written.append(address_calculator._assembleReverseIndexAddress(evidence.VerifierIdentity))
+    written.append(address_calculator._assembleHotTrustorRegistryAddress())
+    return BLOCK_INFO + written + storage_functions.administration_addresses, BLOCK_INFO + written
+
+# Address sets of the client with precise declarations, trust queries are read-only
+# Submissions declare the prover prefix, the reverse index of the verifier and the expiry index shard
+def preciseAddresses(context, action, evidence):
+    if action == 'trustQuery':
+        return BLOCK_INFO + [NAMESPACE] + storage_functions.administration_addresses, []
+    storageAddress = address_calculator._assembleEvidenceStorageAddress(evidence)
+    outputs = [address_calculator._proverPrefix(evidence.ProverIdentity),
+               address_calculator._assembleReverseIndexAddress(evidence.VerifierIdentity),
+               address_calculator._expiryShardPrefix(address_calculator._expiryShard(storageAddress))]
+    inputs = BLOCK_INFO + [address_calculator._assembleHotTrustorRegistryAddress(), address_calculator._assembleExpiryCursorAddress()]
+    return inputs + storage_functions.administration_addresses + outputs, outputs
+
+# Builds the block: re-attestations of existing edges, new edges and trust queries in random order
+def buildBlock(edges, nodes, queryShare, readOnly, seed=3):
+    rng = random.Random(seed)
+    pairs = iter(bench_common.samplePairs(edges, TRANSACTIONS, seed))
+    block = []
+    for _ in range(TRANSACTIONS):
+        if rng.random() < queryShare:
+            trustor, trustee = next(pairs)
+            block.append(('trustQuery', trust_query_pb2.TrustQuery(
+                Trustor=trustor, Trustee=trustee, MinReliability=MIN_RELIABILITY, ReadOnly=readOnly)))
+        elif rng.random() < 0.5:
+            block.append(('submitEvidence', bench_common.makeEvidence(*rng.choice(edges))))
+        else:
+            block.append(('submitEvidence', bench_common.makeEvidence(*rng.sample(nodes, 2))))
+    return block
+
+# Prepares the state with the graph and an existing expiry index
+def buildState(edges, nodes):
+    context = bench_common.AuthorizingContext()
+    bench_common.loadAdministrationState(context)
+    bench_common.loadDevices(context, nodes)
+    bench_common.storeEdges(context, edges)
+    _apply(context, 'submitEvidence', bench_common.makeEvidence(*edges[0]).SerializeToString(), [''], [''])
+    return context
+
+def _apply(context, action, payload, inputs, outputs):
+    bench_common.applyTransaction(attmgr_tp.AttestationTransactionHandler(NAMESPACE), context, action, payload, inputs, outputs)
+
+# Applies the block in order and returns the apply time and the address sets of every transaction
+def applyBlock(context, block, declare, enforce):
+    # The client declares the addresses against the state before the block
+    declared = [declare(context, action, message) for action, message in block]
+    durations = []
+    for (action, message), (inputs, outputs) in zip(block, declared):
+        start = time.perf_counter()
+        if enforce:
+            _apply(context, action, message.SerializeToString(), inputs, outputs)
+        else:
+            _apply(context, action, message.SerializeToString(), [''], [''])
+        durations.append(time.perf_counter() - start)
+    return durations, declared
+
+def _overlaps(addresses, others):
+    return any(address.startswith(other) or other.startswith(address)
+               for address in addresses for other in others)
+
+# Returns the earlier transactions each transaction has to wait for
+def conflicts(declared):
+    predecessors = []
+    for position, (inputs, outputs) in enumerate(declared):
+        predecessors.append([earlier for earlier, (earlierInputs, earlierOutputs) in enumerate(declared[:position])
+                             if _overlaps(earlierOutputs, inputs + outputs) or _overlaps(outputs, earlierInputs)])
+    return predecessors
+
+# Simulates the parallel scheduler and returns the time until the last transaction is done
+def makespan(durations, predecessors, workers):
+    pending = list(range(len(durations)))
+    done = set()
+    running = []
+    now = 0.0
+    while pending or running:
+        # Start the earliest transactions whose conflicting predecessors are done
+        for position in list(pending):
+            if len(running) >= workers:
+                break
+            if all(earlier in done for earlier in predecessors[position]):
+                heapq.heappush(running, (now + durations[position], position))
+                pending.remove(position)
+        now, position = heapq.heappop(running)
+        done.add(position)
+    return now
+
+def run(queryShare):
+    edges = bench_common.scaleFreeEdges(NODE_COUNT, EDGES_PER_NODE)
+    nodes = sorted({node for edge in edges for node in edge})
+    print('{} nodes, {} edges, {} transactions ({:.0%} trust queries)'.format(
+        len(nodes), len(edges), TRANSACTIONS, queryShare))
+    for mode, declare, readOnly in [('legacy', legacyAddresses, False), ('precise', preciseAddresses, True)]:
+        context = buildState(edges, nodes)
+        durations, declared = applyBlock(context, buildBlock(edges, nodes, queryShare, readOnly), declare, enforce=(mode == 'precise'))
+        predecessors = conflicts(declared)
+        serial = sum(durations)
+        print('  {:8s} conflicting pairs: {:6d}   serial ms: {:8.1f}'.format(
+            mode, sum(len(earlier) for earlier in predecessors), 1000 * serial))
+        for workers in WORKERS:
+            total = makespan(durations, predecessors, workers)
+            print('    {:2d} workers  tx/s: {:8.1f}   speedup: {:5.2f}'.format(
+                workers, TRANSACTIONS / total, serial / total))
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    for queryShare in QUERY_SHARES:
+        run(queryShare)
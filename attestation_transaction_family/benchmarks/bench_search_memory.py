@@ -0,0 +1,75 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Benchmark of the peak memory and allocations of graph_search.buildPath.
+
+Runs trust queries without a reachable trustor on a synthetic scale-free
+graph, so the search explores everything within the SecurityParameter and
+ends with the entry point calculation. The node count can be given as first
+argument, the default yields about one million edges.
+
+Peak memory is measured with tracemalloc and excludes the evidence lists
+already loaded into the in-memory state. Allocations are estimated from the
+generation 0 collections of the garbage collector, which runs one every
+gc.get_threshold()[0] container allocations.
+'''
+
+import gc
+import sys
+import time
+import logging
+import tracemalloc
+import bench_common
+
+import graph_search
+
+NODE_COUNT = 340000
+EDGES_PER_NODE = 3
+SECURITY_PARAMETER = 4
+MIN_RELIABILITY = 0.0
+QUERIES = 2
+
+def run(nodeCount):
+    start = time.perf_counter()
+    edges = bench_common.scaleFreeEdges(nodeCount, EDGES_PER_NODE)
+    context = bench_common.MemoryContext()
+    bench_common.loadAdministrationState(context, SECURITY_PARAMETER)
+    bench_common.storeEdges(context, edges)
+    print('{} nodes, {} edges, state built in {:.1f}s'.format(nodeCount, len(edges), time.perf_counter() - start))
+
+    # Provers with many incoming edges give the largest searches
+    inDegree = {}
+    for verifier, prover in edges:
+        inDegree[prover] = inDegree.get(prover, 0) + 1
+    provers = sorted(inDegree, key=lambda node: (-inDegree[node], node))[:QUERIES]
+
+    for prover in provers:
+        context.resetCounters()
+        gc.collect()
+        collections = gc.get_stats()[0]['collections']
+        tracemalloc.start()
+        start = time.perf_counter()
+        pathFound, finalRating, entryPoint, path, _ = graph_search.buildPath(
+            context, prover, 'unreachable', SECURITY_PARAMETER, MIN_RELIABILITY)
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        allocations = (gc.get_stats()[0]['collections'] - collections) * gc.get_threshold()[0]
+        print('prover {} (in-degree {}): {} addresses read, {:.1f}s, peak {:.1f} MiB, '
+              '~{} container allocations, entry point {} at depth {}'.format(
+                  prover, inDegree[prover], context.addressReads, seconds, peak / 2**20,
+                  allocations, entryPoint, len(path.split(',')) - 1))
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NODE_COUNT)
@@ -50,6 +50,12 @@ KEY_NAME = 'client1'
 # For Docker:
 DEFAULT_URL = 'http://rest-api:8008'
 
+# Provers per migration transaction, the transaction processor accepts at most 100
+MIGRATION_BATCH_SIZE = 100
+
+# Evidences per submitEvidenceList transaction, the transaction processor accepts at most 1024
+EVIDENCE_BATCH_SIZE = 500
+
 # Initialize logger
 LOGGER = logging.getLogger(__name__)
 
@@ -118,7 +124,19 @@ def create_parser(prog_name):
     submitEvidence_subparser.add_argument('isWarrant',
                                 #type=string,
                                 help='Was this measurement part of a warant relationship?')
+    submitEvidence_subparser.add_argument('--hotTrustors',
+                                action='store_true',
+                                help='Update the cached trust paths of hot trustors, conflicts with all other transactions')
                                 
+    submitEvidenceList_subparser = subparsers.add_parser('submitEvidenceList',
+                                           help='submit the attestation evidences of a CSV file in batches',
+                                           parents=[parent_parser])
+    submitEvidenceList_subparser.add_argument('evidenceFile',
+                                help='CSV file with the columns vrfID, prvID, attType, prvDeviceClass, prvVersion, measurement and isWarrant')
+    submitEvidenceList_subparser.add_argument('--hotTrustors',
+                                action='store_true',
+                                help='Update the cached trust paths of hot trustors, conflicts with all other transactions')
+
     trustQuery_subparser = subparsers.add_parser('trustQuery',
                                            help='Query a trust link',
                                            parents=[parent_parser])
@@ -131,6 +149,60 @@ def create_parser(prog_name):
     trustQuery_subparser.add_argument('minReliability',
                                 #type=string,
                                 help='Minimum required reliability')	
+    trustQuery_subparser.add_argument('entryPointCount',
+                                nargs='?',
+                                default='1',
+                                help='Number of ranked entry points reported if no path is found')
+    trustQuery_subparser.add_argument('--readOnly',
+                                action='store_true',
+                                help='Do not write to the state, read-only queries run in parallel')
+    trustQuery_subparser.add_argument('--trusteeClass',
+                                action='store_true',
+                                help='The trustee is a device class, query the most reliable path to any device of the class')
+    trustQueryMulti_subparser = subparsers.add_parser('trustQueryMulti',
+                                           help='Query the trust links to several devices at once',
+                                           parents=[parent_parser])
+    trustQueryMulti_subparser.add_argument('trustor',
+                                help='The device to establish trust')
+    trustQueryMulti_subparser.add_argument('targets',
+                                nargs='+',
+                                help='The devices to be attested with their minimum required reliability, as trustee:minReliability')
+    trustQueryMulti_subparser.add_argument('--readOnly',
+                                action='store_true',
+                                help='Do not write to the state, read-only queries run in parallel')
+    verifyPath_subparser = subparsers.add_parser('verifyPath',
+                                           help='Verify a known trust path with the current evidences',
+                                           parents=[parent_parser])
+    verifyPath_subparser.add_argument('trustor',
+                                help='The device to establish trust')
+    verifyPath_subparser.add_argument('path',
+                                help='The path of a trustpath event, trustee first, comma separated')
+    verifyPath_subparser.add_argument('minReliability',
+                                help='Minimum required reliability')
+    subparsers.add_parser('sweepExpired',
+                                           help='delete expired evidences listed in the expiry index',
+                                           parents=[parent_parser])
+    attestedProvers_subparser = subparsers.add_parser('attestedProvers',
+                                           help='list the provers with stored evidences of a verifier',
+                                           parents=[parent_parser])
+    attestedProvers_subparser.add_argument('vrfID',
+                                #type=string,
+                                help='Identity of the verifier')
+    hotTrustors_subparser = subparsers.add_parser('hotTrustors',
+                                           help='register or unregister trustors whose trust paths are cached',
+                                           parents=[parent_parser])
+    hotTrustors_subparser.add_argument('mode',
+                                #type=string,
+                                help='register - unregister')
+    hotTrustors_subparser.add_argument('trustors',
+                                nargs='+',
+                                help='Identities of the trustors')
+    migrateEvidence_subparser = subparsers.add_parser('migrateEvidence',
+                                           help='move evidence lists of the legacy layout to the edge lists of prover and verifier',
+                                           parents=[parent_parser])
+    migrateEvidence_subparser.add_argument('prvIDs',
+                                nargs='*',
+                                help='Provers to migrate, all provers of the legacy layout if omitted')
     simulation_subparser = subparsers.add_parser('simulation',
                                            help='attestation simulation',
                                            parents=[parent_parser])	
@@ -145,9 +217,21 @@ def submit_evidence(args):
     privkeyfile = _get_private_keyfile(KEY_NAME)
     client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
     encodedEvidence = buildEvidencePayload(args.vrfID, args.prvID, args.attType, args.prvDeviceClass, args.prvVersion, args.measurement, args.isWarrant)
-    response = client.submitEvidence(encodedEvidence, args.prvID)
+    response = client.submitEvidence(encodedEvidence, args.prvID, hotTrustors=args.hotTrustors)
     print("Evidence Submission Result: {}".format(response))
 
+# Command to submit the evidences of a CSV file from the command line
+def submit_evidence_list(args):
+    privkeyfile = _get_private_keyfile(KEY_NAME)
+    client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
+    with open(args.evidenceFile, 'r', newline='') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    # One transaction submits at most EVIDENCE_BATCH_SIZE evidences
+    for start in range(0, len(rows), EVIDENCE_BATCH_SIZE):
+        encodedEvidences = buildEvidenceListPayload(rows[start:start + EVIDENCE_BATCH_SIZE])
+        response = client.submitEvidenceList(encodedEvidences, hotTrustors=args.hotTrustors)
+        print("Evidence List Submission Result: {}".format(response))
+
 # Command to handle an evidence submission as a result to an entrypoint event
 def submit_evidence_direct(vrfID,prvID,attType, prvDeviceClass, prvVersion, measurement,isWarrant):
     '''Subcommand to submit an attestation evicende.  Calls client class to do submission.'''
@@ -162,8 +246,8 @@ def submit_evidence_direct(vrfID,prvID,attType, prvDeviceClass, prvVersion, meas
 def trustQuery(args):
     privkeyfile = _get_private_keyfile(KEY_NAME)
     client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
-    queryBytes = buildTrustQueryPayload(args.trustor, args.trustee, args.minReliability)
-    response = client.submitTrustQuery(queryBytes)
+    queryBytes = buildTrustQueryPayload(args.trustor, args.trustee, args.minReliability, args.entryPointCount, args.readOnly, args.trusteeClass)
+    response = client.submitTrustQuery(queryBytes, readOnly=args.readOnly)
     print("Trust Query Result: {}".format(response))
 
 # Command to handle a trust query from the simulation environment
@@ -174,6 +258,53 @@ def trustQueryDirect(trustor, trustee, minReliability):
     response = client.submitTrustQuery(queryBytes)
     print("Trust Query Result: {}".format(response))
 
+# Command to handle a trust query for several trustees from the command line
+def trustQueryMulti(args):
+    privkeyfile = _get_private_keyfile(KEY_NAME)
+    client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
+    targets = [target.split(':') for target in args.targets]
+    queryBytes = buildTrustQueryMultiPayload(args.trustor, targets, args.readOnly)
+    response = client.submitTrustQuery(queryBytes, readOnly=args.readOnly, action="trustQueryMulti")
+    print("Trust Query Result: {}".format(response))
+
+# Command to verify a trust path from the command line
+def verifyPath(args):
+    privkeyfile = _get_private_keyfile(KEY_NAME)
+    client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
+    verificationBytes = buildPathVerificationPayload(args.trustor, args.path, args.minReliability)
+    response = client.verifyPath(verificationBytes, args.trustor, args.path.split(','))
+    print("Path Verification Result: {}".format(response))
+
+# Command to delete expired evidences, can be submitted periodically
+def sweepExpired(args):
+    privkeyfile = _get_private_keyfile(KEY_NAME)
+    client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
+    response = client.sweepExpired()
+    print("Expiry Sweep Result: {}".format(response))
+
+# Command to list the provers a verifier has attested, read from the reverse index
+def attestedProvers(args):
+    privkeyfile = _get_private_keyfile(KEY_NAME)
+    client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
+    print("Attested Provers: {}".format(' '.join(client.listAttestedProvers(args.vrfID))))
+
+# Command to register or unregister hot trustors
+def hotTrustors(args):
+    privkeyfile = _get_private_keyfile(KEY_NAME)
+    client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
+    response = client.registerHotTrustors(args.trustors, register=(args.mode != 'unregister'))
+    print("Hot Trustor Registration Result: {}".format(response))
+
+# Command to migrate the evidence lists of the legacy layout
+def migrateEvidence(args):
+    privkeyfile = _get_private_keyfile(KEY_NAME)
+    client = AttestationManagerClient(base_url=DEFAULT_URL, key_file=privkeyfile)
+    provers = args.prvIDs or client.listProvers()
+    # One transaction migrates at most MIGRATION_BATCH_SIZE provers
+    for start in range(0, len(provers), MIGRATION_BATCH_SIZE):
+        response = client.migrateEvidence(provers[start:start + MIGRATION_BATCH_SIZE])
+        print("Evidence Migration Result: {}".format(response))
+
 # Builder method for the evidence object (protobuf)
 def buildEvidencePayload(vrfID,prvID,attType, prvDeviceClass, prvVersion, measurement,isWarrant):
     encodedEvidence = evidence_pb2.Evidence(
@@ -189,15 +320,48 @@ def buildEvidencePayload(vrfID,prvID,attType, prvDeviceClass, prvVersion, measur
     ).SerializeToString()
     return encodedEvidence
 
+# Builder method for the evidence list object (protobuf)
+# rows are dicts with the arguments of buildEvidencePayload
+def buildEvidenceListPayload(rows):
+    encodedEvidences = evidence_pb2.EvidenceList(
+        Evidences = [evidence_pb2.Evidence.FromString(buildEvidencePayload(row['vrfID'], row['prvID'], row['attType'], row['prvDeviceClass'], row['prvVersion'], row['measurement'], row['isWarrant']))
+                     for row in rows]
+    ).SerializeToString()
+    return encodedEvidences
+
 # Builder method for the trust query object (protobuf)
-def buildTrustQueryPayload(trustor, trustee, minReliability):
+# With trusteeClass set, trustee is a device class
+def buildTrustQueryPayload(trustor, trustee, minReliability, entryPointCount=1, readOnly=False, trusteeClass=False):
     trustQuery = trust_query_pb2.TrustQuery(
         Trustor = trustor,
-        Trustee = trustee,
-        MinReliability = Decimal(minReliability)
+        Trustee = '' if trusteeClass else trustee,
+        TrusteeClass = trustee if trusteeClass else '',
+        MinReliability = Decimal(minReliability),
+        EntryPointCount = int(entryPointCount),
+        ReadOnly = readOnly
     ).SerializeToString()
     return trustQuery
 
+# Builder method for the multi-target trust query object (protobuf)
+# targets is a list of [trustee, minReliability]
+def buildTrustQueryMultiPayload(trustor, targets, readOnly=False):
+    trustQuery = trust_query_pb2.TrustQueryMulti(
+        Trustor = trustor,
+        Targets = [trust_query_pb2.TrustTarget(Trustee = trustee, MinReliability = Decimal(minReliability))
+                   for trustee, minReliability in targets],
+        ReadOnly = readOnly
+    ).SerializeToString()
+    return trustQuery
+
+# Builder method for the path verification object (protobuf)
+def buildPathVerificationPayload(trustor, path, minReliability):
+    pathVerification = trust_query_pb2.PathVerification(
+        Trustor = trustor,
+        Path = path,
+        MinReliability = Decimal(minReliability)
+    ).SerializeToString()
+    return pathVerification
+
 # Simulation functionality to simulate trust queries and evidence submissions
 def simulation(args):
     privkeyfile = _get_private_keyfile(KEY_NAME)
@@ -318,8 +482,22 @@ def main(prog_name=os.path.basename(sys.argv[0]), args=None):
         # Get the commands from cli args and call corresponding handlers
         if args.command == 'submitEvidence':
             submit_evidence(args)
+        elif args.command == 'submitEvidenceList':
+            submit_evidence_list(args)
         elif args.command == 'trustQuery':
             trustQuery(args)
+        elif args.command == 'trustQueryMulti':
+            trustQueryMulti(args)
+        elif args.command == 'verifyPath':
+            verifyPath(args)
+        elif args.command == 'sweepExpired':
+            sweepExpired(args)
+        elif args.command == 'attestedProvers':
+            attestedProvers(args)
+        elif args.command == 'hotTrustors':
+            hotTrustors(args)
+        elif args.command == 'migrateEvidence':
+            migrateEvidence(args)
         elif args.command == 'simulation':
             simulation(args)
         else:
@@ -30,13 +30,16 @@ import random
 import time
 import requests
 import yaml
-import cbor
 import logging
+import collections
 
 
 from threading import Thread
 
 from sawtooth_sdk.protobuf import events_pb2
+import evidence_pb2
+import cbor
+import transaction_envelope_pb2
 from sawtooth_signing import create_context
 from sawtooth_signing import CryptoFactory
 from sawtooth_signing import ParseError
@@ -53,6 +56,12 @@ LOGGER = logging.getLogger(__name__)
 FAMILY_NAME = 'attestation'
 # TF Prefix is first 6 characters of SHA-512("attestation"), FADC96
 
+# Version of the transaction envelope, the transaction processor also accepts the earlier cbor payloads
+ENVELOPE_VERSION = 1
+# Payloads are sent as cbor maps unless the client is created with envelope=True, the envelope
+# only decodes faster than cbor with a compiled protobuf backend in the transaction processor
+DEFAULT_ENVELOPE = False
+
 # Hashing helper method
 def _hash(data):
     return hashlib.sha512(data).hexdigest()
@@ -62,17 +71,63 @@ def _assembleAddress(public_key):
     return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + \
              _hash(public_key.encode('utf-8'))[0:64]
 
+# Prefix of all evidence addresses of a prover in the sharded layout (version 01)
+def _proverPrefix(prover):
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '01' + \
+             _hash(prover.encode('utf-8'))[0:30]
+
+# Address of the manifest that lists the verifiers of a prover
+def _assembleManifestAddress(prover):
+    return _proverPrefix(prover) + '0' * 32
+
+# Address of the evidences of one verifier for one prover
+def _assembleEdgeAddress(prover, verifier):
+    return _proverPrefix(prover) + _hash(verifier.encode('utf-8'))[0:32]
+
+# Prefix of the reverse indexes of all verifiers
+def _reverseIndexPrefix():
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '02'
+
+# Address of the reverse index that lists the provers attested by a verifier
+def _assembleReverseIndexAddress(verifier):
+    return _reverseIndexPrefix() + _hash(verifier.encode('utf-8'))[0:62]
+
+# Address of the registry of hot trustors
+def _hotTrustorRegistryAddress():
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '04' + '0' * 62
+
+# Number of shards of the expiry index
+EXPIRY_INDEX_SHARDS = 16
+
+# Prefix of the sharded expiry index
+def _shardedExpiryIndexPrefix():
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + 'e2'
+
+# Prefix of all expiry index buckets of one shard
+def _expiryShardPrefix(shard):
+    return _shardedExpiryIndexPrefix() + '{:02x}'.format(shard)
+
+# Prefix of the expiry index shard a storage address is added to
+def _expiryShardPrefixOf(address):
+    return _expiryShardPrefix(int(address[-2:], 16) % EXPIRY_INDEX_SHARDS)
+
+# Address of the expiry sweep cursor
+def _expiryCursorAddress():
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + 'e1' + '0' * 62
+
 class AttestationManagerClient(object):
     '''
     Client Attestation Manager class handles the the submission of transactions
-    Supports "submitEvidence" and "trustQuery" functions.
+    Supports "submitEvidence", "submitEvidenceList", "trustQuery", "trustQueryMulti", "verifyPath", "sweepExpired",
+    "migrateEvidence", "registerHotTrustors" and "unregisterHotTrustors" functions.
     '''
 
-    def __init__(self, base_url, key_file=None):
+    def __init__(self, base_url, key_file=None, envelope=DEFAULT_ENVELOPE):
         '''Initialize the client class 
            Mainly getting the key pair and computing the address.
         '''
         self._base_url = base_url
+        self._envelope = envelope
 
         if key_file is None:
             self._signer = None
@@ -108,27 +163,64 @@ class AttestationManagerClient(object):
     # 2. Create a transaction and a batch
     # 2. Send to REST API
     
-    def submitEvidence(self, evidence, storageKey):
-        '''Submit Attestation Evidence to validator.'''
+    def submitEvidence(self, evidence, storageKey, hotTrustors=False):
+        '''Submit Attestation Evidence to validator, hotTrustors updates the caches of hot trustors.'''
         # Access to administrative databases must be defined
         administrationAddresses = ['5a752685e4842d73555848afa198ee40c32e19a400d2fd1a59fdad8c7b57d25b78757c','5a7526b8d9d9581e82c7c8ec2cb2614bd8da7334cc1335838dd7ad275b9093dbb0a122','5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca','5a75264f03016f8dfef256580a4c6fdeeb5aa0ca8b4068e816a677e908c95b3bdd2150','5a752639c6f558e7151b5f83e4c1763d427cd0fef5192d2c86ea3db7c5bc1f1546f9ba']
-        storageAddress = _assembleAddress(storageKey)
+        verifier = evidence_pb2.Evidence.FromString(evidence).VerifierIdentity
+        storageAddress = _assembleEdgeAddress(storageKey, verifier)
         LOGGER.info('Storage Address %s.',
                 storageAddress)
-        # Allow access to block-info data and the administration transaction family namespace
-        input_address_list = ['00b10c00', '00b10c01', storageAddress]
+        # The outputs do not depend on the state, which can change before the transaction is applied:
+        # the edge lists and manifest of the prover, the reverse index of the verifier
+        # and the expiry index shard of the storage address
+        # Submissions for different provers and expiry index shards run in parallel
+        output_address_list = [_proverPrefix(storageKey), _assembleReverseIndexAddress(verifier),
+                               _expiryShardPrefixOf(storageAddress)]
+        output_address_list = self._hotTrustorOutputs(output_address_list, hotTrustors)
+        # Block-info data, the administration databases, the hot trustor registry and the
+        # sweep cursor are only read
+        input_address_list = ['00b10c00', '00b10c01', _hotTrustorRegistryAddress(), _expiryCursorAddress()]
         input_address_list.extend(administrationAddresses)
-        output_address_list = ['00b10c00', '00b10c01', storageAddress]
+        input_address_list.extend(output_address_list)
         return self._wrap_and_send("submitEvidence", evidence, input_address_list, output_address_list, wait=10)
 
-    def submitTrustQuery(self, payload):
-        '''Submit a Trust Query to validator.'''
+    def submitEvidenceList(self, evidences, hotTrustors=False):
+        '''Submit a list of Attestation Evidences to validator in one transaction.'''
+        # Access to administrative databases must be defined
+        administrationAddresses = ['5a752685e4842d73555848afa198ee40c32e19a400d2fd1a59fdad8c7b57d25b78757c','5a7526b8d9d9581e82c7c8ec2cb2614bd8da7334cc1335838dd7ad275b9093dbb0a122','5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca','5a75264f03016f8dfef256580a4c6fdeeb5aa0ca8b4068e816a677e908c95b3bdd2150','5a752639c6f558e7151b5f83e4c1763d427cd0fef5192d2c86ea3db7c5bc1f1546f9ba']
+        evidenceList = evidence_pb2.EvidenceList.FromString(evidences)
+        # Same outputs as for single submissions, for every evidence of the list
+        output_address_list = []
+        for evidence in evidenceList.Evidences:
+            storageAddress = _assembleEdgeAddress(evidence.ProverIdentity, evidence.VerifierIdentity)
+            output_address_list.extend([_proverPrefix(evidence.ProverIdentity), _assembleReverseIndexAddress(evidence.VerifierIdentity),
+                                        _expiryShardPrefixOf(storageAddress)])
+        output_address_list = list(collections.OrderedDict.fromkeys(output_address_list))
+        output_address_list = self._hotTrustorOutputs(output_address_list, hotTrustors)
+        input_address_list = ['00b10c00', '00b10c01', _hotTrustorRegistryAddress(), _expiryCursorAddress()]
+        input_address_list.extend(administrationAddresses)
+        input_address_list.extend(output_address_list)
+        return self._wrap_and_send("submitEvidenceList", evidences, input_address_list, output_address_list, wait=10)
+
+    def _hotTrustorOutputs(self, output_address_list, hotTrustors):
+        '''Return the outputs of a submission, widened to the namespace to update the caches of hot trustors.'''
+        # Propagating a new edge into the cached trust paths can touch any address of the namespace,
+        # without it the submission marks the cached paths as stale and trust queries fall back to the graph search
+        if hotTrustors:
+            return [_hash(FAMILY_NAME.encode('utf-8'))[0:6]]
+        return output_address_list
+
+    def submitTrustQuery(self, payload, readOnly=False, action="trustQuery"):
+        '''Submit a Trust Query to validator, action "trustQueryMulti" for a multi-target query.'''
         # Access to administrative databases must be defined
         administrationAddresses = ['5a752685e4842d73555848afa198ee40c32e19a400d2fd1a59fdad8c7b57d25b78757c','5a7526b8d9d9581e82c7c8ec2cb2614bd8da7334cc1335838dd7ad275b9093dbb0a122','5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca','5a75264f03016f8dfef256580a4c6fdeeb5aa0ca8b4068e816a677e908c95b3bdd2150','5a752639c6f558e7151b5f83e4c1763d427cd0fef5192d2c86ea3db7c5bc1f1546f9ba']
         # Allow access to block-info data and the administration transaction family namespace
         input_address_list = ['00b10c00', '00b10c01', 'fadc96']
         input_address_list.extend(administrationAddresses)
-        output_address_list = ['00b10c00', '00b10c01', 'fadc96']
+        # A read-only query (ReadOnly set in the payload) writes nothing and does not conflict with other queries,
+        # otherwise the deletion of expired evidences and the memo can write to the whole namespace
+        output_address_list = [] if readOnly else ['fadc96']
         '''
         # Functionality for automatic trust query handling of client simulation.
         # Multithreading so that clients are able to submit transactions and listen for events at the same time
@@ -145,10 +237,90 @@ class AttestationManagerClient(object):
         LOGGER.info('Sending TrustQuery...')
         #result = start_new_thread(self._wrap_and_send("trustQuery", payload, input_address_list, output_address_list, wait=10))
         '''
-        result = self._wrap_and_send("trustQuery", payload, input_address_list, output_address_list, wait=10)  
+        result = self._wrap_and_send(action, payload, input_address_list, output_address_list, wait=10)  
                                 
         return result
 
+    def verifyPath(self, payload, trustor, path):
+        '''Submit the verification of a known trust path to validator.'''
+        # Access to administrative databases must be defined
+        administrationAddresses = ['5a752685e4842d73555848afa198ee40c32e19a400d2fd1a59fdad8c7b57d25b78757c','5a7526b8d9d9581e82c7c8ec2cb2614bd8da7334cc1335838dd7ad275b9093dbb0a122','5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca','5a75264f03016f8dfef256580a4c6fdeeb5aa0ca8b4068e816a677e908c95b3bdd2150','5a752639c6f558e7151b5f83e4c1763d427cd0fef5192d2c86ea3db7c5bc1f1546f9ba']
+        # Only the evidences of the hops are read, in the edge and the legacy layout, nothing is written
+        nodes = path + [trustor]
+        input_address_list = ['00b10c00', '00b10c01']
+        input_address_list.extend(administrationAddresses)
+        for prover, verifier in zip(nodes[:-1], nodes[1:]):
+            input_address_list.extend([_assembleAddress(prover), _assembleEdgeAddress(prover, verifier)])
+        return self._wrap_and_send("verifyPath", payload, input_address_list, [], wait=10)
+
+    def sweepExpired(self):
+        '''Submit an expiry sweep to validator.'''
+        # Access to the system config must be defined
+        systemConfigAddress = '5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca'
+        # The swept storage addresses are only known from the expiry index
+        input_address_list = ['00b10c00', '00b10c01', 'fadc96', systemConfigAddress]
+        output_address_list = ['fadc96']
+        return self._wrap_and_send("sweepExpired", b'', input_address_list, output_address_list, wait=10)
+
+    def registerHotTrustors(self, trustors, register=True):
+        '''Submit the registration of hot trustors with cached trust paths to validator.'''
+        # Access to administrative databases must be defined
+        administrationAddresses = ['5a752685e4842d73555848afa198ee40c32e19a400d2fd1a59fdad8c7b57d25b78757c','5a7526b8d9d9581e82c7c8ec2cb2614bd8da7334cc1335838dd7ad275b9093dbb0a122','5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca','5a75264f03016f8dfef256580a4c6fdeeb5aa0ca8b4068e816a677e908c95b3bdd2150','5a752639c6f558e7151b5f83e4c1763d427cd0fef5192d2c86ea3db7c5bc1f1546f9ba']
+        payload = evidence_pb2.IdentityList(Identities=trustors).SerializeToString()
+        # Seeding the cache follows trust paths through the whole namespace
+        input_address_list = ['00b10c00', '00b10c01', 'fadc96']
+        input_address_list.extend(administrationAddresses)
+        output_address_list = ['fadc96']
+        action = "registerHotTrustors" if register else "unregisterHotTrustors"
+        return self._wrap_and_send(action, payload, input_address_list, output_address_list, wait=10)
+
+    def migrateEvidence(self, provers):
+        '''Submit the migration of the legacy evidence lists of provers to validator.'''
+        # Access to administrative databases must be defined
+        administrationAddresses = ['5a752685e4842d73555848afa198ee40c32e19a400d2fd1a59fdad8c7b57d25b78757c','5a7526b8d9d9581e82c7c8ec2cb2614bd8da7334cc1335838dd7ad275b9093dbb0a122','5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca','5a75264f03016f8dfef256580a4c6fdeeb5aa0ca8b4068e816a677e908c95b3bdd2150','5a752639c6f558e7151b5f83e4c1763d427cd0fef5192d2c86ea3db7c5bc1f1546f9ba']
+        payload = evidence_pb2.IdentityList(Identities=provers).SerializeToString()
+        # The legacy lists are moved to the edge lists and manifests below the prover prefixes,
+        # their verifiers are only known from the lists, so all reverse indexes must be accessible
+        # Moved evidences are added to the expiry index again
+        output_address_list = [_assembleAddress(prover) for prover in provers]
+        output_address_list.extend(_proverPrefix(prover) for prover in provers)
+        output_address_list.extend([_reverseIndexPrefix(), _shardedExpiryIndexPrefix(), _expiryCursorAddress()])
+        # The expiry of legacy evidences without one is set from their attestation properties
+        input_address_list = list(administrationAddresses)
+        input_address_list.extend(output_address_list)
+        return self._wrap_and_send("migrateEvidence", payload, input_address_list, output_address_list, wait=10)
+
+    def listAttestedProvers(self, verifier):
+        '''Return the identities of the provers with stored evidences of a verifier.'''
+        try:
+            result = yaml.safe_load(self._send_to_rest_api("state/{}".format(_assembleReverseIndexAddress(verifier))))
+        except Exception:
+            # The verifier has not attested any prover
+            return []
+        return list(evidence_pb2.IdentityList.FromString(base64.b64decode(result['data'])).Identities)
+
+    def listProvers(self):
+        '''Return the identities of all provers with evidences in the legacy layout.'''
+        provers = []
+        suffix = "state?address={}".format(_hash(FAMILY_NAME.encode('utf-8'))[0:6])
+        while suffix is not None:
+            result = yaml.safe_load(self._send_to_rest_api(suffix))
+            for entry in result['data']:
+                evidenceList = evidence_pb2.EvidenceList()
+                try:
+                    evidenceList.ParseFromString(base64.b64decode(entry['data']))
+                except:
+                    # Entries of the expiry index and manifests
+                    continue
+                if evidenceList.Evidences and (_assembleAddress(evidenceList.Evidences[0].ProverIdentity) == entry['address']):
+                    provers.append(evidenceList.Evidences[0].ProverIdentity)
+            nextPosition = result.get('paging', {}).get('next_position')
+            if nextPosition:
+                suffix = "state?address={}&start={}".format(_hash(FAMILY_NAME.encode('utf-8'))[0:6], nextPosition)
+            else:
+                suffix = None
+        return provers
+
     def _send_to_rest_api(self, suffix, data=None, content_type=None):
         '''Send a REST command to the Validator via the REST API.
 
@@ -207,15 +379,18 @@ class AttestationManagerClient(object):
            Even single transactions must be wrapped into a batch.
            Called by submitEvidence and submitTrustQuery.
         '''
-        # Assemble an action and the actual payload in a dictionary
+        # Assemble an action and the actual payload in the versioned envelope or a cbor map
         LOGGER.info('Payload Debug %s.',
                 data)
-        transactionDictionary = {
-            'Action': action,
-            'Payload': data
-        }
-
-        payload = cbor.dumps(transactionDictionary)
+        if self._envelope:
+            envelope = transaction_envelope_pb2.AttestationEnvelope(Version=ENVELOPE_VERSION)
+            if envelope.DESCRIPTOR.fields_by_name[action].message_type is None:
+                setattr(envelope, action, data)
+            else:
+                getattr(envelope, action).MergeFromString(data)
+            payload = envelope.SerializeToString()
+        else:
+            payload = cbor.dumps({'Action': action, 'Payload': data})
 
         # Create a TransactionHeader.
         header = TransactionHeader(
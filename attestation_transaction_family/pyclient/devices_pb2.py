@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: devices.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='devices.proto',
+  package='',
+  syntax='proto3',
+  serialized_options=None,
+  serialized_pb=_b('\n\rdevices.proto\"F\n\x06\x44\x65vice\x12\x16\n\x0e\x44\x65viceIdentity\x18\x01 \x01(\t\x12\x13\n\x0b\x44\x65viceClass\x18\x02 \x01(\t\x12\x0f\n\x07Version\x18\x03 \x01(\t\"&\n\nDeviceList\x12\x18\n\x07\x44\x65vices\x18\x01 \x03(\x0b\x32\x07.Deviceb\x06proto3')
+)
+
+
+
+
+_DEVICE = _descriptor.Descriptor(
+  name='Device',
+  full_name='Device',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='DeviceIdentity', full_name='Device.DeviceIdentity', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='DeviceClass', full_name='Device.DeviceClass', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Version', full_name='Device.Version', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=17,
+  serialized_end=87,
+)
+
+
+_DEVICELIST = _descriptor.Descriptor(
+  name='DeviceList',
+  full_name='DeviceList',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Devices', full_name='DeviceList.Devices', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=89,
+  serialized_end=127,
+)
+
+_DEVICELIST.fields_by_name['Devices'].message_type = _DEVICE
+DESCRIPTOR.message_types_by_name['Device'] = _DEVICE
+DESCRIPTOR.message_types_by_name['DeviceList'] = _DEVICELIST
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Device = _reflection.GeneratedProtocolMessageType('Device', (_message.Message,), dict(
+  DESCRIPTOR = _DEVICE,
+  __module__ = 'devices_pb2'
+  # @@protoc_insertion_point(class_scope:Device)
+  ))
+_sym_db.RegisterMessage(Device)
+
+DeviceList = _reflection.GeneratedProtocolMessageType('DeviceList', (_message.Message,), dict(
+  DESCRIPTOR = _DEVICELIST,
+  __module__ = 'devices_pb2'
+  # @@protoc_insertion_point(class_scope:DeviceList)
+  ))
+_sym_db.RegisterMessage(DeviceList)
+
+
+# @@protoc_insertion_point(module_scope)
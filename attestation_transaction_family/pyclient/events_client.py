@@ -88,6 +88,19 @@ def listen_to_events():
         print("Received the following events: ----------")
         for event in event_list.events:
             print(event)
+            if (event.event_type == "attestation/entrypoint"):
+                for attribute in event.attributes:
+                    if attribute.key == "entryPoints":
+                        for rank, (entryPoint, rating, path) in enumerate(parseEntryPoints(attribute.value), 1):
+                            print("Entry point {}: {} with rating {} over path {}".format(rank, entryPoint, rating, path))
+
+# Decodes the ranked entry points of an entrypoint event into [entryPoint, rating, path] entries, best first
+def parseEntryPoints(value):
+    entryPoints = []
+    for entry in value.split(';') if value else []:
+        entryPoint, rating, path = entry.split(':', 2)
+        entryPoints.append([entryPoint, float(rating), path])
+    return entryPoints
 
 # Unsubscription method
 def unsubscribe_from_events():
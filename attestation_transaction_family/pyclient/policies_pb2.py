@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: policies.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='policies.proto',
+  package='',
+  syntax='proto3',
+  serialized_options=None,
+  serialized_pb=_b('\n\x0epolicies.proto\"m\n\x06Policy\x12\x13\n\x0b\x44\x65viceClass\x18\x01 \x01(\t\x12\x17\n\x0f\x41ttestationType\x18\x02 \x01(\t\x12\x0f\n\x07Version\x18\x03 \x01(\t\x12\x0f\n\x07Warrant\x18\x04 \x01(\t\x12\x13\n\x0bMeasurement\x18\x05 \x01(\t\"\'\n\nPolicyList\x12\x19\n\x08Policies\x18\x01 \x03(\x0b\x32\x07.Policyb\x06proto3')
+)
+
+
+
+
+_POLICY = _descriptor.Descriptor(
+  name='Policy',
+  full_name='Policy',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='DeviceClass', full_name='Policy.DeviceClass', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='AttestationType', full_name='Policy.AttestationType', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Version', full_name='Policy.Version', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Warrant', full_name='Policy.Warrant', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Measurement', full_name='Policy.Measurement', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=18,
+  serialized_end=127,
+)
+
+
+_POLICYLIST = _descriptor.Descriptor(
+  name='PolicyList',
+  full_name='PolicyList',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Policies', full_name='PolicyList.Policies', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=129,
+  serialized_end=168,
+)
+
+_POLICYLIST.fields_by_name['Policies'].message_type = _POLICY
+DESCRIPTOR.message_types_by_name['Policy'] = _POLICY
+DESCRIPTOR.message_types_by_name['PolicyList'] = _POLICYLIST
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Policy = _reflection.GeneratedProtocolMessageType('Policy', (_message.Message,), dict(
+  DESCRIPTOR = _POLICY,
+  __module__ = 'policies_pb2'
+  # @@protoc_insertion_point(class_scope:Policy)
+  ))
+_sym_db.RegisterMessage(Policy)
+
+PolicyList = _reflection.GeneratedProtocolMessageType('PolicyList', (_message.Message,), dict(
+  DESCRIPTOR = _POLICYLIST,
+  __module__ = 'policies_pb2'
+  # @@protoc_insertion_point(class_scope:PolicyList)
+  ))
+_sym_db.RegisterMessage(PolicyList)
+
+
+# @@protoc_insertion_point(module_scope)
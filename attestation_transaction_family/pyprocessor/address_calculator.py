@@ -18,14 +18,89 @@ import hashlib
 FAMILY_NAME = "attestation"
 
 # Hash and assemble address
+# Evidence lists stored before the sharded layout are kept at this address of their prover
 def _assembleAddress(public_key):
 
     return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + \
                  _hash(public_key.encode('utf-8'))[0:64]
 
-# Assemble the correct address for a given key using the transaction family name
+# Version of the sharded evidence layout, first two characters after the namespace
+EVIDENCE_LAYOUT_VERSION = '01'
+
+# Prefix of all evidence addresses of a prover in the sharded layout
+def _proverPrefix(prover):
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + EVIDENCE_LAYOUT_VERSION + \
+                 _hash(prover.encode('utf-8'))[0:30]
+
+# Assemble the address of the manifest that lists the verifiers of a prover
+def _assembleManifestAddress(prover):
+    return _proverPrefix(prover) + '0' * 32
+
+# Assemble the address of the evidences of one verifier for one prover
+def _assembleEdgeAddress(prover, verifier):
+    return _proverPrefix(prover) + _hash(verifier.encode('utf-8'))[0:32]
+
+# Assemble the reverse index address of a verifier, it lists the provers with an edge list of the verifier
+def _assembleReverseIndexAddress(verifier):
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '02' + _hash(verifier.encode('utf-8'))[0:62]
+
+# Assemble the address of the registry of hot trustors, their reachability is cached
+def _assembleHotTrustorRegistryAddress():
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '04' + '0' * 62
+
+# Prefix of all cached trust paths of a hot trustor
+def _reachabilityPrefix(trustor):
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '03' + _hash(trustor.encode('utf-8'))[0:30]
+
+# Assemble the address of the list of provers with a cached trust path of a hot trustor
+def _assembleReachabilityIndexAddress(trustor):
+    return _reachabilityPrefix(trustor) + '0' * 32
+
+# Assemble the address of the cached trust path from a hot trustor to a prover
+def _assembleReachabilityAddress(trustor, prover):
+    return _reachabilityPrefix(trustor) + _hash(prover.encode('utf-8'))[0:32]
+
+# Assemble the address of the memoized trust query result of a trustor and trustee
+def _assembleTrustMemoAddress(trustor, trustee):
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '05' + \
+                 _hash(trustor.encode('utf-8'))[0:30] + _hash(trustee.encode('utf-8'))[0:32]
+
+# Assemble the address of the index of trust memos whose path uses evidences of a prover
+def _assembleMemoIndexAddress(prover):
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + '06' + _hash(prover.encode('utf-8'))[0:62]
+
+# Assemble the storage address of an evidence, the edge address of its prover and verifier
 def _assembleEvidenceStorageAddress(evidence):
-    return _assembleAddress(evidence.ProverIdentity)
+    return _assembleEdgeAddress(evidence.ProverIdentity, evidence.VerifierIdentity)
+
+# Number of shards of the expiry index, storage addresses are spread over the shards by their last byte
+EXPIRY_INDEX_SHARDS = 16
+
+# Prefix of all buckets of one expiry index shard, submissions declare the prefix of their shard only
+def _expiryShardPrefix(shard):
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + 'e2' + '{:02x}'.format(shard)
+
+# Returns the expiry index shard of a storage address
+def _expiryShard(address):
+    return int(address[-2:], 16) % EXPIRY_INDEX_SHARDS
+
+# Assemble the address of an expiry index bucket in one shard
+def _assembleExpiryShardAddress(shard, bucket):
+    return _expiryShardPrefix(shard) + hex(bucket)[2:].zfill(60)
+
+# Assemble the address of the latest submission of one expiry index shard that left the caches of hot
+# trustors behind, submissions write the shard they declare anyway
+def _assembleCacheMissAddress(shard):
+    return _expiryShardPrefix(shard) + 'e' * 60
+
+# Assemble the address of the expiry sweep cursor
+def _assembleExpiryCursorAddress():
+    return _hash(FAMILY_NAME.encode('utf-8'))[0:6] + 'e1' + '0' * 62
+
+# Assemble the address of the cursor of one expiry index shard, it follows all buckets of the shard
+# Submissions lower the cursor of their shard, the sweep merges the shard cursors into the sweep cursor
+def _assembleExpiryShardCursorAddress(shard):
+    return _expiryShardPrefix(shard) + 'f' * 60
 
 # Hashing function
 def _hash(data):
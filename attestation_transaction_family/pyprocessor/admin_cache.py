@@ -0,0 +1,93 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Process-wide cache for the parsed administration databases.
+
+The administration lists only change when an administrator submits a new
+database, but they are read by almost every attestation transaction.
+Entries are keyed by the state address and a digest of the raw state bytes,
+so a new database version is parsed exactly once and every validator sees
+the same result for the same state.
+'''
+
+import logging
+import hashlib
+import threading
+import collections
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# Upper bound of cached versions over all administration addresses.
+# Several versions may be alive at the same time while forks are resolved.
+MAX_CACHED_ENTRIES = 16
+
+class StateCache(object):
+    '''
+    Thread-safe LRU cache for objects derived from raw state data.
+
+    The cached objects are shared between the worker threads of the
+    transaction processor and must be treated as read-only by the callers.
+    '''
+    def __init__(self, maxEntries=MAX_CACHED_ENTRIES):
+        self._maxEntries = maxEntries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key, build):
+        '''Return the cached object for key or build and store it.'''
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        # Build outside of the lock, a concurrent duplicate build is harmless
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            # Evict the least recently used versions
+            while len(self._entries) > self._maxEntries:
+                evictedKey, _ = self._entries.popitem(last=False)
+                LOGGER.debug('Evicted cached entry for address %s', evictedKey[0])
+        return value
+
+    def parse(self, address, data, messageType):
+        '''Return the parsed protobuf message of type messageType for data.'''
+        def build():
+            message = messageType()
+            message.ParseFromString(data)
+            return message
+        return self.lookup((address, stateDigest(data)), build)
+
+    def hitRate(self):
+        '''Return the share of lookups answered from the cache.'''
+        with self._lock:
+            total = self.hits + self.misses
+            return self.hits / total if total else 0.0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+# Digest of raw state bytes used as the cache version key
+def stateDigest(data):
+    return hashlib.sha256(data).digest()
+
+# The cache shared by all transactions of this processor
+ADMIN_CACHE = StateCache()
@@ -0,0 +1,101 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Hash index over the administration databases.
+
+The index is built once per version of the administration lists (see
+admin_cache) and turns the validation lookups into dictionary accesses.
+Like the linear scans it replaces, the first matching list entry wins.
+'''
+
+import logging
+
+from sawtooth_sdk.processor.exceptions import InternalError
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+class AdminIndex(object):
+    '''
+    Read-only lookup tables for devices, policies, warrants and properties.
+
+    A list that was not found in the global state is recorded as missing.
+    Lookups on a missing list raise an InternalError, as loading the list did before.
+    '''
+    def __init__(self, deviceList, policyList, warrantList, propertiesList):
+        self._devices = None
+        self._classes = None
+        self._policies = None
+        self._warrants = None
+        self._properties = None
+
+        if deviceList is not None:
+            self._devices = {}
+            # Identities of the devices of each class, in the order of the list
+            self._classes = {}
+            for device in deviceList.Devices:
+                if device.DeviceIdentity not in self._devices:
+                    self._devices[device.DeviceIdentity] = device
+                    self._classes.setdefault(device.DeviceClass, []).append(device.DeviceIdentity)
+
+        if policyList is not None:
+            self._policies = {}
+            for policy in policyList.Policies:
+                key = (policy.DeviceClass, policy.AttestationType, policy.Version, policy.Measurement)
+                self._policies.setdefault(key, policy)
+
+        if warrantList is not None:
+            self._warrants = set()
+            for warrant in warrantList.Warrants:
+                self._warrants.add((warrant.Warrantor, warrant.Warrantee, warrant.AttestationType))
+
+        if propertiesList is not None:
+            self._properties = {}
+            for properties in propertiesList.Properties:
+                self._properties.setdefault(properties.AttestationType, properties)
+
+    # Returns the Device entry for an identity or None
+    def lookupDevice(self, deviceID):
+        if self._devices is None:
+            raise InternalError('Failed to load device list')
+        return self._devices.get(deviceID)
+
+    # Checks whether an identity is a registered device
+    def isDevice(self, deviceID):
+        return self.lookupDevice(deviceID) is not None
+
+    # Returns the identities of the devices of a class, [] for an unknown class
+    def devicesOfClass(self, deviceClass):
+        if self._classes is None:
+            raise InternalError('Failed to load device list')
+        return self._classes.get(deviceClass, [])
+
+    # Returns the Policy entry matching the given attributes or None
+    def lookupPolicy(self, deviceClass, attType, version, measurement):
+        if self._policies is None:
+            raise InternalError('Failed to load policy list')
+        return self._policies.get((deviceClass, attType, version, measurement))
+
+    # Checks whether a warrant relationship is registered
+    def hasWarrant(self, warrantor, warrantee, attType):
+        if self._warrants is None:
+            raise InternalError('Failed to load warrant list')
+        return (warrantor, warrantee, attType) in self._warrants
+
+    # Returns the Properties entry for an attestation type or None
+    def lookupProperties(self, attType):
+        if self._properties is None:
+            raise InternalError('Failed to load properties list')
+        return self._properties.get(attType)
@@ -35,6 +35,16 @@ from sawtooth_sdk.processor.exceptions import InternalError
 from sawtooth_sdk.processor.core import TransactionProcessor
 import evidence_submission
 import trust_query
+import evidence_expiry
+import evidence_migration
+import reachability_cache
+import state_view
+import storage_functions
+import block_info_functions
+import address_calculator
+import evidence_pb2
+import trust_query_pb2
+import transaction_envelope_pb2
 
 # hard-coded for simplicity (otherwise get the URL from the args in main):
 #DEFAULT_URL = 'tcp://localhost:4004'
@@ -44,6 +54,22 @@ DEFAULT_URL = 'tcp://validator:4004'
 # Initialize logger
 LOGGER = logging.getLogger(__name__)
 
+# Version of the protobuf transaction envelope
+ENVELOPE_VERSION = 1
+# First byte of an envelope: field 1 (Version) with wire type varint
+ENVELOPE_VERSION_TAG = b'\x08'
+# Message of the payload of each action, like the fields of the envelope, the payload of sweepExpired is empty
+ACTION_MESSAGES = {
+    "submitEvidence": evidence_pb2.Evidence,
+    "submitEvidenceList": evidence_pb2.EvidenceList,
+    "trustQuery": trust_query_pb2.TrustQuery,
+    "trustQueryMulti": trust_query_pb2.TrustQueryMulti,
+    "verifyPath": trust_query_pb2.PathVerification,
+    "migrateEvidence": evidence_pb2.IdentityList,
+    "registerHotTrustors": evidence_pb2.IdentityList,
+    "unregisterHotTrustors": evidence_pb2.IdentityList,
+}
+
 FAMILY_NAME = "attestation"
 # TF Prefix is first 6 characters of SHA-512("attestation"), FADC96
 
@@ -58,7 +84,8 @@ class AttestationTransactionHandler(TransactionHandler):
     Transaction Processor class for the Attestation Transaction Family.
 
     This TP communicates with the Validator using the accept/get/set functions.
-    This implements functions for "submitEvidence" or "trustQuery" transactions
+    This implements functions for "submitEvidence", "submitEvidenceList", "trustQuery", "trustQueryMulti", "verifyPath",
+    "sweepExpired", "migrateEvidence", "registerHotTrustors" or "unregisterHotTrustors" transactions
     '''
     def __init__(self, namespace_prefix):
         '''Initialize the transaction handler class.
@@ -90,13 +117,23 @@ class AttestationTransactionHandler(TransactionHandler):
         '''
 
         # Get the payload and extract the attestation-specific information.
-        # Payload needs to be cbor decoded and split into action and actual (inner) payload
+        # Payload needs to be decoded from its envelope and split into action and actual (inner) payload,
+        # the inner payload is the parsed message of the action
         header = transaction.header        
         action, payload = self._decode_transaction(transaction.payload)
 
         # Get the signer's public key, sent in the header from the client.
         sender = header.signer_public_key
 
+        # Serve all state reads of this transaction from a single prefetch round trip
+        context = state_view.StateView(context)
+        state_view.setOutputs(context, header.outputs)
+        knownAddresses = list(storage_functions.administration_addresses)
+        knownAddresses.append(block_info_functions.block_info_config_address)
+        knownAddresses.append(address_calculator._assembleExpiryCursorAddress())
+        knownAddresses.append(address_calculator._assembleHotTrustorRegistryAddress())
+        context.prefetch(state_view.prefetchAddresses(header.inputs, knownAddresses))
+
         # Perform the action.
         LOGGER.info("Action = %s.", action)
         LOGGER.info("Payload = %s.", payload)
@@ -104,13 +141,35 @@ class AttestationTransactionHandler(TransactionHandler):
 		# Call the appropriate module for a transaction
         if action == "submitEvidence":
             evidence_submission.handleEvidenceSubmission(context, payload, sender)
+        elif action == "submitEvidenceList":
+            evidence_submission.handleEvidenceListSubmission(context, payload, sender)
         elif action == "trustQuery":
             trust_query.handleTrustQuery(context, payload, sender)
+        elif action == "trustQueryMulti":
+            trust_query.handleTrustQueryMulti(context, payload, sender)
+        elif action == "verifyPath":
+            trust_query.handlePathVerification(context, payload, sender)
+        elif action == "sweepExpired":
+            evidence_expiry.handleSweepExpired(context, payload, sender)
+        elif action == "migrateEvidence":
+            evidence_migration.handleEvidenceMigration(context, payload, sender)
+        elif action == "registerHotTrustors":
+            reachability_cache.handleHotTrustorRegistration(context, payload, sender, register=True)
+        elif action == "unregisterHotTrustors":
+            reachability_cache.handleHotTrustorRegistration(context, payload, sender, register=False)
         else:
             LOGGER.info("Unhandled action. Action should be submitEvidence")
 
-    # Decode the cbor encoded payload from the client
+        # Write the expired evidences found by this transaction back once per address
+        storage_functions.flushEvidenceDeletions(context)
+        # List the provers that got a cached trust path of a hot trustor
+        reachability_cache.flushCacheIndex(context)
+
+    # Decode the payload from the client, a protobuf envelope or the cbor map of earlier clients
+    # The formats are told apart by the first byte, the tag of the envelope Version field is 0x08
     def _decode_transaction(self, payload):
+        if payload[:1] == ENVELOPE_VERSION_TAG:
+            return self._decode_envelope(payload)
         try:
             content = cbor.loads(payload)
         except:
@@ -126,7 +185,36 @@ class AttestationTransactionHandler(TransactionHandler):
         except AttributeError:
             raise InvalidTransaction('Payload must be here')
 
-        return action, payload
+        return action, self._parse_payload(action, payload)
+
+    # Parse the serialized message of an action from a cbor map, the envelope parses it with the envelope
+    def _parse_payload(self, action, payload):
+        messageType = ACTION_MESSAGES.get(action)
+        if messageType is None:
+            return payload
+        message = messageType()
+        try:
+            message.ParseFromString(payload)
+        except:
+            raise InvalidTransaction('Invalid payload serialization')
+        return message
+
+    # Decode the protobuf envelope, the action is the name of the set field
+    def _decode_envelope(self, payload):
+        envelope = transaction_envelope_pb2.AttestationEnvelope()
+        try:
+            envelope.ParseFromString(payload)
+        except:
+            raise InvalidTransaction('Invalid payload serialization')
+
+        if envelope.Version != ENVELOPE_VERSION:
+            raise InvalidTransaction('Unsupported envelope version {}'.format(envelope.Version))
+
+        action = envelope.WhichOneof('Action')
+        if action is None:
+            raise InvalidTransaction('Action must be here')
+
+        return action, getattr(envelope, action)
 
 def main():
     '''Entry-point function for the Attestation Transaction Processor.'''
@@ -25,15 +25,23 @@ from sawtooth_sdk.processor.exceptions import InternalError
 # Initialize logger
 LOGGER = logging.getLogger(__name__)
 
+# Address of the BlockInfoConfig entry
+block_info_config_address = '00b10c01' + 62*'0'
+
 # Reads the current timestamp
+# The value is resolved once per transaction when the context is a StateView
 def readLastBlockTime(context):
-    return readBlockTime(context, readLastBlockNumber(context))
+    memo = getattr(context, 'memo', None)
+    if memo is None:
+        return readBlockTime(context, readLastBlockNumber(context))
+    if 'lastBlockTime' not in memo:
+        memo['lastBlockTime'] = readBlockTime(context, readLastBlockNumber(context))
+    return memo['lastBlockTime']
 
 # Reads the last block number from BlockInfoConfig
 def readLastBlockNumber(context):
-    blockInfoAddress = '00b10c01' + 62*'0'
     try:
-        state_entries = context.get_state([blockInfoAddress])
+        state_entries = context.get_state([block_info_config_address])
         blockInfoConfigEncoded = state_entries[0].data
     except:
         raise InternalError('Failed to load LastBlockNumber')
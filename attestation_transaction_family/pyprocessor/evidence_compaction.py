@@ -0,0 +1,44 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Compaction of the evidence lists of provers.
+
+Evidences of the same verifier and attestation type share their properties,
+so the most recent one always has the highest trust score. Older ones are
+replaced when a new evidence is stored, which keeps a list at one evidence
+per verifier and attestation type. The migrateEvidence action applies the
+same rule to the legacy lists stored before.
+'''
+
+import logging
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# Returns the key of the evidences that replace each other
+def _compactionKey(evidence):
+    return (evidence.VerifierIdentity, evidence.AttestationType)
+
+# Returns the evidences of a list that are not replaced by a more recent evidence
+# of the same verifier and attestation type, in their stored order
+def compactEvidences(evidences):
+    latest = {}
+    for position, evidence in enumerate(evidences):
+        key = _compactionKey(evidence)
+        # Later submissions win on equal timestamps
+        if (key not in latest) or (evidence.Timestamp >= evidences[latest[key]].Timestamp):
+            latest[key] = position
+    kept = sorted(latest.values())
+    return [evidences[position] for position in kept]
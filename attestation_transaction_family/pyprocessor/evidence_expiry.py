@@ -0,0 +1,222 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Expiry index for attestation evidences.
+
+Every stored evidence records the time after which its trust score is 0
+(ExpiresAt). The storage address of the evidence is added to the expiry
+bucket of that time. The sweepExpired action walks the buckets that lie
+completely in the past and deletes their expired evidences in bulk, so
+evidences of provers that are never queried do not pile up in the state.
+
+Every bucket is split into shards by the storage address, so submissions
+for different shards write different index addresses and can be scheduled
+in parallel.
+
+The sweep cursor holds the first bucket that is not swept yet. Submissions
+only read it, an evidence that expires before the cursor lowers the cursor
+of its shard instead, which the next sweep merges into the sweep cursor.
+'''
+
+import logging
+import math
+import collections
+import evidence_pb2
+import address_calculator
+import block_info_functions
+import storage_functions
+
+from sawtooth_sdk.processor.exceptions import InvalidTransaction
+from sawtooth_sdk.processor.exceptions import InternalError
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# Length of an expiry bucket in seconds
+EXPIRY_BUCKET_SECONDS = 600
+
+# Upper bound of buckets read by one sweepExpired transaction, each bucket has one address per shard
+MAX_SWEEP_BUCKETS = 64
+
+# Sets the expiry time of a new evidence from the xmax of its properties
+def setEvidenceExpiry(context, evidence):
+    evidenceProperties = storage_functions.findEvidenceProperties(context, evidence)
+    if evidenceProperties is None:
+        raise InvalidTransaction('Could not find properties attributes for evidence')
+    evidence.ExpiresAt = evidence.Timestamp + int(math.ceil(evidenceProperties.xmax))
+
+# Returns the expiry bucket of a point in time
+def expiryBucket(timestamp):
+    return timestamp // EXPIRY_BUCKET_SECONDS
+
+# Method to add a stored evidence to the expiry index
+def indexEvidence(context, evidence, address):
+    indexEvidences(context, [(evidence, address)])
+
+'''
+Method to add stored evidences to the expiry index, every index address is written once
+
+Input:
+    context - current blockchain state
+    indexed - (evidence, storage address) pairs of the stored evidences with ExpiresAt set
+Raises:
+    Internal Error - State Data Error
+'''
+def indexEvidences(context, indexed):
+    bucketAddresses = collections.OrderedDict()
+    for evidence, address in indexed:
+        bucketAddress = address_calculator._assembleExpiryShardAddress(address_calculator._expiryShard(address), expiryBucket(evidence.ExpiresAt))
+        bucketAddresses.setdefault(bucketAddress, []).append(address)
+    # Earliest bucket per shard
+    shardBuckets = {}
+    for evidence, address in indexed:
+        shard = address_calculator._expiryShard(address)
+        shardBuckets[shard] = min(shardBuckets.get(shard, expiryBucket(evidence.ExpiresAt)), expiryBucket(evidence.ExpiresAt))
+    cursorAddress = address_calculator._assembleExpiryCursorAddress()
+    shardCursorAddresses = {shard: address_calculator._assembleExpiryShardCursorAddress(shard) for shard in shardBuckets}
+    stored = {entry.address: entry.data for entry in context.get_state(
+        list(bucketAddresses) + [cursorAddress] + list(shardCursorAddresses.values()))}
+
+    entries = {}
+    for bucketAddress, addresses in bucketAddresses.items():
+        bucketEntry = _parseIndexEntry(evidence_pb2.ExpiryBucket, stored.get(bucketAddress))
+        added = [address for address in collections.OrderedDict.fromkeys(addresses) if address not in bucketEntry.Addresses]
+        if added:
+            bucketEntry.Addresses.extend(added)
+            entries[bucketAddress] = bucketEntry.SerializeToString()
+    # The sweep must not have passed the earliest bucket yet, a new evidence never expires before
+    # the current bucket, so the cursor of a shard is only written before the first sweep
+    # and for migrated evidences
+    sweepCursor = _parseIndexEntry(evidence_pb2.ExpiryCursor, stored[cursorAddress]) if cursorAddress in stored else None
+    for shard, bucket in shardBuckets.items():
+        if (sweepCursor is not None) and (sweepCursor.NextBucket <= bucket):
+            continue
+        shardCursorAddress = shardCursorAddresses[shard]
+        if shardCursorAddress in stored:
+            shardCursor = _parseIndexEntry(evidence_pb2.ExpiryCursor, stored[shardCursorAddress])
+            if shardCursor.NextBucket <= bucket:
+                continue
+        entries[shardCursorAddress] = evidence_pb2.ExpiryCursor(NextBucket=bucket).SerializeToString()
+
+    if entries:
+        addresses = context.set_state(entries)
+        # Check if data was actually written to addresses
+        if len(addresses) < len(entries):
+            raise InternalError("State Error")
+
+'''
+Handling of an expiry sweep
+
+Deletes the expired evidences of all buckets before the bucket of the current block time,
+starting at the sweep cursor or an earlier shard cursor. The shard cursors are merged into
+the sweep cursor. At most MaximumSweepAddresses storage addresses of the system
+config are cleaned, the rest of a bucket is kept for the next sweep.
+
+Input:
+    context - current blockchain state
+    payload - transaction payload, unused
+    sender - sender public key
+Output:
+    expiry_sweep - event with the number of cleaned addresses and deleted evidences
+    evidence_deletion - one event per cleaned address
+'''
+def handleSweepExpired(context, payload, sender):
+    LOGGER.info('Expiry sweep received from %s.', sender)
+
+    currentTimestamp = block_info_functions.readLastBlockTime(context)
+    # Buckets before the current one lie completely in the past
+    dueBucket = expiryBucket(currentTimestamp)
+    maxAddresses = storage_functions.fetchSystemConfig(context).MaximumSweepAddresses
+
+    cursorAddress = address_calculator._assembleExpiryCursorAddress()
+    shardCursorAddresses = [address_calculator._assembleExpiryShardCursorAddress(shard) for shard in range(address_calculator.EXPIRY_INDEX_SHARDS)]
+    cursors = {entry.address: _parseIndexEntry(evidence_pb2.ExpiryCursor, entry.data).NextBucket
+               for entry in context.get_state([cursorAddress] + shardCursorAddresses)}
+    if not cursors:
+        LOGGER.info('Expiry index is empty')
+        return
+    firstBucket = min(cursors.values())
+
+    # Load all shards of the due buckets with a single state request
+    buckets = list(range(firstBucket, min(dueBucket, firstBucket + MAX_SWEEP_BUCKETS)))
+    bucketAddresses = [_bucketAddresses(bucket) for bucket in buckets]
+    stored = {entry.address: entry.data for entry in context.get_state(
+        [bucketAddress for addresses in bucketAddresses for bucketAddress in addresses])}
+
+    sweptAddresses = 0
+    deletedEvidences = 0
+    nextBucket = firstBucket
+    for bucket, addressesOfBucket in zip(buckets, bucketAddresses):
+        complete = True
+        for bucketAddress in addressesOfBucket:
+            if bucketAddress not in stored:
+                continue
+            if (maxAddresses > 0) and (sweptAddresses >= maxAddresses):
+                complete = False
+                break
+            addresses = list(_parseIndexEntry(evidence_pb2.ExpiryBucket, stored[bucketAddress]).Addresses)
+            if maxAddresses > 0:
+                sweep = addresses[:maxAddresses - sweptAddresses]
+            else:
+                sweep = addresses
+            evidenceLists = storage_functions.getEvidenceListsFromAddresses(context, sweep)
+            for address in sweep:
+                if evidenceLists[address] == []:
+                    continue
+                expired = {evidence.SerializeToString(): evidence for evidence in evidenceLists[address].Evidences
+                           if 0 < evidence.ExpiresAt < currentTimestamp}
+                if expired:
+                    storage_functions._deleteEvidences(context, [address], expired)
+                    deletedEvidences += len(expired)
+            sweptAddresses += len(sweep)
+
+            # Keep the rest of the bucket for the next sweep
+            remaining = addresses[len(sweep):]
+            if remaining:
+                context.set_state({bucketAddress: evidence_pb2.ExpiryBucket(Addresses=remaining).SerializeToString()})
+                complete = False
+                break
+            context.delete_state([bucketAddress])
+        if not complete:
+            break
+        nextBucket = bucket + 1
+        if (maxAddresses > 0) and (sweptAddresses >= maxAddresses):
+            break
+
+    if cursors.get(cursorAddress) != nextBucket:
+        context.set_state({cursorAddress: evidence_pb2.ExpiryCursor(NextBucket=nextBucket).SerializeToString()})
+    mergedCursors = [address for address in shardCursorAddresses if address in cursors]
+    if mergedCursors:
+        context.delete_state(mergedCursors)
+    LOGGER.info('Expiry sweep cleaned %s addresses and deleted %s evidences, next bucket %s',
+                sweptAddresses, deletedEvidences, nextBucket)
+
+    context.add_event(
+            event_type="attestation/expiry_sweep",
+            attributes=[("sweptAddresses", str(sweptAddresses)), ("deletedEvidences", str(deletedEvidences)), ("nextBucket", str(nextBucket))])
+
+# Returns the index addresses of all shards of a bucket
+def _bucketAddresses(bucket):
+    return [address_calculator._assembleExpiryShardAddress(shard, bucket) for shard in range(address_calculator.EXPIRY_INDEX_SHARDS)]
+
+# Parses an expiry index entry, missing data yields an empty entry
+def _parseIndexEntry(messageType, data):
+    entry = messageType()
+    if data:
+        try:
+            entry.ParseFromString(data)
+        except:
+            raise InternalError('Failed to load state data - expiry index')
+    return entry
@@ -0,0 +1,110 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Migration of evidence lists to the sharded storage layout.
+
+Before the sharded layout all evidences of a prover were kept in one list at
+the address of the prover. New evidences are stored in the edge list of their
+prover and verifier. The manifest of the prover lists its verifiers and the
+reverse index of a verifier lists its provers. Readers merge both layouts,
+the migrateEvidence action moves the legacy list of a prover into its edge
+lists and deletes it.
+
+Legacy evidences stored before the expiry index have no ExpiresAt. It is set
+from their Timestamp and the xmax of their properties when they are moved,
+so every migrated evidence is added to the expiry index.
+'''
+
+import logging
+import collections
+import evidence_pb2
+import address_calculator
+import storage_functions
+import evidence_expiry
+import evidence_compaction
+
+from sawtooth_sdk.processor.exceptions import InvalidTransaction
+from sawtooth_sdk.processor.exceptions import InternalError
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# Upper bound of provers migrated by one migrateEvidence transaction
+MAX_MIGRATION_PROVERS = 100
+
+'''
+Handling of an evidence migration
+
+Input:
+    context - current blockchain state
+    provers - IdentityList with the provers to migrate
+    sender - sender public key
+Output:
+    evidence_migration - event with the number of migrated provers and evidences
+'''
+def handleEvidenceMigration(context, provers, sender):
+    LOGGER.info('Evidence migration received from %s.', sender)
+
+    if len(provers.Identities) > MAX_MIGRATION_PROVERS:
+        raise InvalidTransaction('Migration exceeds the maximum of {} provers'.format(MAX_MIGRATION_PROVERS))
+
+    provers = list(collections.OrderedDict.fromkeys(provers.Identities))
+    legacyAddresses = [address_calculator._assembleAddress(prover) for prover in provers]
+    legacyLists = storage_functions.getEvidenceListsFromAddresses(context, legacyAddresses)
+
+    migratedProvers = 0
+    migratedEvidences = 0
+    for prover, legacyAddress in zip(provers, legacyAddresses):
+        if legacyLists[legacyAddress] == []:
+            continue
+        migratedEvidences += _migrateProver(context, prover, legacyLists[legacyAddress].Evidences)
+        context.delete_state([legacyAddress])
+        migratedProvers += 1
+    LOGGER.info('Migrated %s provers with %s evidences', migratedProvers, migratedEvidences)
+
+    context.add_event(
+            event_type="attestation/evidence_migration",
+            attributes=[("migratedProvers", str(migratedProvers)), ("migratedEvidences", str(migratedEvidences))])
+
+# Moves the legacy evidences of a prover into its edge lists, returns the number of moved evidences
+def _migrateProver(context, prover, legacyEvidences):
+    groups = collections.OrderedDict()
+    for evidence in legacyEvidences:
+        # Evidences of attestation types without properties never expire and are not indexed
+        if (evidence.ExpiresAt == 0) and (storage_functions.findEvidenceProperties(context, evidence) is not None):
+            evidence_expiry.setEvidenceExpiry(context, evidence)
+        groups.setdefault(evidence.VerifierIdentity, []).append(evidence)
+    edgeAddresses = collections.OrderedDict((verifier, address_calculator._assembleEdgeAddress(prover, verifier))
+                                            for verifier in groups)
+    edgeLists = storage_functions.getEvidenceListsFromAddresses(context, list(edgeAddresses.values()))
+
+    entries = {}
+    indexed = []
+    for verifier, address in edgeAddresses.items():
+        stored = list(edgeLists[address].Evidences) if edgeLists[address] != [] else []
+        # Evidences of the edge list were submitted after the legacy ones
+        kept = evidence_compaction.compactEvidences(groups[verifier] + stored)
+        entries[address] = evidence_pb2.EvidenceList(Evidences=kept).SerializeToString()
+        # Expiry index entries of the moved evidences still point to the legacy address
+        indexed.extend((evidence, address) for evidence in kept if evidence.ExpiresAt > 0)
+
+    written = context.set_state(entries)
+    # Check if data was actually written to addresses
+    if len(written) < len(entries):
+        raise InternalError("State Error")
+    storage_functions._registerEdges(context, prover, list(groups))
+    if indexed:
+        evidence_expiry.indexEvidences(context, indexed)
+    return len(legacyEvidences)
@@ -15,11 +15,15 @@
 
 import logging
 import hashlib
+import collections
 import block_info_functions
 import address_calculator
 import evidence_pb2
 import policies_pb2
 import storage_functions
+import evidence_expiry
+import evidence_compaction
+import reachability_cache
 
 from sawtooth_sdk.processor.handler import TransactionHandler
 from sawtooth_sdk.processor.exceptions import InvalidTransaction
@@ -28,45 +32,95 @@ from sawtooth_sdk.processor.exceptions import InternalError
 # Initialize logger
 LOGGER = logging.getLogger(__name__)
 
+# Upper bound of evidences in one submitEvidenceList transaction
+MAX_BATCH_EVIDENCES = 1024
+
 '''
 Handling of attestation evidence submission
 Input: 
     context - current blockchain state
-    encodedEvidence - submitted evidence from the transaction payload
+    evidence - submitted Evidence from the transaction payload
     sender - sender public key
 Output:
     evidence_submission - event that notifies about a successful evidence submission
 '''
-def handleEvidenceSubmission(context, encodedEvidence, sender):
+def handleEvidenceSubmission(context, evidence, sender):
     LOGGER.info('Received Evidence from Verifier %s.',
                 sender)
 
-    # Read received evidence back to Evidence object
-    evidence = evidence_pb2.Evidence()
-    evidence.ParseFromString(encodedEvidence)
-
     # Evidence verification according to Section 6.4.2
     _validate_evidence(context, evidence, sender)
 
-    # Calculate the address to store the evidence. Default: ProverIdentity
-    storageAddress = address_calculator._assembleAddress(evidence.ProverIdentity)
+    # Calculate the address to store the evidence: the edge list of prover and verifier
+    storageAddress = address_calculator._assembleEvidenceStorageAddress(evidence)
 
-    # Set current timestamp for new evidence
+    # Set current timestamp and expiry time for new evidence
     _setEvidenceTimestamp(context, evidence)
+    evidence_expiry.setEvidenceExpiry(context, evidence)
 
     # Logging of complete evidence
     LOGGER.info('Evidence --- VerifierIdentity: %s , ProverIdentity: %s , AttestationType: %s , ProverDeviceClass: %s , ProverVersion: %s , Measurement: %s , isWarrant: %s , Timestamp: %s',
                 evidence.VerifierIdentity, evidence.ProverIdentity, evidence.AttestationType, evidence.ProverDeviceClass, evidence.ProverVersion, evidence.Measurement, evidence.isWarrantAttestation, evidence.Timestamp)
 
 
-    # Store evidence to the global state
+    # Store evidence to the global state and add it to the expiry index
     _storeEvidence(context, evidence, storageAddress)
+    evidence_expiry.indexEvidence(context, evidence, storageAddress)
+    # Relax the new edge into the cached trust paths of hot trustors
+    reachability_cache.evidenceAdded(context, evidence)
 
     # Add event submission
     context.add_event(
             event_type="attestation/evidence_submission",
             attributes=[("verifier", str(evidence.VerifierIdentity)), ("prover", str(evidence.ProverIdentity))])
 
+'''
+Handling of a batch of attestation evidences
+
+All evidences are validated against the same administration databases and stamped with the
+same block time before anything is written, an invalid evidence rejects the whole batch.
+Evidences of the same edge are merged, so every storage address, manifest, reverse index and
+expiry index bucket is written once per batch.
+
+Input:
+    context - current blockchain state
+    evidenceList - submitted EvidenceList from the transaction payload
+    sender - sender public key
+Output:
+    evidence_list_submission - event with the verifiers, the number of evidences and of written edge lists
+'''
+def handleEvidenceListSubmission(context, evidenceList, sender):
+    LOGGER.info('Received Evidence List from Verifier %s.',
+                sender)
+
+    evidences = list(evidenceList.Evidences)
+    if not (0 < len(evidences) <= MAX_BATCH_EVIDENCES):
+        raise InvalidTransaction('Evidence list must contain 1 to {} evidences'.format(MAX_BATCH_EVIDENCES))
+
+    # Validate all evidences and group them by their storage address, in submission order
+    batches = collections.OrderedDict()
+    for evidence in evidences:
+        _validate_evidence(context, evidence, sender)
+        _setEvidenceTimestamp(context, evidence)
+        evidence_expiry.setEvidenceExpiry(context, evidence)
+        storageAddress = address_calculator._assembleEvidenceStorageAddress(evidence)
+        batches.setdefault(storageAddress, []).append(evidence)
+
+    # Store the evidences to the global state and add them to the expiry index
+    _storeEvidenceBatches(context, batches)
+    evidence_expiry.indexEvidences(context, [(evidence, address) for address, batch in batches.items() for evidence in batch])
+    # Relax the new edges into the cached trust paths of hot trustors
+    for evidence in evidences:
+        reachability_cache.evidenceAdded(context, evidence)
+
+    verifiers = collections.OrderedDict.fromkeys(evidence.VerifierIdentity for evidence in evidences)
+    LOGGER.info('Stored %s evidences of %s verifiers in %s edge lists', len(evidences), len(verifiers), len(batches))
+
+    # Add one event for the batch
+    context.add_event(
+            event_type="attestation/evidence_list_submission",
+            attributes=[("verifier", ','.join(verifiers)), ("evidences", str(len(evidences))), ("edges", str(len(batches)))])
+
 # Method to set the evidence timestamp to current time
 def _setEvidenceTimestamp(context, evidence):
     # Retrieve timestamp for current block
@@ -94,15 +148,19 @@ def _storeEvidence(context, evidenceToStore, address):
         LOGGER.info('No previous evidences, creating new list for address %s',
                     address)
         evidenceList.Evidences.extend([evidenceToStore])
+        # A new edge list is registered in the manifest of the prover and the reverse index of the verifier
+        storage_functions._registerEdges(context, evidenceToStore.ProverIdentity, [evidenceToStore.VerifierIdentity])
     else:   
         LOGGER.info('Appending evidence to existing list for address %s',
                     address)
         try:
             StoredEvidenceList = state_entries[0].data
             evidenceList.ParseFromString(StoredEvidenceList)
-            evidenceList.Evidences.extend([evidenceToStore])
         except:
             raise InternalError('Failed to load state data')
+        # The new evidence replaces older evidences of the same verifier and attestation type
+        kept = evidence_compaction.compactEvidences(list(evidenceList.Evidences) + [evidenceToStore])
+        evidenceList = evidence_pb2.EvidenceList(Evidences=kept)
         
     state_data = evidenceList.SerializeToString()
     LOGGER.info('State Data String: %s',
@@ -113,6 +171,42 @@ def _storeEvidence(context, evidenceToStore, address):
     if len(addresses) < 1:
         raise InternalError("State Error")
 
+'''
+Method to store the evidences of a batch
+
+Input:
+    context - current blockchain state
+    batches - new evidences by storage address
+Raises:
+    Internal Error - State Data Error
+'''
+def _storeEvidenceBatches(context, batches):
+
+    # Retrieve the stored lists of all addresses with a single state request
+    stored = {entry.address: entry.data for entry in context.get_state(list(batches))}
+    entries = {}
+    newEdges = []
+    for address, batch in batches.items():
+        evidenceList = evidence_pb2.EvidenceList()
+        if address in stored:
+            try:
+                evidenceList.ParseFromString(stored[address])
+            except:
+                raise InternalError('Failed to load state data')
+        else:
+            newEdges.append((batch[0].ProverIdentity, batch[0].VerifierIdentity))
+        # The new evidences replace older evidences of the same verifier and attestation type
+        kept = evidence_compaction.compactEvidences(list(evidenceList.Evidences) + batch)
+        entries[address] = evidence_pb2.EvidenceList(Evidences=kept).SerializeToString()
+
+    addresses = context.set_state(entries)
+    # Check if data was actually written to addresses
+    if len(addresses) < len(entries):
+        raise InternalError("State Error")
+
+    # New edge lists are registered in the manifests of the provers and the reverse indexes of the verifiers
+    storage_functions._registerEdgeBatch(context, newEdges)
+
 # Validation of an evidence according to Section 6.4.2
 def _validate_evidence(context, evidence, sender):
     # 1. IDvrf is signer of the transaction (uncomment when actual keys are used)
@@ -142,14 +236,10 @@ def _validate_evidence(context, evidence, sender):
     
 # Returns the device class of a given prover
 def _lookupProverClass(context, proverID):  
-    deviceList = storage_functions.fetchDeviceList(context)
-    if deviceList == []:
-        LOGGER.info('Device List is empty')
-    else:
-        for device in deviceList.Devices:
-            if (proverID == device.DeviceIdentity):
-                return device.DeviceClass
-    return False
+    device = storage_functions.fetchAdminIndex(context).lookupDevice(proverID)
+    if device is None:
+        return False
+    return device.DeviceClass
 
 # Function to validate a measurement
 def _validate_measurement(context, evidence):
@@ -161,43 +251,22 @@ def _validate_measurement(context, evidence):
 
 # Function to verify, if a valid policy entry exists for this evidence
 def isValidPolicyEntry(context, evidence):
-    # Retrieve all policy entries at the given address
-    policyList = storage_functions.fetchPolicyList(context)
-    if policyList == []:
-        LOGGER.info('Policy List is empty')
-    else:
-        for policy in policyList.Policies:
-            if ((evidence.ProverDeviceClass == policy.DeviceClass)
-            and (evidence.AttestationType == policy.AttestationType)
-            and (evidence.ProverVersion == policy.Version)
-            and (evidence.Measurement == policy.Measurement)):
-                LOGGER.info('Found a matching measurement :)')
-                return True, (policy.Warrant)
+    # Look up the policy entry for (device class, attestation type, version, measurement)
+    policy = storage_functions.fetchAdminIndex(context).lookupPolicy(evidence.ProverDeviceClass, evidence.AttestationType, evidence.ProverVersion, evidence.Measurement)
+    if policy is not None:
+        LOGGER.info('Found a matching measurement :)')
+        return True, (policy.Warrant)
     LOGGER.info('No matching measurement found for measurement: %s', evidence.Measurement)
 
     return False, None
 
 # Function for verifier validation
 def _validate_vrfID(context, vrfID):
-    deviceList = storage_functions.fetchDeviceList(context)
-    if deviceList == []:
-        LOGGER.info('Device List is empty')
-    else:
-        for device in deviceList.Devices:
-            if (vrfID == device.DeviceIdentity):
-                return True
-    return False
+    return storage_functions.fetchAdminIndex(context).isDevice(vrfID)
 
 # Function for prover validation
 def _validate_prvID(context, prvID):
-    deviceList = storage_functions.fetchDeviceList(context)
-    if deviceList == []:
-        LOGGER.info('Device List is empty')
-    else:
-        for device in deviceList.Devices:
-            if (prvID == device.DeviceIdentity):
-                return True
-    return False
+    return storage_functions.fetchAdminIndex(context).isDevice(prvID)
 
 # Method to check whether a warrant relationship is required and valid
 def  _validate_isWarrant(context, vrf, prv, attType, isWarrantEvidence, isWarrantPolicy):
@@ -207,16 +276,9 @@ def  _validate_isWarrant(context, vrf, prv, attType, isWarrantEvidence, isWarran
     if (isWarrantPolicy == 'false'):
         # No warrant required. Return True!
         return True
-    warrantList = storage_functions.fetchWarrantList(context)
-    if warrantList == []:
-        LOGGER.info('Warrant List is empty')
-    else:
-        for warrant in warrantList.Warrants:
-            if ((vrf == warrant.Warrantor)
-            and (prv == warrant.Warrantee)
-            and (attType == warrant.AttestationType)):
-                LOGGER.info('Found a matching warrant!')
-                return True
+    if storage_functions.fetchAdminIndex(context).hasWarrant(vrf, prv, attType):
+        LOGGER.info('Found a matching warrant!')
+        return True
     LOGGER.info('No matching measurement found for warrant: %s -> %s', vrf, prv)
     return False
 
@@ -17,6 +17,10 @@ from sawtooth_sdk.processor.handler import TransactionHandler
 from sawtooth_sdk.processor.exceptions import InvalidTransaction
 from sawtooth_sdk.processor.exceptions import InternalError
 import logging
+import array
+import heapq
+import collections
+import numpy
 import address_calculator
 import storage_functions
 import trust_query
@@ -24,6 +28,89 @@ import trust_query
 # Initialize logger
 LOGGER = logging.getLogger(__name__)
 
+# Number of pending nodes whose evidences are loaded with one state request
+PREFETCH_NODES = 16
+
+class SearchBudget(object):
+    '''
+    Limits for the work of a single trust path search. A limit of 0 means unlimited.
+
+    The search asks the budget before each node expansion, state request and scoring step.
+    Once a limit would be exceeded, exhausted is set and the search stops. State reads count
+    the addresses of the state requests, a request is started while the limit is not reached
+    and its addresses are booked afterwards.
+    '''
+    def __init__(self, maxExpandedNodes=0, maxStateReads=0, maxScoredEdges=0):
+        self.maxExpandedNodes = maxExpandedNodes
+        self.maxStateReads = maxStateReads
+        self.maxScoredEdges = maxScoredEdges
+        self.expandedNodes = 0
+        self.stateReads = 0
+        self.scoredEdges = 0
+        self.exhausted = False
+
+    @classmethod
+    def fromSystemConfig(cls, SystemConfig):
+        return cls(SystemConfig.MaximumExpandedNodes, SystemConfig.MaximumStateReads, SystemConfig.MaximumScoredEdges)
+
+    # Returns how many of the requested nodes may be read, every node costs at least one address
+    def remainingStateReads(self, requested):
+        if self.maxStateReads <= 0:
+            return requested
+        return max(0, min(requested, self.maxStateReads - self.stateReads))
+
+    # Books the expansion of a node that has count evidences, returns False if the budget is exhausted
+    def expandNode(self, count):
+        if ((self.maxExpandedNodes > 0 and self.expandedNodes + 1 > self.maxExpandedNodes)
+                or (self.maxScoredEdges > 0 and self.scoredEdges + count > self.maxScoredEdges)):
+            self.exhausted = True
+            return False
+        self.expandedNodes += 1
+        self.scoredEdges += count
+        return True
+
+    # Returns False if no further state request may be started
+    def canReadState(self):
+        if self.maxStateReads > 0 and self.stateReads >= self.maxStateReads:
+            self.exhausted = True
+            return False
+        return True
+
+    # Books count read addresses
+    def readState(self, count):
+        self.stateReads += count
+
+    def __str__(self):
+        return 'expanded nodes: {}, state reads: {}, scored edges: {}, exhausted: {}'.format(
+            self.expandedNodes, self.stateReads, self.scoredEdges, self.exhausted)
+
+class _CountingContext(object):
+    '''
+    Passes state requests to the context and counts their addresses.
+    '''
+    def __init__(self, context):
+        self._context = context
+        self.addresses = 0
+
+    def get_state(self, addresses, timeout=None):
+        self.addresses += len(addresses)
+        return self._context.get_state(addresses, timeout)
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+# Loads the data of nodes with source(context, nodes) and books the read addresses in the budget
+# Returns None if the state read budget is exhausted, otherwise the result of the source
+# Only as many nodes as addresses are left are read, the first node is always read
+def _readNodes(context, budget, source, nodes):
+    if not budget.canReadState():
+        return None
+    nodes = nodes[:max(1, budget.remainingStateReads(len(nodes)))]
+    counting = _CountingContext(context)
+    result = source(counting, nodes)
+    budget.readState(counting.addresses)
+    return result
+
 '''
 buildPath function for establishing a path between verifier and prover
 
@@ -33,125 +120,556 @@ Input:
     verifierID - verifier key or identity
     SecurityParameter - maximum allowed hop distance (search depth)
     minReliability - minimum required reliability for resulting path
+    forwardSource - optional verifier -> prover adjacency source, enables the bidirectional search
+                    forwardSource(context, nodes) returns {node: EvidenceList of evidences issued by node or []}
+    budget - optional SearchBudget, the search stops with the best entryPoint so far when it is exhausted
+    entryPointCount - number of ranked entry points to determine if no path is found
+    evidenceCache - optional dict shared by several searches in one transaction, so that the evidences
+                    of a prover are read and scored only once
 Output:
     pathFound - boolean if a final path was found
     finalRating - rating of the path
     entryPoint - node the verifier needs to attest to enter the graph
     path - sequence of nodes that build the final path
+    entryPoints - ranked list of up to entryPointCount [entryPoint, rating, path] candidates, best first
 '''
-def buildPath(context, proverID, verifierID, SecurityParameter, minReliability):
+def buildPath(context, proverID, verifierID, SecurityParameter, minReliability, forwardSource=None, budget=None, entryPointCount=1, evidenceCache=None):
 
     # Initialization of return values
     pathFound = False
     finalRating = 0
     entryPoint = None
     path = None
-
-    # Initialization of search parameters
-    maxDepth = SecurityParameter
-    currentDepth = 0
-    Fringe = []
-    newFringe = []
-    '''
-    visited[node][0] - path reliability from node to prv
-    visited[node][1] - node depth
-    visited[node][2] - path from node to prv
-    '''
-    visited = {}
+    entryPoints = []
 
     # Prover equals verifier, return
     if proverID == verifierID:
                     pathFound = True
                     finalRating = 1
                     LOGGER.info('Verifier equals Prover')
-                    return pathFound, finalRating, entryPoint, path
-
-    # Initialization for prover node
-    visited[proverID] = [1, currentDepth, proverID]
-    Fringe.append(proverID)
-    # Prover initialized, increase currentDepth    
-    currentDepth +=1
-
-    # Iterative expansion until maxDepth
-    while (currentDepth <= maxDepth):
-        LOGGER.info('Expanding nodes for depth %s', currentDepth)
-        # Expand each node in the fringe
-        for node in Fringe:
-            EvidenceList = storage_functions.getEvidenceListFromAddress(context, address_calculator._assembleAddress(node))
-            if EvidenceList == []:
-                LOGGER.info('Evidence List is empty')
+                    return pathFound, finalRating, entryPoint, path, entryPoints
+
+    if budget is None:
+        budget = SearchBudget()
+
+    # Expand from both ends if the verifier -> prover adjacency is available
+    if forwardSource is not None:
+        return _buildPathBidirectional(context, proverID, verifierID, SecurityParameter, minReliability, forwardSource, budget, entryPointCount)
+
+    return _buildPathBackward(context, [proverID], verifierID, SecurityParameter, minReliability, budget, entryPointCount, evidenceCache)
+
+'''
+buildPathFromAny function for establishing the most reliable path between a verifier and any of several provers
+
+All provers are sources of one search from the prover side, e.g. all devices of a device class.
+
+Input:
+    context - current blockchain state
+    proverIDs - prover keys or identities
+    verifierID - verifier key or identity
+    SecurityParameter, minReliability, budget, entryPointCount - see buildPath
+Output:
+    see buildPath, the path starts with the prover that was reached
+'''
+def buildPathFromAny(context, proverIDs, verifierID, SecurityParameter, minReliability, budget=None, entryPointCount=1):
+    # The verifier is one of the provers, return
+    if verifierID in proverIDs:
+        LOGGER.info('Verifier is one of the provers')
+        return True, 1, None, None, []
+
+    if budget is None:
+        budget = SearchBudget()
+    return _buildPathBackward(context, proverIDs, verifierID, SecurityParameter, minReliability, budget, entryPointCount)
+
+# Best-first search from the provers to the verifier, see buildPath
+def _buildPathBackward(context, proverIDs, verifierID, SecurityParameter, minReliability, budget, entryPointCount, evidenceCache=None):
+
+    # Initialization of return values
+    pathFound = False
+    finalRating = 0
+    entryPoint = None
+    path = None
+    entryPoints = []
+
+    # Initialization of search parameters
+    maxDepth = SecurityParameter
+    # Labels of the partial paths from a node to a prover, see _SearchState
+    state = _SearchState()
+    # Serialized evidence lists of provers, loaded in batches and parsed when the node is expanded
+    # Replaced by the verifiers and scores of the unexpired evidences after the first expansion
+    EvidenceLists = evidenceCache if evidenceCache is not None else {}
+
+    # Initialization for prover nodes
+    # The label index is also the tie breaker for labels of equal reliability and depth
+    heap = [(-1, 0, state.addLabel(1, 0, state.intern(proverID), -1))
+            for proverID in collections.OrderedDict.fromkeys(proverIDs)]
+
+    # Best-first expansion: labels are expanded in order of decreasing reliability.
+    # Reliabilities can only decrease along a path, so the first label of the verifier
+    # that is taken from the heap belongs to the most reliable path within maxDepth hops.
+    while heap:
+        _, currentDepth, label = heapq.heappop(heap)
+        if not state.active[label]:
+            continue
+        node = state.node[label]
+        if state.identities[node] == verifierID:
+            # The most reliable path to the verifier was found! Return.
+            pathFound = True
+            finalRating = state.reliability[label]
+            path = state.path(state.parent[label])
+            LOGGER.info('Verifier path was found. TrustScore: %s with Path: %s', finalRating, (path + ',' + verifierID))
+            return pathFound, finalRating, entryPoint, path, entryPoints
+        if currentDepth >= maxDepth:
+            continue
+
+        identity = state.identities[node]
+        if identity not in EvidenceLists:
+            # Fetch the evidence lists of the next pending nodes with a single state request
+            pending = _nextPendingNodes(state, heap, identity, EvidenceLists, maxDepth, verifierID)
+            # Only prefetch as many nodes as the state read budget allows, the current node comes first
+            storedData = _readNodes(context, budget, storage_functions.getEvidenceDataForProvers, pending)
+            if storedData is None:
+                LOGGER.info('Search budget exhausted: %s', budget)
+                break
+            LOGGER.info('Loaded evidences for %s nodes', len(storedData))
+            EvidenceLists.update(storedData)
+
+        EvidenceList = EvidenceLists[identity]
+        if not EvidenceList:
+            LOGGER.info('Evidence List is empty')
+            continue
+        if isinstance(EvidenceList, tuple):
+            # The node was expanded before with another label, reuse the scores
+            parentIDs, scores = EvidenceList
+            if not budget.expandNode(len(parentIDs)):
+                LOGGER.info('Search budget exhausted: %s', budget)
+                break
+        else:
+            EvidenceList = storage_functions.parseEvidenceList(EvidenceList)
+            if not budget.expandNode(len(EvidenceList.Evidences)):
+                LOGGER.info('Search budget exhausted: %s', budget)
+                break
+            # Score all evidences of the node at once
+            # Evidences with a score of 0 are expired and deleted now. Thus they must not be expanded!
+            # The scores do not depend on the path, so only the verifiers and scores of the
+            # remaining evidences are kept and the parsed list is released.
+            scores = trust_query.scoreEvidenceList(context, EvidenceList)
+            positions = numpy.flatnonzero(scores > 0)
+            parentIDs = [EvidenceList.Evidences[position].VerifierIdentity for position in positions]
+            scores = array.array('d', scores[positions])
+            EvidenceLists[identity] = (parentIDs, scores)
+        reliability = state.reliability[label]
+        parentDepth = currentDepth + 1
+        for parentID, score in zip(parentIDs, scores):
+            parentScore = reliability * score
+            # Multiplying further scores can only lower the reliability, prune the partial path
+            if parentScore < minReliability:
                 continue
-            # For each evidence, add parent to visited with the resulting path and path score
-            for evidence in EvidenceList.Evidences:
-                newScore = trust_query.calculateEdgeTrustScore(context, evidence)
-                # If evidences with a score of 0 are still contained, they are deleted now. Thus they must not be added to visited[]!
-                if newScore == 0:
-                    LOGGER.info('Continuing...')
-                    continue
-                if currentDepth == 1:
-                    parentScore = newScore
-                else: 
-                    # Calculate new trust score
-                    parentScore = newScore * visited[node][0]
-                if ((evidence.VerifierIdentity == verifierID) and (parentScore >= minReliability)):
-                    # A path to the verifier was found! Return.
-                    pathFound = True
-                    finalRating = parentScore
-                    path = visited[evidence.ProverIdentity][2]
-                    LOGGER.info('Verifier path was found. TrustScore: %s with Path: %s', finalRating, (path + ',' + evidence.VerifierIdentity))
-                    return pathFound, finalRating, entryPoint, path
-
-                # A check is required to exclude cyclic paths back to a prover     
-                if (((evidence.VerifierIdentity in visited) == False) and (currentDepth < maxDepth)):
-                    visited[evidence.VerifierIdentity] = [parentScore, currentDepth, ((visited[evidence.ProverIdentity][2]) + ',' + evidence.VerifierIdentity)]
-                    newFringe.append(evidence.VerifierIdentity)
-        # Assign the new fringe and increase current depth
-        Fringe.clear()
-        Fringe.extend(newFringe)
-        newFringe.clear()
-        currentDepth +=1
+            # Nodes at maxDepth are only of interest if they are the verifier
+            if (parentDepth == maxDepth) and (parentID != verifierID):
+                continue
+            # Skip the partial path if a label of the parent is at least as close and as reliable.
+            # This also excludes cyclic paths back to a prover.
+            parentLabel = state.addParetoLabel(parentScore, parentDepth, state.intern(parentID), label)
+            if parentLabel >= 0:
+                heapq.heappush(heap, (-parentScore, parentDepth, parentLabel))
 
     # This part is only reached when no path between verifer and prover was found
-    # Calculate the optimal entryPoint here for the list of visited nodes:
-    entryPoint, finalRating, path = calculateEntryPoint(visited, minReliability)
+    # Calculate the optimal entryPoints here from the labels of the visited nodes
+    entryPoints = calculateEntryPoints(state, minReliability, entryPointCount)
+    if entryPoints:
+        entryPoint, finalRating, path = entryPoints[0]
 
-    return pathFound, finalRating, entryPoint, path
+    return pathFound, finalRating, entryPoint, path, entryPoints
 
+class _SearchState(object):
+    '''
+    Labels of a trust path search in column arrays.
+
+    Identities are interned to node indices. A label describes one partial path
+    from a node to the root of the search and is an index into the columns:
+    reliability[label] - path reliability from node to root
+    depth[label] - node depth
+    node[label] - node index
+    parent[label] - label of the next node towards root, -1 for the root
+    active[label] - 0 once the label is dominated by a better label of the same node
+    Path strings are only assembled for the result, not for every visited node.
+    '''
+    def __init__(self):
+        self.identities = []
+        self.nodeIndex = {}
+        self.reliability = array.array('d')
+        self.depth = array.array('i')
+        self.node = array.array('l')
+        self.parent = array.array('l')
+        self.active = bytearray()
+        # First label of each node and the next label of the same node, -1 ends the chain.
+        # Only labels that are not dominated by another label of the node are chained.
+        self.firstLabel = array.array('l')
+        self.nextLabel = array.array('l')
+
+    # Returns the node index of an identity
+    def intern(self, identity):
+        node = self.nodeIndex.get(identity)
+        if node is None:
+            node = len(self.identities)
+            self.nodeIndex[identity] = node
+            self.identities.append(identity)
+            self.firstLabel.append(-1)
+        return node
+
+    # Appends a label and chains it to the labels of its node
+    def addLabel(self, reliability, depth, node, parent):
+        label = len(self.reliability)
+        self.reliability.append(reliability)
+        self.depth.append(depth)
+        self.node.append(node)
+        self.parent.append(parent)
+        self.active.append(1)
+        self.nextLabel.append(self.firstLabel[node])
+        self.firstLabel[node] = label
+        return label
+
+    # Adds a label unless a label of the node is at least as close and as reliable
+    # Labels of the node that are dominated by the new label are deactivated
+    # Returns the new label or -1
+    def addParetoLabel(self, reliability, depth, node, parent):
+        other = self.firstLabel[node]
+        while other >= 0:
+            if (self.depth[other] <= depth) and (self.reliability[other] >= reliability):
+                return -1
+            other = self.nextLabel[other]
+        previous = -1
+        other = self.firstLabel[node]
+        while other >= 0:
+            following = self.nextLabel[other]
+            if (self.depth[other] >= depth) and (self.reliability[other] <= reliability):
+                self.active[other] = 0
+                if previous < 0:
+                    self.firstLabel[node] = following
+                else:
+                    self.nextLabel[previous] = following
+            else:
+                previous = other
+            other = following
+        return self.addLabel(reliability, depth, node, parent)
+
+    # Returns the node identities from a label back to the root
+    def chain(self, label):
+        identities = []
+        while label >= 0:
+            identities.append(self.identities[self.node[label]])
+            label = self.parent[label]
+        return identities
+
+    # Returns the path string root,...,node for a label
+    def path(self, label):
+        return ','.join(reversed(self.chain(label)))
+
+'''
+_buildPathBidirectional function for a search that expands from the prover and the verifier
+
+The prover side follows evidences backwards (prover -> verifier), the verifier side follows them
+forwards (verifier -> prover). Both sides are best-first searches with the Pareto labels of
+_buildPathBackward, in each step the side with fewer pending labels expands its most reliable label.
+Every new label is joined with the labels of its node on the other side to find the best meeting.
+The search stops once the most reliable pending labels of both sides cannot beat the best meeting,
+so the result is the most reliable path within SecurityParameter hops like for _buildPathBackward.
+
+Input and Output: see buildPath
+'''
+def _buildPathBidirectional(context, proverID, verifierID, SecurityParameter, minReliability, forwardSource, budget, entryPointCount):
+    backward = _SearchSide(proverID, verifierID, True, storage_functions.getEvidenceListsForProvers)
+    forward = _SearchSide(verifierID, proverID, False, forwardSource)
+    # Best meeting so far as [finalRating, label of the prover side, label of the verifier side]
+    best = [0, -1, -1]
+
+    while True:
+        # A side without pending labels has expanded all its paths, every meeting with them is known
+        bound = backward.top() * forward.top()
+        if (bound <= best[0]) or (bound < minReliability):
+            break
+        side, other = (backward, forward) if len(backward.heap) <= len(forward.heap) else (forward, backward)
+        newLabels = side.expand(context, SecurityParameter, minReliability, budget)
+        if newLabels is None:
+            LOGGER.info('Search budget exhausted: %s', budget)
+            break
+        for label in newLabels:
+            otherNode = other.state.nodeIndex.get(side.state.identities[side.state.node[label]])
+            if otherNode is None:
+                continue
+            otherLabel = other.state.firstLabel[otherNode]
+            while otherLabel >= 0:
+                if side.state.depth[label] + other.state.depth[otherLabel] <= SecurityParameter:
+                    if side is backward:
+                        _joinLabels(backward, forward, label, otherLabel, minReliability, best)
+                    else:
+                        _joinLabels(backward, forward, otherLabel, label, minReliability, best)
+                otherLabel = other.state.nextLabel[otherLabel]
+
+    # A meeting found before the budget ran out is reliable enough, though a better one may be left unexplored
+    if best[0] > 0:
+        finalRating = best[0]
+        path = ','.join(_joinPath(backward, forward, best[1], best[2])[:-1])
+        LOGGER.info('Verifier path was found. TrustScore: %s with Path: %s', finalRating, (path + ',' + verifierID))
+        return True, finalRating, None, path, []
+
+    # No path was found, determine the entryPoints from the prover side
+    entryPoints = calculateEntryPoints(backward.state, minReliability, entryPointCount)
+    if not entryPoints:
+        return False, 0, None, None, entryPoints
+    entryPoint, finalRating, path = entryPoints[0]
+    return False, finalRating, entryPoint, path, entryPoints
+
+class _SearchSide(object):
+    '''
+    One side of the bidirectional search.
+
+    Keeps the Pareto labels of the side, its pending labels in a heap and the scored evidences
+    of the expanded nodes. source(context, nodes) returns {node: EvidenceList or []} of the
+    evidences that lead away from the root of the side.
+    '''
+    def __init__(self, root, target, backwards, source):
+        self.state = _SearchState()
+        self.target = target
+        self.backwards = backwards
+        self.source = source
+        # Score of the last evidence of each label, the rating of the verifier side is multiplied
+        # again from the prover side when labels are joined
+        self.edgeScores = array.array('d', [1])
+        self.heap = [(-1, 0, self.state.addLabel(1, 0, self.state.intern(root), -1))]
+        # Evidence lists of the nodes, replaced by the neighbours and scores after the first expansion
+        self.evidenceLists = {}
+
+    # Returns the reliability of the most reliable pending label, 0 if none is left
+    def top(self):
+        while self.heap and not self.state.active[self.heap[0][2]]:
+            heapq.heappop(self.heap)
+        return -self.heap[0][0] if self.heap else 0
+
+    # Expands the most reliable pending label, returns the new labels or None if the budget is exhausted
+    def expand(self, context, maxDepth, minReliability, budget):
+        _, depth, label = heapq.heappop(self.heap)
+        state = self.state
+        identity = state.identities[state.node[label]]
+        if (depth >= maxDepth) or (identity == self.target):
+            return []
+        if identity not in self.evidenceLists:
+            pending = _nextPendingNodes(state, self.heap, identity, self.evidenceLists, maxDepth, self.target)
+            # Only prefetch as many nodes as the state read budget allows, the current node comes first
+            loaded = _readNodes(context, budget, self.source, pending)
+            if loaded is None:
+                return None
+            self.evidenceLists.update(loaded)
+
+        EvidenceList = self.evidenceLists[identity]
+        if not EvidenceList:
+            return []
+        if isinstance(EvidenceList, tuple):
+            neighborIDs, scores = EvidenceList
+            if not budget.expandNode(len(neighborIDs)):
+                return None
+        else:
+            if not budget.expandNode(len(EvidenceList.Evidences)):
+                return None
+            scores = trust_query.scoreEvidenceList(context, EvidenceList)
+            positions = numpy.flatnonzero(scores > 0)
+            if self.backwards:
+                neighborIDs = [EvidenceList.Evidences[position].VerifierIdentity for position in positions]
+            else:
+                neighborIDs = [EvidenceList.Evidences[position].ProverIdentity for position in positions]
+            scores = array.array('d', scores[positions])
+            self.evidenceLists[identity] = (neighborIDs, scores)
+
+        reliability = state.reliability[label]
+        neighborDepth = depth + 1
+        newLabels = []
+        for neighborID, score in zip(neighborIDs, scores):
+            neighborScore = reliability * score
+            # Multiplying further scores can only lower the reliability, prune the partial path
+            if neighborScore < minReliability:
+                continue
+            # Nodes at maxDepth are only of interest if they are the root of the other side
+            if (neighborDepth == maxDepth) and (neighborID != self.target):
+                continue
+            neighborLabel = state.addParetoLabel(neighborScore, neighborDepth, state.intern(neighborID), label)
+            if neighborLabel >= 0:
+                self.edgeScores.append(score)
+                heapq.heappush(self.heap, (-neighborScore, neighborDepth, neighborLabel))
+                newLabels.append(neighborLabel)
+        return newLabels
+
+# Joins a label of the prover side with a label of the verifier side at the same node
+# best is updated if the path fulfils minReliability, beats the best meeting and visits no node twice
+def _joinLabels(backward, forward, backLabel, forwardLabel, minReliability, best):
+    # Multiply the scores from the prover side like the search from the prover does
+    finalRating = backward.state.reliability[backLabel]
+    label = forwardLabel
+    while forward.state.parent[label] >= 0:
+        finalRating *= forward.edgeScores[label]
+        label = forward.state.parent[label]
+    if (finalRating < minReliability) or (finalRating <= best[0]):
+        return
+    nodes = _joinPath(backward, forward, backLabel, forwardLabel)
+    if len(set(nodes)) < len(nodes):
+        return
+    best[:] = [finalRating, backLabel, forwardLabel]
+
+# Assembles the node sequence prover, ..., meeting node, ..., verifier of two joined labels
+def _joinPath(backward, forward, backLabel, forwardLabel):
+    return list(reversed(backward.state.chain(backLabel))) + forward.state.chain(forwardLabel)[1:]
+
+# Returns the node of the label to expand and the nodes of the next pending labels whose evidences are not loaded yet,
+# so that they are fetched with a single state request. Only the labels popped next are considered, labels further
+# down the heap are often pruned before they are expanded. target is never expanded, None if any node can be.
+def _nextPendingNodes(state, heap, identity, evidenceLists, maxDepth, target):
+    pending = [identity]
+    for entry in heapq.nsmallest(PREFETCH_NODES, heap):
+        if state.active[entry[2]] and (entry[1] < maxDepth):
+            pendingID = state.identities[state.node[entry[2]]]
+            if (pendingID != target) and (pendingID not in evidenceLists):
+                pending.append(pendingID)
+    return list(collections.OrderedDict.fromkeys(pending))
+
+'''
+buildPathsFromVerifier function for establishing the paths from one verifier to several provers
+
+A single best-first search expands forwards from the verifier (verifier -> prover) until the most
+reliable path to every prover within SecurityParameter hops is known. Partial paths below the lowest
+minimal reliability of the provers that are not reached yet are pruned.
+
+Input:
+    context - current blockchain state
+    verifierID - verifier key or identity
+    targets - {proverID: minReliability} of the provers to establish a path to
+    SecurityParameter - maximum allowed hop distance (search depth)
+    forwardSource - verifier -> prover adjacency source, see buildPath
+    budget - optional SearchBudget, the search stops when it is exhausted
+Output:
+    results - {proverID: (finalRating, path)} of the provers with a path that fulfils their minReliability,
+              the path has the format of buildPath
 '''
-calculateEntryPoint function to determine the best possible graph entry point
+def buildPathsFromVerifier(context, verifierID, targets, SecurityParameter, forwardSource, budget=None):
+    results = {}
+    pending = dict(targets)
+    # Prover equals verifier
+    if verifierID in pending:
+        results[verifierID] = (1, None)
+        del pending[verifierID]
+    if not pending:
+        return results
+    if budget is None:
+        budget = SearchBudget()
+
+    # Labels of the partial paths from the verifier to a node and the score of their last evidence
+    state = _SearchState()
+    edgeScores = array.array('d', [1])
+    heap = [(-1, 0, state.addLabel(1, 0, state.intern(verifierID), -1))]
+    floor = min(pending.values())
+    # Evidence lists issued by the nodes, replaced by the provers and scores after the first expansion
+    IssuedLists = {}
+
+    # The first label of a prover that is taken from the heap belongs to its most reliable path
+    while heap and pending:
+        _, currentDepth, label = heapq.heappop(heap)
+        if not state.active[label]:
+            continue
+        identity = state.identities[state.node[label]]
+        if identity in pending:
+            finalRating = _chainReliability(state, edgeScores, label)
+            if finalRating >= pending[identity]:
+                results[identity] = (finalRating, ','.join(state.chain(label)[:-1]))
+                LOGGER.info('Path to %s was found. TrustScore: %s', identity, finalRating)
+            del pending[identity]
+            if not pending:
+                break
+            floor = min(pending.values())
+        if currentDepth >= SecurityParameter:
+            continue
+
+        if identity not in IssuedLists:
+            # Fetch the issued evidences of the next pending nodes with a single state request
+            fringe = _nextPendingNodes(state, heap, identity, IssuedLists, SecurityParameter, None)
+            loaded = _readNodes(context, budget, forwardSource, fringe)
+            if loaded is None:
+                LOGGER.info('Search budget exhausted: %s', budget)
+                break
+            IssuedLists.update(loaded)
+
+        EvidenceList = IssuedLists[identity]
+        if not EvidenceList:
+            continue
+        if isinstance(EvidenceList, tuple):
+            childIDs, scores = EvidenceList
+            if not budget.expandNode(len(childIDs)):
+                LOGGER.info('Search budget exhausted: %s', budget)
+                break
+        else:
+            if not budget.expandNode(len(EvidenceList.Evidences)):
+                LOGGER.info('Search budget exhausted: %s', budget)
+                break
+            scores = trust_query.scoreEvidenceList(context, EvidenceList)
+            positions = numpy.flatnonzero(scores > 0)
+            childIDs = [EvidenceList.Evidences[position].ProverIdentity for position in positions]
+            scores = array.array('d', scores[positions])
+            IssuedLists[identity] = (childIDs, scores)
+        reliability = state.reliability[label]
+        childDepth = currentDepth + 1
+        for childID, score in zip(childIDs, scores):
+            childScore = reliability * score
+            if childScore < floor:
+                continue
+            childLabel = state.addParetoLabel(childScore, childDepth, state.intern(childID), label)
+            if childLabel >= 0:
+                edgeScores.append(score)
+                heapq.heappush(heap, (-childScore, childDepth, childLabel))
+    return results
+
+# Multiplies the evidence scores of a path from the prover side, like the search from the prover does
+def _chainReliability(state, edgeScores, label):
+    reliability = 1
+    while state.parent[label] >= 0:
+        reliability *= edgeScores[label]
+        label = state.parent[label]
+    return reliability
+
+'''
+calculateEntryPoints function to determine the best possible graph entry points
+
+Candidates are the visited nodes whose path to the prover fulfils the minimal reliability
+requirement. They are ranked by:
+1. Furthest distance to prover
+2. Highest reliability for equal distances
+Ties are resolved in favour of the node that was visited first.
 
 Input: 
-    visited - list of visited candidate nodes
+    state - _SearchState with the labels of the visited nodes
     minReliability - minimum required reliability for resulting path
+    count - maximum number of entry points to return
 Output:
-    entryPoint - node the verifier needs to attest to enter the graph
+    entryPoints - ranked list of [entryPoint, reliability, path], empty if no node qualifies
 '''
-def calculateEntryPoint(visited, minReliability):
-    candidates = []
-    # Add all nodes that fulfil the minimal reliability requirement to the candidates list
-    for key, value in visited.items():
-        # Delete all candidates that do not fulfil the minimal reliability requirement
-        if value[0] > minReliability:
-            newCandidate = [key, value[0], value[1], value[2]]
-            candidates.append(newCandidate)
-    # Sort candidates in the following order: 
-    # 1. Furthest distance to prover 
-    candidates.sort(key=_getReliability, reverse = True)
-    # 2. Highest reliability for equal distances
-    candidates.sort(key=_getDepth, reverse= True)
-    LOGGER.info('Candidate found: %s out of all candidates: %s', candidates[0], candidates)
-
-    return _getNodeID(candidates[0]), _getReliability(candidates[0]), _getPath(candidates[0])
-
-# Getter functions for list elements
-def _getNodeID(elem):
-    return elem[0]
-
-def _getReliability(elem):
-    return elem[1]
-
-def _getDepth(elem):
-    return elem[2]
-
-def _getPath(elem):
-    return elem[3]
\ No newline at end of file
+def calculateEntryPoints(state, minReliability, count=1):
+    # Select the best count candidates with a bounded heap, O(n log count)
+    best = heapq.nlargest(max(1, count), _entryPointCandidates(state, minReliability),
+                          key=lambda label: (state.depth[label], state.reliability[label]))
+    if not best:
+        LOGGER.info('No entry point candidate fulfils the minimal reliability %s', minReliability)
+        return []
+    LOGGER.info('Candidates found: %s out of %s visited nodes', [state.identities[state.node[label]] for label in best], len(state.identities))
+
+    return [[state.identities[state.node[label]], state.reliability[label], state.path(label)] for label in best]
+
+# Yields the best label of each visited node that fulfils the minimal reliability requirement
+# Nodes are yielded in the order they were visited
+def _entryPointCandidates(state, minReliability):
+    for node in range(len(state.identities)):
+        candidate = -1
+        label = state.firstLabel[node]
+        while label >= 0:
+            if state.reliability[label] > minReliability and (candidate < 0 or
+                    (state.depth[label], state.reliability[label]) > (state.depth[candidate], state.reliability[candidate])):
+                candidate = label
+            label = state.nextLabel[label]
+        if candidate >= 0:
+            yield candidate
@@ -0,0 +1,382 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Trust reachability cache for hot trustors.
+
+For every registered hot trustor the state holds one entry per reachable
+prover with the best known trust path within SecurityParameter hops. An
+entry is an EvidenceList with the evidences of the path, starting with the
+evidence issued by the trustor. Its reliability is not stored but scored
+again when the entry is read, so the decay of the evidences always follows
+the current block time.
+
+New evidences are relaxed into the cache of every hot trustor and improved
+paths are propagated forwards over the reverse index. Deleted evidences
+remove the entries whose path ends with them, including the entries below
+them in the path tree. Every entry stays a valid path, a trust query of a
+hot trustor is answered with a single read if its entry is reliable enough.
+The provers with an entry are listed per trustor, unregistering a trustor
+deletes all of its entries.
+
+The caches are only updated by transactions whose declared outputs cover the
+cache of a trustor. A submission that does not declare them records its block
+time as cache miss of its expiry index shard instead. Every entry holds the
+block time of the state it was derived from, an entry that is not newer than
+the latest cache miss may miss a better path and the trust query falls back to
+the graph search, which stores its path as new entry.
+'''
+
+import logging
+import collections
+import heapq
+import itertools
+import numpy
+import evidence_pb2
+import address_calculator
+import storage_functions
+import block_info_functions
+import state_view
+import trust_query
+
+from sawtooth_sdk.processor.exceptions import InvalidTransaction
+from sawtooth_sdk.processor.exceptions import InternalError
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# Upper bound of registered hot trustors
+MAX_HOT_TRUSTORS = 16
+
+# Upper bound of nodes expanded by the propagation of new evidences in one transaction, over all
+# evidences and hot trustors, and by the seeding of one registered trustor
+# The cache keeps valid but possibly worse paths beyond
+MAX_PROPAGATION_NODES = 1000
+
+# Function to load the registered hot trustors
+def fetchHotTrustors(context):
+    return list(storage_functions.fetchIdentityList(context, address_calculator._assembleHotTrustorRegistryAddress()).Identities)
+
+# Scores a cached path at the current block time, the reliability is the product of its evidence scores
+def pathReliability(context, edges):
+    if not edges:
+        return 1.0
+    scores = trust_query.scoreEvidenceList(context, evidence_pb2.EvidenceList(Evidences=edges))
+    # Multiply from the prover side like the graph search
+    reliability = 1.0
+    for score in reversed(scores):
+        reliability *= float(score)
+    return reliability
+
+# Parses a stored cache entry or cache miss, missing data yields an empty message
+def _parseMessage(messageType, data):
+    message = messageType()
+    if data:
+        try:
+            message.ParseFromString(data)
+        except:
+            raise InternalError('Failed to load state data - reachability cache')
+    return message
+
+# Returns the cached path from a trustor to a prover, an entry without evidences if there is none
+# The entry of the trustor itself has no evidences and holds the time the cache was seeded
+def _fetchEntry(context, trustor, prover):
+    state_entries = context.get_state([address_calculator._assembleReachabilityAddress(trustor, prover)])
+    if state_entries == []:
+        return evidence_pb2.ReachabilityEntry()
+    return _parseMessage(evidence_pb2.ReachabilityEntry, state_entries[0].data)
+
+# Writes the cached path from a trustor to a prover, derived from the state at block time syncedAt
+def _storeEntry(context, trustor, prover, edges, syncedAt):
+    address = address_calculator._assembleReachabilityAddress(trustor, prover)
+    if context.get_state([address]) == []:
+        _indexEntry(context, trustor, prover)
+    written = context.set_state({address: evidence_pb2.ReachabilityEntry(Evidences=edges, SyncedAt=syncedAt).SerializeToString()})
+    # Check if data was actually written to addresses
+    if len(written) < 1:
+        raise InternalError("State Error")
+
+# Adds a prover to the list of cached provers of a trustor
+# Within a StateView the new provers are collected and written once per trustor by flushCacheIndex
+def _indexEntry(context, trustor, prover):
+    memo = getattr(context, 'memo', None)
+    if memo is None:
+        storage_functions._updateIdentityList(context, address_calculator._assembleReachabilityIndexAddress(trustor), added=[prover])
+        return
+    memo.setdefault('cachedProvers', collections.OrderedDict()).setdefault(trustor, []).append(prover)
+
+# Writes the provers that got a cached path in the transaction to the lists of their trustors
+def flushCacheIndex(context):
+    memo = getattr(context, 'memo', None)
+    if memo is None:
+        return
+    for trustor, provers in memo.pop('cachedProvers', {}).items():
+        storage_functions._updateIdentityList(context, address_calculator._assembleReachabilityIndexAddress(trustor), added=provers)
+
+# Returns the cache miss addresses of all expiry index shards
+def _cacheMissAddresses():
+    return [address_calculator._assembleCacheMissAddress(shard) for shard in range(address_calculator.EXPIRY_INDEX_SHARDS)]
+
+# Returns the latest cache miss of all shards from the stored data by address, 0 if there was none
+def _latestMiss(stored):
+    return max(_parseMessage(evidence_pb2.CacheMiss, stored.get(address)).Timestamp for address in _cacheMissAddresses())
+
+# Returns whether an entry was derived before the latest submission that left the caches behind
+def _isStale(context, entry):
+    stored = {stateEntry.address: stateEntry.data for stateEntry in context.get_state(_cacheMissAddresses())}
+    return entry.SyncedAt <= _latestMiss(stored)
+
+# Records the block time as cache miss of the shard of an evidence that was stored without updating the caches
+def _recordMiss(context, evidence):
+    shard = address_calculator._expiryShard(address_calculator._assembleEvidenceStorageAddress(evidence))
+    missAddress = address_calculator._assembleCacheMissAddress(shard)
+    timestamp = block_info_functions.readLastBlockTime(context)
+    state_entries = context.get_state([missAddress])
+    if state_entries and (_parseMessage(evidence_pb2.CacheMiss, state_entries[0].data).Timestamp >= timestamp):
+        return
+    written = context.set_state({missAddress: evidence_pb2.CacheMiss(Timestamp=timestamp).SerializeToString()})
+    # Check if data was actually written to addresses
+    if len(written) < 1:
+        raise InternalError("State Error")
+
+# Returns whether the transaction declared the cache of a trustor as output
+def _cacheWritable(context, trustor):
+    return state_view.canWrite(context, address_calculator._reachabilityPrefix(trustor))
+
+# Converts a cached path to the path format of the trust query events: prover, ..., last node before the trustor
+def _formatPath(edges):
+    return ','.join(reversed([evidence.ProverIdentity for evidence in edges]))
+
+'''
+Method to answer a trust query from the cache
+
+Input:
+    context - current blockchain state
+    trustor - querying device
+    trustee - device to establish trust in
+Output:
+    None if the trustor is not registered or has no current entry for the trustee,
+    otherwise the current reliability and the path of the entry
+'''
+def lookupPath(context, trustor, trustee):
+    registryAddress = address_calculator._assembleHotTrustorRegistryAddress()
+    entryAddress = address_calculator._assembleReachabilityAddress(trustor, trustee)
+    # Registry, entry and cache misses are read with a single state request
+    stored = {entry.address: entry.data for entry in context.get_state([registryAddress, entryAddress] + _cacheMissAddresses())}
+    if trustor not in storage_functions.parseIdentityList(stored.get(registryAddress)).Identities:
+        return None
+    entry = _parseMessage(evidence_pb2.ReachabilityEntry, stored.get(entryAddress))
+    if not entry.Evidences:
+        return None
+    # The entry may miss a better path of a later submission that did not update the caches
+    if entry.SyncedAt <= _latestMiss(stored):
+        LOGGER.info('Cached path of hot trustor %s for %s is stale', trustor, trustee)
+        return None
+    edges = list(entry.Evidences)
+    return pathReliability(context, edges), _formatPath(edges)
+
+# Returns the most reliable evidence of each hop of a path found by the graph search,
+# from the trustor to the trustee, or [] if a hop has no evidence
+def pathEvidences(context, trustor, path):
+    nodes = path.split(',') + [trustor]
+    evidenceLists = storage_functions.getEvidenceListsForProvers(context, nodes[:-1])
+    edges = []
+    for prover, verifier in reversed(list(zip(nodes[:-1], nodes[1:]))):
+        evidenceList = evidenceLists[prover]
+        if evidenceList == []:
+            return []
+        candidates = [evidence for evidence in evidenceList.Evidences if evidence.VerifierIdentity == verifier]
+        if not candidates:
+            return []
+        scores = trust_query.scoreEvidenceList(context, evidence_pb2.EvidenceList(Evidences=candidates))
+        edges.append(candidates[int(numpy.argmax(scores))])
+    return edges
+
+# Stores the path found by a trust query of a hot trustor, if it improves the cached path
+def storePath(context, trustor, trustee, path):
+    if trustor not in fetchHotTrustors(context):
+        return
+    edges = pathEvidences(context, trustor, path)
+    if not edges:
+        return
+    stored = _fetchEntry(context, trustor, trustee)
+    # The path was found in the current state, so it also replaces a stale entry that is as reliable
+    if (not stored.Evidences) or _isStale(context, stored) or (pathReliability(context, edges) > pathReliability(context, list(stored.Evidences))):
+        _storeEntry(context, trustor, trustee, edges, block_info_functions.readLastBlockTime(context))
+
+# Relaxes an evidence into the cache of a trustor, returns the new path if it improves the entry of its prover
+# The new entry is as current as the path it extends
+def _relax(context, trustor, edges, reliability, syncedAt, evidence, score):
+    prover = evidence.ProverIdentity
+    if (prover == trustor) or (score <= 0):
+        return None
+    candidate = reliability * score
+    stored = _fetchEntry(context, trustor, prover)
+    if stored.Evidences and (candidate <= pathReliability(context, list(stored.Evidences))):
+        return None
+    newEdges = edges + [evidence]
+    _storeEntry(context, trustor, prover, newEdges, syncedAt)
+    return newEdges, candidate, syncedAt
+
+# Propagates improved paths forwards over the reverse index, most reliable paths first
+# At most limit nodes are expanded, returns the number of expanded nodes
+def _propagate(context, trustor, improved, securityParameter, limit=MAX_PROPAGATION_NODES):
+    counter = itertools.count()
+    heap = [(-reliability, next(counter), edges, syncedAt) for edges, reliability, syncedAt in improved]
+    heapq.heapify(heap)
+    expanded = 0
+    while heap and (expanded < limit):
+        reliability, _, edges, syncedAt = heapq.heappop(heap)
+        if len(edges) >= securityParameter:
+            continue
+        node = edges[-1].ProverIdentity if edges else trustor
+        # Skip paths that were improved again after they were queued
+        if edges and (list(_fetchEntry(context, trustor, node).Evidences) != edges):
+            continue
+        issued = storage_functions.getIssuedEvidenceLists(context, [node])[node]
+        expanded += 1
+        if issued == []:
+            continue
+        scores = trust_query.scoreEvidenceList(context, issued)
+        for position in numpy.flatnonzero(scores > 0):
+            result = _relax(context, trustor, edges, -reliability, syncedAt, issued.Evidences[position], float(scores[position]))
+            if result is not None:
+                heapq.heappush(heap, (-result[1], next(counter), result[0], result[2]))
+    if heap:
+        LOGGER.info('Propagation for hot trustor %s stopped after %s nodes', trustor, expanded)
+    return expanded
+
+'''
+Method to update the caches of all hot trustors for a new evidence
+
+A transaction that does not declare the caches records a cache miss instead.
+
+Input:
+    context - current blockchain state
+    evidence - the stored evidence
+'''
+def evidenceAdded(context, evidence):
+    registered = fetchHotTrustors(context)
+    hotTrustors = [trustor for trustor in registered if _cacheWritable(context, trustor)]
+    if len(hotTrustors) < len(registered):
+        _recordMiss(context, evidence)
+    if not hotTrustors:
+        return
+    securityParameter = storage_functions.loadSecurityParameter(context)
+    score = float(trust_query.scoreEvidenceList(context, evidence_pb2.EvidenceList(Evidences=[evidence]))[0])
+    for trustor in hotTrustors:
+        # The path to the verifier, the entry of the trustor itself for its own evidences
+        parent = _fetchEntry(context, trustor, evidence.VerifierIdentity)
+        edges = list(parent.Evidences)
+        if (not edges) and (evidence.VerifierIdentity != trustor):
+            continue
+        if len(edges) >= securityParameter:
+            continue
+        result = _relax(context, trustor, edges, pathReliability(context, edges), parent.SyncedAt, evidence, score)
+        if result is not None:
+            _propagateInTransaction(context, trustor, result, securityParameter)
+
+# Propagates an improved path within the propagation budget of the transaction
+def _propagateInTransaction(context, trustor, improved, securityParameter):
+    memo = getattr(context, 'memo', None)
+    if memo is None:
+        _propagate(context, trustor, [improved], securityParameter)
+        return
+    limit = MAX_PROPAGATION_NODES - memo.get('propagatedNodes', 0)
+    memo['propagatedNodes'] = memo.get('propagatedNodes', 0) + _propagate(context, trustor, [improved], securityParameter, limit)
+
+'''
+Method to remove the cached paths that use deleted evidences
+
+Input:
+    context - current blockchain state
+    evidences - the deleted evidences of one prover
+'''
+def evidencesDeleted(context, evidences):
+    hotTrustors = [trustor for trustor in fetchHotTrustors(context) if _cacheWritable(context, trustor)]
+    if not hotTrustors:
+        return
+    deleted = set(evidence.SerializeToString() for evidence in evidences)
+    prover = evidences[0].ProverIdentity
+    for trustor in hotTrustors:
+        edges = _fetchEntry(context, trustor, prover).Evidences
+        if edges and (edges[-1].SerializeToString() in deleted):
+            _invalidateSubtree(context, trustor, prover)
+
+# Deletes the entry of a prover and all entries whose path continues from it
+def _invalidateSubtree(context, trustor, prover):
+    pending = [prover]
+    invalidated = [address_calculator._assembleReachabilityAddress(trustor, prover)]
+    while pending:
+        node = pending.pop()
+        attested = storage_functions.fetchIdentityList(context, address_calculator._assembleReverseIndexAddress(node)).Identities
+        for child in attested:
+            edges = _fetchEntry(context, trustor, child).Evidences
+            address = address_calculator._assembleReachabilityAddress(trustor, child)
+            if edges and (edges[-1].VerifierIdentity == node) and (address not in invalidated):
+                invalidated.append(address)
+                pending.append(child)
+    context.delete_state(invalidated)
+    LOGGER.info('Invalidated %s cached paths of hot trustor %s', len(invalidated), trustor)
+
+'''
+Handling of a hot trustor registration
+
+Registered trustors get their cache seeded with the paths to all provers within SecurityParameter hops,
+their own entry holds the block time of the seeding.
+Unregistered trustors lose all of their cached paths.
+
+Input:
+    context - current blockchain state
+    trustors - IdentityList with the trustors to register
+    sender - sender public key
+    register - True to register, False to unregister the trustors
+Output:
+    hot_trustors - event with the registered trustors
+'''
+def handleHotTrustorRegistration(context, trustors, sender, register=True):
+    LOGGER.info('Hot trustor registration received from %s.', sender)
+
+    registryAddress = address_calculator._assembleHotTrustorRegistryAddress()
+    hotTrustors = fetchHotTrustors(context)
+    if register:
+        added = [trustor for trustor in collections.OrderedDict.fromkeys(trustors.Identities) if trustor not in hotTrustors]
+        if len(hotTrustors) + len(added) > MAX_HOT_TRUSTORS:
+            raise InvalidTransaction('Registration exceeds the maximum of {} hot trustors'.format(MAX_HOT_TRUSTORS))
+        for trustor in added:
+            if not storage_functions.fetchAdminIndex(context).isDevice(trustor):
+                raise InvalidTransaction('Trustor Assertion Error')
+        storage_functions._updateIdentityList(context, registryAddress, added=added)
+        securityParameter = storage_functions.loadSecurityParameter(context)
+        timestamp = block_info_functions.readLastBlockTime(context)
+        for trustor in added:
+            # The seeded cache is derived from the current state
+            _storeEntry(context, trustor, trustor, [], timestamp)
+            _propagate(context, trustor, [([], 1.0, timestamp)], securityParameter)
+    else:
+        removed = [trustor for trustor in collections.OrderedDict.fromkeys(trustors.Identities) if trustor in hotTrustors]
+        storage_functions._updateIdentityList(context, registryAddress, removed=removed)
+        for trustor in removed:
+            _deleteCache(context, trustor)
+
+    context.add_event(
+            event_type="attestation/hot_trustors",
+            attributes=[("trustors", ','.join(fetchHotTrustors(context)))])
+
+# Deletes all cached paths of a trustor and their list
+def _deleteCache(context, trustor):
+    indexAddress = address_calculator._assembleReachabilityIndexAddress(trustor)
+    provers = storage_functions.fetchIdentityList(context, indexAddress).Identities
+    context.delete_state([address_calculator._assembleReachabilityAddress(trustor, prover) for prover in provers] + [indexAddress])
+    LOGGER.info('Deleted %s cached paths of hot trustor %s', len(provers), trustor)
@@ -0,0 +1,114 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Transaction-scoped view on the global state.
+
+A StateView wraps the Sawtooth context for the duration of one apply call.
+All known input addresses are fetched with a single get_state round trip
+and later reads are answered from memory. Writes are passed through to the
+validator and mirrored in the view, so reads always see the latest value.
+'''
+
+import logging
+import collections
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# Same shape as the entries returned by the Sawtooth context
+StateEntry = collections.namedtuple('StateEntry', ['address', 'data'])
+
+class StateView(object):
+    '''
+    Drop-in replacement for the Sawtooth context inside an apply call.
+    '''
+    def __init__(self, context):
+        self._context = context
+        # address -> raw data, b'' for addresses known to be empty
+        self._entries = {}
+        self.roundTrips = 0
+        # Values derived from state that stay fixed for the transaction, e.g. the block time
+        self.memo = {}
+
+    def prefetch(self, addresses):
+        '''Load all addresses that are not known yet with a single get_state.'''
+        missing = [address for address in collections.OrderedDict.fromkeys(addresses)
+                   if address not in self._entries]
+        if not missing:
+            return
+        self.roundTrips += 1
+        for address in missing:
+            self._entries[address] = b''
+        for entry in self._context.get_state(missing):
+            self._entries[entry.address] = entry.data
+
+    def get_state(self, addresses, timeout=None):
+        '''Return the entries with a value, like the Sawtooth context does.'''
+        self.prefetch(addresses)
+        return [StateEntry(address, self._entries[address])
+                for address in addresses if self._entries[address]]
+
+    def set_state(self, entries, timeout=None):
+        addresses = self._context.set_state(entries, timeout)
+        self._entries.update(entries)
+        return addresses
+
+    def delete_state(self, addresses, timeout=None):
+        deleted = self._context.delete_state(addresses, timeout)
+        for address in addresses:
+            self._entries[address] = b''
+        return deleted
+
+    def add_event(self, event_type, attributes=None, data=None, timeout=None):
+        return self._context.add_event(event_type, attributes, data, timeout)
+
+    def add_receipt_data(self, data, timeout=None):
+        return self._context.add_receipt_data(data, timeout)
+
+# Marks the transaction as read-only, state derived on the way (deletions of expired
+# evidences, memo and cache updates) is not written, the expiry sweep cleans up instead
+def setReadOnly(context):
+    memo = getattr(context, 'memo', None)
+    if memo is not None:
+        memo['readOnly'] = True
+
+# Returns whether the transaction must not write to the state
+def isReadOnly(context):
+    memo = getattr(context, 'memo', None)
+    return (memo is not None) and memo.get('readOnly', False)
+
+# Records the output addresses declared by the transaction header
+def setOutputs(context, outputs):
+    memo = getattr(context, 'memo', None)
+    if memo is not None:
+        memo['outputs'] = list(outputs)
+
+# Returns whether the declared outputs cover an address or address prefix, writes outside would fail
+# authorization, derived state like the caches of hot trustors is only updated where it is covered
+def canWrite(context, address):
+    if isReadOnly(context):
+        return False
+    memo = getattr(context, 'memo', None)
+    if (memo is None) or ('outputs' not in memo):
+        return True
+    return any(address.startswith(prefix) for prefix in memo['outputs'])
+
+# Selects the addresses that can be fetched up front for a transaction
+# Only addresses covered by the declared inputs are returned, all others would fail authorization
+def prefetchAddresses(inputs, knownAddresses):
+    candidates = [address for address in inputs if len(address) == 70]
+    candidates.extend(knownAddresses)
+    return [address for address in candidates
+            if any(address.startswith(prefix) for prefix in inputs)]
@@ -14,6 +14,7 @@
 # -----------------------------------------------------------------------------
 
 import logging
+import collections
 import block_info_pb2
 import block_info_functions
 import evidence_pb2
@@ -23,6 +24,11 @@ import devices_pb2
 import warrants_pb2
 import systemconfig_pb2
 import address_calculator
+import admin_cache
+import admin_index
+import reachability_cache
+import trust_memo
+import state_view
 
 from sawtooth_sdk.processor.handler import TransactionHandler
 from sawtooth_sdk.processor.exceptions import InvalidTransaction
@@ -37,72 +43,77 @@ properties_address = '5a7526b8d9d9581e82c7c8ec2cb2614bd8da7334cc1335838dd7ad275b
 system_config_address = '5a7526f43437fca1d5f3d0381073ed3eec9ae42bf86988559e98009795a969919cbeca'
 devices_address = '5a75264f03016f8dfef256580a4c6fdeeb5aa0ca8b4068e816a677e908c95b3bdd2150'
 warrants_address = '5a752639c6f558e7151b5f83e4c1763d427cd0fef5192d2c86ea3db7c5bc1f1546f9ba'
+administration_addresses = [policy_address, properties_address, system_config_address, devices_address, warrants_address]
 
-# Function to load the global policy list
-def fetchPolicyList(context):
-    state_entries = context.get_state([policy_address])
-    policyList = policies_pb2.PolicyList()
+# Loads and parses an administration database
+# Parsed databases are shared between transactions as long as the raw state data is unchanged
+def _fetchAdminEntry(context, address, messageType, errorMessage):
+    state_entries = context.get_state([address])
     try:
-        StoredPolicyList = state_entries[0].data
-        policyList.ParseFromString(StoredPolicyList)
+        StoredData = state_entries[0].data
+        return admin_cache.ADMIN_CACHE.parse(address, StoredData, messageType)
     except:
-        raise InternalError('Failed to load policy list')
-    return policyList
+        raise InternalError(errorMessage)
+
+# Function to load the global policy list
+def fetchPolicyList(context):
+    return _fetchAdminEntry(context, policy_address, policies_pb2.PolicyList, 'Failed to load policy list')
 
 # Function to load the global properties list
 def fetchPropertiesList(context):
-    state_entries = context.get_state([properties_address])
-    propertiesList = properties_pb2.PropertiesList()
-    try:
-        StoredPropertiesList = state_entries[0].data
-        propertiesList.ParseFromString(StoredPropertiesList)
-    except:
-        raise InternalError('Failed to load properties list')
-    return propertiesList
+    return _fetchAdminEntry(context, properties_address, properties_pb2.PropertiesList, 'Failed to load properties list')
 
 # Function to load the global system config
 def fetchSystemConfig(context):
-    state_entries = context.get_state([system_config_address])
-    SystemConfig = systemconfig_pb2.Systemconfig()
-    try:
-        StoredSystemConfig = state_entries[0].data
-        SystemConfig.ParseFromString(StoredSystemConfig)
-    except:
-        raise InternalError('Failed to load system config')
-    return SystemConfig
+    return _fetchAdminEntry(context, system_config_address, systemconfig_pb2.Systemconfig, 'Failed to load system config')
 
 # Function to load the global device list
 def fetchDeviceList(context):
-    state_entries = context.get_state([devices_address])
-    deviceList = devices_pb2.DeviceList()
-    try:
-        StoredDeviceList = state_entries[0].data
-        deviceList.ParseFromString(StoredDeviceList)
-    except:
-        raise InternalError('Failed to load device list')
-    return deviceList
+    return _fetchAdminEntry(context, devices_address, devices_pb2.DeviceList, 'Failed to load device list')
 
 # Function to load the global warrant list
 def fetchWarrantList(context):
-    state_entries = context.get_state([warrants_address])
-    warrantList = warrants_pb2.WarrantList()
-    try:
-        StoredWarrantList = state_entries[0].data
-        warrantList.ParseFromString(StoredWarrantList)
-    except:
-        raise InternalError('Failed to load warrant list')
-    return warrantList
+    return _fetchAdminEntry(context, warrants_address, warrants_pb2.WarrantList, 'Failed to load warrant list')
+
+# Function to load the hash index over the global device, policy, warrant and properties lists
+# The lists are not written by attestation transactions, within a StateView the index is loaded once per transaction
+def fetchAdminIndex(context):
+    memo = getattr(context, 'memo', None)
+    if memo is None:
+        return _loadAdminIndex(context)
+    if 'adminIndex' not in memo:
+        memo['adminIndex'] = _loadAdminIndex(context)
+    return memo['adminIndex']
+
+# The index is built once per version of the four lists and shared between transactions
+def _loadAdminIndex(context):
+    indexAddresses = [devices_address, policy_address, warrants_address, properties_address]
+    indexTypes = [devices_pb2.DeviceList, policies_pb2.PolicyList, warrants_pb2.WarrantList, properties_pb2.PropertiesList]
+    state_entries = context.get_state(indexAddresses)
+    storedData = {}
+    for entry in state_entries:
+        if entry.data:
+            storedData[entry.address] = entry.data
+
+    def build():
+        lists = []
+        for address, messageType in zip(indexAddresses, indexTypes):
+            if address in storedData:
+                try:
+                    lists.append(admin_cache.ADMIN_CACHE.parse(address, storedData[address], messageType))
+                except:
+                    raise InternalError('Failed to load administration list')
+            else:
+                lists.append(None)
+        return admin_index.AdminIndex(*lists)
+
+    key = ('index',) + tuple(admin_cache.stateDigest(storedData[address]) if address in storedData else None
+                             for address in indexAddresses)
+    return admin_cache.ADMIN_CACHE.lookup(key, build)
 
 # Loads the right entry for evidence properties
 def findEvidenceProperties(context, evidence):
-    propertiesList = fetchPropertiesList(context)
-    if propertiesList == []:
-        LOGGER.info('Properties List is empty')
-    else:
-        for properties in propertiesList.Properties:
-            if (evidence.AttestationType == properties.AttestationType):
-                return properties
-    return 
+    return fetchAdminIndex(context).lookupProperties(evidence.AttestationType)
 
 # Load the global Security Parameter
 def loadSecurityParameter(context):
@@ -114,45 +125,232 @@ def loadSecurityParameter(context):
     return SecurityParameter
 
 # Delete an evidence from the global state
+# Within a StateView the deletion is deferred: expired evidences are collected per prover
+# and written back once per prover by flushEvidenceDeletions at the end of the transaction
 def _deleteEvidence(context, evidence):
-    address = address_calculator._assembleEvidenceStorageAddress(evidence)
-    state_entries = context.get_state([address])
-    evidenceList = evidence_pb2.EvidenceList()
+    prover = evidence.ProverIdentity
+    # Read-only transactions leave expired evidences to the expiry sweep
+    if state_view.isReadOnly(context):
+        return
+    memo = getattr(context, 'memo', None)
+    if memo is None:
+        _deleteProverEvidences(context, prover, {evidence.SerializeToString(): evidence})
+        return
+    # Keyed by the serialized evidence, an evidence that expires twice in a transaction is deleted once
+    pending = memo.setdefault('expiredEvidences', collections.OrderedDict())
+    pending.setdefault(prover, collections.OrderedDict())[evidence.SerializeToString()] = evidence
 
-    newEvidenceList = evidence_pb2.EvidenceList()
+# Writes the deferred evidence deletions of the transaction, one state write and one event per prover
+# Invalidating cached paths scores their evidences again and can defer further deletions,
+# so the deletions are written until none are left, every evidence is deleted at most once
+def flushEvidenceDeletions(context):
+    memo = getattr(context, 'memo', None)
+    if memo is None:
+        return
+    flushed = set()
+    while memo.get('expiredEvidences'):
+        pending = memo.pop('expiredEvidences')
+        for prover, evidences in pending.items():
+            evidences = collections.OrderedDict((key, evidence) for key, evidence in evidences.items() if key not in flushed)
+            flushed.update(evidences)
+            if evidences:
+                _deleteProverEvidences(context, prover, evidences)
 
-    if state_entries != []: 
-        try:
-            StoredEvidenceList = state_entries[0].data
-            evidenceList.ParseFromString(StoredEvidenceList)
-        except:
-            raise InternalError('Failed to load state data - deleteEvidence')
-        
-        for currentEvidence in evidenceList.Evidences:
-                if (currentEvidence != evidence):
-                    newEvidenceList.Evidences.extend([currentEvidence])
-        
-    state_data = newEvidenceList.SerializeToString()
-    addresses = context.set_state({address: state_data})
-
-    # check if data was actually written to addresses
-    if len(addresses) < 1:
-        raise InternalError("State Error")
-    # Add event submission
+# Removes evidences of a prover from its legacy list and from the edge lists of their verifiers
+def _deleteProverEvidences(context, prover, evidences):
+    addresses = [address_calculator._assembleAddress(prover)]
+    addresses.extend(collections.OrderedDict.fromkeys(
+            address_calculator._assembleEvidenceStorageAddress(evidence) for evidence in evidences.values()))
+    _deleteEvidences(context, addresses, evidences)
+
+# Removes evidences from the lists stored at several addresses of one prover
+# evidences maps the serialized evidence to the evidence
+# Emptied lists are deleted, the verifier of an emptied edge list is removed from the manifest
+def _deleteEvidences(context, addresses, evidences):
+    evidenceLists = getEvidenceListsFromAddresses(context, addresses)
+    entries = {}
+    emptied = []
+    removedVerifiers = []
+    deleted = []
+    for address, evidenceList in evidenceLists.items():
+        if evidenceList == []:
+            continue
+        kept = [currentEvidence for currentEvidence in evidenceList.Evidences
+                if currentEvidence.SerializeToString() not in evidences]
+        if len(kept) == len(evidenceList.Evidences):
+            continue
+        deleted.extend(currentEvidence for currentEvidence in evidenceList.Evidences
+                       if currentEvidence.SerializeToString() in evidences)
+        if kept:
+            entries[address] = evidence_pb2.EvidenceList(Evidences=kept).SerializeToString()
+        else:
+            emptied.append(address)
+            if address != address_calculator._assembleAddress(evidenceList.Evidences[0].ProverIdentity):
+                removedVerifiers.append(evidenceList.Evidences[0].VerifierIdentity)
+    if not deleted:
+        return
+
+    if entries:
+        written = context.set_state(entries)
+        # check if data was actually written to addresses
+        if len(written) < len(entries):
+            raise InternalError("State Error")
+    if emptied:
+        context.delete_state(emptied)
+    prover = str(deleted[0].ProverIdentity)
+    if removedVerifiers:
+        _unregisterEdges(context, prover, removedVerifiers)
+
+    # Cached trust paths of hot trustors and trust memos must not use the deleted evidences
+    reachability_cache.evidencesDeleted(context, deleted)
+    trust_memo.evidencesDeleted(context, deleted)
+
+    # Add one summary event for all deleted evidences of the prover
+    verifiers = collections.OrderedDict.fromkeys(str(evidence.VerifierIdentity) for evidence in deleted)
+    LOGGER.info('Deleted %s expired evidences of prover %s', len(deleted), prover)
     context.add_event(
             event_type="attestation/evidence_deletion",
-            attributes=[("verifier", str(evidence.VerifierIdentity)), ("prover", str(evidence.ProverIdentity))])
+            attributes=[("prover", prover), ("verifiers", ','.join(verifiers)), ("count", str(len(deleted)))])
 
-# Function to load an evidence list for a storage address
-def getEvidenceListFromAddress(context, address):
+# Function to load the IdentityList at an address, e.g. the manifest of a prover or the reverse index of a verifier
+def fetchIdentityList(context, address):
     state_entries = context.get_state([address])
     if state_entries == []:
-        evidenceList = []
-    else:   
+        return evidence_pb2.IdentityList()
+    return parseIdentityList(state_entries[0].data)
+
+# Function to parse a serialized IdentityList, empty data yields an empty list
+def parseIdentityList(data):
+    identities = evidence_pb2.IdentityList()
+    if data:
         try:
-            StoredEvidenceList = state_entries[0].data
-            evidenceList = evidence_pb2.EvidenceList()
-            evidenceList.ParseFromString(StoredEvidenceList)
+            identities.ParseFromString(data)
         except:
-            raise InternalError('Failed to load state data - getEvidenceFromAddress')
+            raise InternalError('Failed to load state data - identity list')
+    return identities
+
+# Adds and removes identities in the IdentityList at an address, the entry is deleted once it is empty
+def _updateIdentityList(context, address, added=(), removed=()):
+    stored = fetchIdentityList(context, address)
+    identities = collections.OrderedDict.fromkeys(stored.Identities)
+    identities.update(collections.OrderedDict.fromkeys(added))
+    for identity in removed:
+        identities.pop(identity, None)
+    if list(identities) == list(stored.Identities):
+        return
+    if not identities:
+        context.delete_state([address])
+        return
+    written = context.set_state({address: evidence_pb2.IdentityList(Identities=list(identities)).SerializeToString()})
+    # Check if data was actually written to addresses
+    if len(written) < 1:
+        raise InternalError("State Error")
+
+# Registers new edge lists of a prover in its manifest and in the reverse index of each verifier
+def _registerEdges(context, prover, verifiers):
+    _updateIdentityList(context, address_calculator._assembleManifestAddress(prover), added=verifiers)
+    for verifier in verifiers:
+        _updateIdentityList(context, address_calculator._assembleReverseIndexAddress(verifier), added=[prover])
+
+# Registers new edge lists given as (prover, verifier) pairs, every manifest and reverse index is written once
+def _registerEdgeBatch(context, edges):
+    verifiersOfProvers = collections.OrderedDict()
+    proversOfVerifiers = collections.OrderedDict()
+    for prover, verifier in edges:
+        verifiersOfProvers.setdefault(prover, []).append(verifier)
+        proversOfVerifiers.setdefault(verifier, []).append(prover)
+    manifestAddresses = [address_calculator._assembleManifestAddress(prover) for prover in verifiersOfProvers]
+    reverseIndexAddresses = [address_calculator._assembleReverseIndexAddress(verifier) for verifier in proversOfVerifiers]
+    # Load all identity lists with a single state request
+    context.get_state(manifestAddresses + reverseIndexAddresses)
+    for address, verifiers in zip(manifestAddresses, verifiersOfProvers.values()):
+        _updateIdentityList(context, address, added=verifiers)
+    for address, provers in zip(reverseIndexAddresses, proversOfVerifiers.values()):
+        _updateIdentityList(context, address, added=provers)
+
+# Removes emptied edge lists of a prover from its manifest and from the reverse index of each verifier
+def _unregisterEdges(context, prover, verifiers):
+    _updateIdentityList(context, address_calculator._assembleManifestAddress(prover), removed=verifiers)
+    for verifier in verifiers:
+        _updateIdentityList(context, address_calculator._assembleReverseIndexAddress(verifier), removed=[prover])
+
+# Function to load the serialized evidences of several provers
+# The legacy lists and manifests are read with one state request, the listed edge lists with a second one.
+# Serialized evidence lists concatenate to their merged list, every prover is mapped to the data
+# of one EvidenceList, b'' for provers without stored evidences
+def getEvidenceDataForProvers(context, provers):
+    legacyAddresses = collections.OrderedDict((prover, address_calculator._assembleAddress(prover)) for prover in provers)
+    manifestAddresses = {prover: address_calculator._assembleManifestAddress(prover) for prover in legacyAddresses}
+    stored = getEvidenceDataFromAddresses(context, list(legacyAddresses.values()) + list(manifestAddresses.values()))
+
+    edgeAddresses = {prover: [address_calculator._assembleEdgeAddress(prover, verifier)
+                              for verifier in parseIdentityList(stored[manifestAddresses[prover]]).Identities]
+                     for prover in legacyAddresses}
+    edgeData = getEvidenceDataFromAddresses(context, [address for addresses in edgeAddresses.values() for address in addresses])
+    return {prover: stored[legacyAddresses[prover]] + b''.join(edgeData[address] for address in edgeAddresses[prover])
+            for prover in legacyAddresses}
+
+# Function to load the evidence lists of several provers, provers without evidences are mapped to []
+def getEvidenceListsForProvers(context, provers):
+    evidenceData = getEvidenceDataForProvers(context, provers)
+    return {prover: parseEvidenceList(data) for prover, data in evidenceData.items()}
+
+# Function to load an evidence list for a storage address
+def getEvidenceListFromAddress(context, address):
+    return getEvidenceListsFromAddresses(context, [address])[address]
+
+# Function to load the evidence lists for several storage addresses with a single state request
+# Addresses without stored evidences are mapped to an empty list []
+def getEvidenceListsFromAddresses(context, addresses):
+    evidenceData = getEvidenceDataFromAddresses(context, addresses)
+    return {address: parseEvidenceList(data) for address, data in evidenceData.items()}
+
+# Function to load the serialized evidence lists for several storage addresses with a single state request
+# Addresses without stored evidences are mapped to empty data b''
+def getEvidenceDataFromAddresses(context, addresses):
+    evidenceData = collections.OrderedDict((address, b'') for address in addresses)
+    if not evidenceData:
+        return evidenceData
+    state_entries = context.get_state(list(evidenceData))
+    for entry in state_entries:
+        evidenceData[entry.address] = entry.data
+    return evidenceData
+
+# Function to parse a serialized evidence list, empty data yields an empty list []
+def parseEvidenceList(data):
+    if not data:
+        return []
+    try:
+        evidenceList = evidence_pb2.EvidenceList()
+        evidenceList.ParseFromString(data)
+    except:
+        raise InternalError('Failed to load state data - getEvidenceFromAddress')
     return evidenceList
+
+# Function to load the evidences issued by several verifiers, the forwardSource of the bidirectional search
+# The reverse indexes are read with one state request, the listed edge lists with a second one.
+# Lists of the legacy layout are not covered by the reverse index
+def getIssuedEvidenceLists(context, verifiers):
+    reverseAddresses = collections.OrderedDict((verifier, address_calculator._assembleReverseIndexAddress(verifier)) for verifier in verifiers)
+    stored = getEvidenceDataFromAddresses(context, list(reverseAddresses.values()))
+
+    edgeAddresses = {verifier: [address_calculator._assembleEdgeAddress(prover, verifier)
+                                for prover in parseIdentityList(stored[address]).Identities]
+                     for verifier, address in reverseAddresses.items()}
+    edgeData = getEvidenceDataFromAddresses(context, [address for addresses in edgeAddresses.values() for address in addresses])
+    return {verifier: parseEvidenceList(b''.join(edgeData[address] for address in edgeAddresses[verifier]))
+            for verifier in reverseAddresses}
+
+# Function to load the evidences of given prover and verifier pairs with a single state request
+# The edge list and the legacy list of the prover are read, only evidences of the verifier are kept.
+# Every (prover, verifier) pair is mapped to an EvidenceList, [] if the verifier has no evidence for the prover
+def getEvidenceListsForEdges(context, edges):
+    edgeAddresses = collections.OrderedDict(((prover, verifier), (address_calculator._assembleAddress(prover), address_calculator._assembleEdgeAddress(prover, verifier)))
+                                            for prover, verifier in edges)
+    stored = getEvidenceDataFromAddresses(context, [address for addresses in edgeAddresses.values() for address in addresses])
+    evidenceLists = {}
+    for (prover, verifier), addresses in edgeAddresses.items():
+        evidenceList = parseEvidenceList(b''.join(stored[address] for address in addresses))
+        evidences = [evidence for evidence in evidenceList.Evidences if evidence.VerifierIdentity == verifier] if evidenceList != [] else []
+        evidenceLists[(prover, verifier)] = evidence_pb2.EvidenceList(Evidences=evidences) if evidences else []
+    return evidenceLists
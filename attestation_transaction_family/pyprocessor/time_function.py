@@ -0,0 +1,133 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Compiler for the TimeFunction of the attestation properties.
+
+A TimeFunction is an arithmetic expression of the evidence age x, e.g.
+"-0.003333333*x + 1.2". The expression is checked against a whitelist of
+AST nodes, compiled once and cached by its string, so scoring an edge
+costs a function call instead of a Python compile.
+'''
+
+import ast
+import logging
+import textwrap
+import functools
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# AST nodes a TimeFunction may consist of
+# ast.Num is produced by the parser of Python versions before 3.8
+ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Load,
+                 ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+                 ast.UAdd, ast.USub)
+ALLOWED_NODES += tuple(getattr(ast, name) for name in ('Num', 'Constant') if hasattr(ast, name))
+
+# Name of the only variable, the evidence age
+VARIABLE_NAME = 'x'
+
+# Upper bound of the absolute value of an exponent and of the degree of x of the whole expression,
+# exponents must be integer constants
+MAX_DEGREE = 8
+
+class TimeFunctionError(Exception):
+    '''Raised for TimeFunction strings that are not plain arithmetic of x.'''
+    pass
+
+'''
+compileTimeFunction function to turn a TimeFunction string into a callable
+
+Input:
+    timeFunction - expression string from the attestation properties
+Output:
+    function - callable of the evidence age x returning the time-based trust score
+Raises:
+    TimeFunctionError - expression contains anything but arithmetic of x and numbers,
+                        an exponent that is not an integer constant up to MAX_DEGREE,
+                        a power of a power or a degree of x above MAX_DEGREE
+    The returned function raises TimeFunctionError for arithmetic errors, e.g. a division by zero
+'''
+@functools.lru_cache(maxsize=128)
+def compileTimeFunction(timeFunction):
+    try:
+        tree = ast.parse(_dedent_string(timeFunction), mode='eval')
+    except SyntaxError as err:
+        raise TimeFunctionError('Invalid time function syntax: {}'.format(err))
+    _validate_tree(tree)
+    code = compile(tree, '<TimeFunction>', 'eval')
+    LOGGER.info('Compiled time function: %s', timeFunction)
+
+    def function(x):
+        try:
+            return eval(code, {'__builtins__': {}}, {VARIABLE_NAME: x})
+        except ArithmeticError as err:
+            raise TimeFunctionError('Arithmetic error in time function: {}'.format(err))
+    return function
+
+# Checks that every node of the expression is part of the whitelist and that its degree is bounded
+def _validate_tree(tree):
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise TimeFunctionError('Node not allowed in time function: {}'.format(type(node).__name__))
+        if isinstance(node, ast.Name) and node.id != VARIABLE_NAME:
+            raise TimeFunctionError('Unknown variable in time function: {}'.format(node.id))
+        if (isinstance(node, getattr(ast, 'Constant', ())) and
+                (isinstance(node.value, bool) or not isinstance(node.value, (int, float)))):
+            raise TimeFunctionError('Only numeric constants are allowed in time function')
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = _constantValue(node.right)
+            if (not isinstance(exponent, int)) or isinstance(exponent, bool) or (abs(exponent) > MAX_DEGREE):
+                raise TimeFunctionError('Exponents must be integer constants up to {} in time function'.format(MAX_DEGREE))
+            # Powers of powers grow with the product of the exponents, also for constant bases
+            if any(isinstance(inner, ast.BinOp) and isinstance(inner.op, ast.Pow) for inner in ast.walk(node.left)):
+                raise TimeFunctionError('Powers of powers are not allowed in time function')
+    # Products of powers are bounded by the degree
+    if _degree(tree.body) > MAX_DEGREE:
+        raise TimeFunctionError('Degree of time function exceeds {}'.format(MAX_DEGREE))
+
+# Returns the degree of x of a validated expression, quotients count like products
+def _degree(node):
+    if isinstance(node, ast.Name):
+        return 1
+    if isinstance(node, ast.UnaryOp):
+        return _degree(node.operand)
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Pow):
+            return _degree(node.left) * abs(_constantValue(node.right))
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            return max(_degree(node.left), _degree(node.right))
+        return _degree(node.left) + _degree(node.right)
+    return 0
+
+# Returns the value of a constant, optionally signed, None for any other node
+def _constantValue(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _constantValue(node.operand)
+        if value is None:
+            return None
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, getattr(ast, 'Constant', ())):
+        return node.value
+    if isinstance(node, getattr(ast, 'Num', ())):
+        return node.n
+    return None
+
+# Dedents a given string
+# Needed for functions that were stored with surrounding line breaks or indentation
+def _dedent_string(string):
+    if string and string[0] == '\n':
+        string = string[1:]
+    return textwrap.dedent(string)
@@ -0,0 +1,189 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+'''
+Memoization of positive trust query results.
+
+A found trust path is stored for its trustor and trustee together with the
+evidences of the path and the earliest expiry time of those evidences. A
+repeated query before that time scores the stored evidences again at the
+current block time and is answered without a graph search. The memo index
+of each prover on the path lists the memos that use its evidences, so a
+deleted evidence removes every memo whose path contains it.
+'''
+
+import logging
+import math
+import evidence_pb2
+import address_calculator
+import block_info_functions
+import storage_functions
+import reachability_cache
+import state_view
+
+from sawtooth_sdk.processor.exceptions import InvalidTransaction
+from sawtooth_sdk.processor.exceptions import InternalError
+
+# Initialize logger
+LOGGER = logging.getLogger(__name__)
+
+# Parses a stored trust memo entry, missing data yields an empty entry
+def _parseEntry(messageType, data):
+    entry = messageType()
+    if data:
+        try:
+            entry.ParseFromString(data)
+        except:
+            raise InternalError('Failed to load state data - trust memo')
+    return entry
+
+# Returns the time after which an evidence has a trust score of 0
+def _evidenceExpiry(context, evidence):
+    if evidence.ExpiresAt > 0:
+        return evidence.ExpiresAt
+    # Evidences stored before the expiry index have no ExpiresAt
+    evidenceProperties = storage_functions.findEvidenceProperties(context, evidence)
+    if evidenceProperties is None:
+        raise InvalidTransaction('Could not find properties attributes for evidence')
+    return evidence.Timestamp + int(math.ceil(evidenceProperties.xmax))
+
+'''
+Method to answer a trust query from the memo
+
+Only the memo of the trustor and trustee is read, so lookups of different queries do not conflict.
+A read-only transaction does not delete an expired memo, otherwise the memo is also removed from the
+memo indexes of the provers on its path.
+
+Input:
+    context - current blockchain state
+    trustor - querying device
+    trustee - device to establish trust in
+    minReliability - minimum required reliability for resulting path
+Output:
+    memo - (finalRating, path) of a valid memo that fulfils minReliability, None otherwise
+'''
+def lookup(context, trustor, trustee, minReliability):
+    memoAddress = address_calculator._assembleTrustMemoAddress(trustor, trustee)
+    state_entries = context.get_state([memoAddress])
+    if state_entries == []:
+        return None
+
+    memo = _parseEntry(evidence_pb2.TrustMemo, state_entries[0].data)
+    if block_info_functions.readLastBlockTime(context) < memo.ExpiresAt:
+        # Apply the time decay of the stored evidences
+        finalRating = reachability_cache.pathReliability(context, list(memo.Edges))
+        if finalRating >= minReliability:
+            return finalRating, memo.Path
+    elif not state_view.isReadOnly(context):
+        LOGGER.info('Trust memo of %s for %s expired', trustor, trustee)
+        context.delete_state([memoAddress])
+        _unindex(context, memoAddress, memo)
+    return None
+
+# Removes a deleted memo from the memo indexes of the provers on its path, emptied indexes are deleted
+def _unindex(context, memoAddress, memo):
+    indexAddresses = [address_calculator._assembleMemoIndexAddress(prover)
+                      for prover in sorted(set(evidence.ProverIdentity for evidence in memo.Edges))]
+    indexAddresses = [indexAddress for indexAddress in indexAddresses if state_view.canWrite(context, indexAddress)]
+    if not indexAddresses:
+        return
+    entries = {}
+    emptied = []
+    for entry in context.get_state(indexAddresses):
+        index = _parseEntry(evidence_pb2.MemoIndex, entry.data)
+        kept = [address for address in index.Addresses if address != memoAddress]
+        if not kept:
+            emptied.append(entry.address)
+        elif len(kept) < len(index.Addresses):
+            entries[entry.address] = evidence_pb2.MemoIndex(Addresses=kept).SerializeToString()
+    if entries:
+        context.set_state(entries)
+    if emptied:
+        context.delete_state(emptied)
+
+'''
+Method to memoize a found trust path
+
+Input:
+    context - current blockchain state
+    trustor - querying device
+    trustee - device to establish trust in
+    path - path found by the graph search
+    finalRating - rating of the path
+'''
+def store(context, trustor, trustee, path, finalRating):
+    edges = reachability_cache.pathEvidences(context, trustor, path)
+    if not edges:
+        return
+    memoAddress = address_calculator._assembleTrustMemoAddress(trustor, trustee)
+    memo = evidence_pb2.TrustMemo(
+        Reliability = finalRating,
+        Path = path,
+        ComputedAt = block_info_functions.readLastBlockTime(context),
+        ExpiresAt = min(_evidenceExpiry(context, evidence) for evidence in edges),
+        Edges = edges)
+
+    # Register the memo in the index of every prover on the path
+    indexAddresses = [address_calculator._assembleMemoIndexAddress(prover)
+                      for prover in sorted(set(evidence.ProverIdentity for evidence in edges))]
+    stored = {entry.address: entry.data for entry in context.get_state(indexAddresses)}
+    entries = {memoAddress: memo.SerializeToString()}
+    for indexAddress in indexAddresses:
+        index = _parseEntry(evidence_pb2.MemoIndex, stored.get(indexAddress))
+        if memoAddress not in index.Addresses:
+            index.Addresses.extend([memoAddress])
+            entries[indexAddress] = index.SerializeToString()
+    written = context.set_state(entries)
+    # Check if data was actually written to addresses
+    if len(written) < len(entries):
+        raise InternalError("State Error")
+
+'''
+Method to invalidate the trust memos whose path uses deleted evidences
+
+Input:
+    context - current blockchain state
+    evidences - the deleted evidences of one prover
+'''
+def evidencesDeleted(context, evidences):
+    indexAddress = address_calculator._assembleMemoIndexAddress(evidences[0].ProverIdentity)
+    # Memos expire with their first expiring evidence, transactions that do not declare
+    # the memo index leave the invalidation of memos on other deletions to their expiry
+    if not state_view.canWrite(context, indexAddress):
+        return
+    state_entries = context.get_state([indexAddress])
+    if state_entries == []:
+        return
+    index = _parseEntry(evidence_pb2.MemoIndex, state_entries[0].data)
+    deleted = set(evidence.SerializeToString() for evidence in evidences)
+    stored = {entry.address: entry.data for entry in context.get_state(list(index.Addresses))}
+
+    invalidated = []
+    kept = []
+    for memoAddress in index.Addresses:
+        if memoAddress not in stored:
+            # The memo expired or was invalidated through another prover
+            continue
+        memo = _parseEntry(evidence_pb2.TrustMemo, stored[memoAddress])
+        if any(evidence.SerializeToString() in deleted for evidence in memo.Edges):
+            invalidated.append(memoAddress)
+        else:
+            kept.append(memoAddress)
+    if invalidated:
+        context.delete_state(invalidated)
+        LOGGER.info('Invalidated %s trust memos', len(invalidated))
+    if not kept:
+        context.delete_state([indexAddress])
+    elif len(kept) < len(index.Addresses):
+        context.set_state({indexAddress: evidence_pb2.MemoIndex(Addresses=kept).SerializeToString()})
@@ -24,10 +24,13 @@ import systemconfig_pb2
 import trust_query_pb2
 import address_calculator
 import graph_search
+import reachability_cache
+import trust_memo
+import state_view
 import time
 import datetime
-import ast
-import textwrap
+import time_function
+import numpy
 
 from sawtooth_sdk.processor.handler import TransactionHandler
 from sawtooth_sdk.processor.exceptions import InvalidTransaction
@@ -36,41 +39,225 @@ from sawtooth_sdk.processor.exceptions import InternalError
 # Initialize logger
 LOGGER = logging.getLogger(__name__)
 
+# Upper bound for the number of ranked entry points a trust query may request
+MAX_ENTRY_POINT_COUNT = 16
+
+# Upper bound for the number of trustees of a multi-target trust query
+MAX_QUERY_TARGETS = 64
+
 '''
 Handling of trust query submission
 
 Input: 
     context - current blockchain state
-    payload - submitted trust query from the transaction payload
+    trustQuery - submitted TrustQuery from the transaction payload
     sender - sender public key
 Output:
     trustpath - event for an existing trustpath
     entrypoint - event for determining the entrypoint
+    Both events report whether the trust memo answered the query
+
+A query for a TrusteeClass instead of a Trustee is answered with the most reliable path to any device
+of the class, found by one search from all devices of the class. It does not use the memo and the
+cache of hot trustors, its trustpath event names the reached device as prover.
+
+A read-only query (ReadOnly set) does not write to the state: expired evidences are left to the
+expiry sweep and neither the memo nor the cache of hot trustors is updated. Its client declares no
+outputs, so read-only queries are scheduled in parallel with each other.
 '''
-def handleTrustQuery(context, payload, sender):
+def handleTrustQuery(context, trustQuery, sender):
     LOGGER.info('Trust query received from %s.',
                 sender)
 
-    # Read received query back to TrustQuery object
-    trustQuery = trust_query_pb2.TrustQuery()
-    trustQuery.ParseFromString(payload)
-
     # Validate trust query correctness according to Section 6.4.3
     _validate_trust_query(context, trustQuery, sender)
+    if trustQuery.ReadOnly:
+        state_view.setReadOnly(context)
+
+    # Queries for a device class search from all devices of the class at once
+    if trustQuery.TrusteeClass:
+        _handleTrusteeClassQuery(context, trustQuery, sender)
+        return
+
+    # Repeated queries are answered from the memo of an earlier result while its evidences are valid
+    memo = trust_memo.lookup(context, trustQuery.Trustor, trustQuery.Trustee, trustQuery.MinReliability)
+    memoAttributes = [("memoHit", str(memo is not None))]
+    if memo is not None:
+        finalRating, path = memo
+        LOGGER.info('Memoized path found. TrustScore: %s with Path: %s', finalRating, path)
+        context.add_event(
+            event_type="attestation/trustpath",
+            attributes=[("verifier", str(trustQuery.Trustor)),("prover", str(trustQuery.Trustee)),("path", str(path)), ("finalRating", str(finalRating)), ("budgetExhausted", str(False))] + memoAttributes)
+        return
+
+    # Queries of hot trustors are answered from their cached trust path if it is reliable enough
+    cached = reachability_cache.lookupPath(context, trustQuery.Trustor, trustQuery.Trustee)
+    if (cached is not None) and (cached[0] >= trustQuery.MinReliability):
+        finalRating, path = cached
+        LOGGER.info('Cached path found. TrustScore: %s with Path: %s', finalRating, path)
+        context.add_event(
+            event_type="attestation/trustpath",
+            attributes=[("verifier", str(trustQuery.Trustor)),("prover", str(trustQuery.Trustee)),("path", str(path)), ("finalRating", str(finalRating)), ("budgetExhausted", str(False))] + memoAttributes)
+        return
+
+    # Limit the work of the graph search according to the system config
+    SystemConfig = storage_functions.fetchSystemConfig(context)
+    budget = graph_search.SearchBudget.fromSystemConfig(SystemConfig)
+    # Expand from the trustor side as well over the reverse index, if enabled
+    forwardSource = storage_functions.getIssuedEvidenceLists if SystemConfig.BidirectionalSearch else None
 
     # Call graph search algorithm
     # with Trustee, Trustor, current Security Parameter and Minimal Reliability
-    pathFound, finalRating, entryPoint, path = graph_search.buildPath(context, trustQuery.Trustee, trustQuery.Trustor, storage_functions.loadSecurityParameter(context), trustQuery.MinReliability)
+    # and the number of requested entry points
+    pathFound, finalRating, entryPoint, path, entryPoints = graph_search.buildPath(context, trustQuery.Trustee, trustQuery.Trustor, storage_functions.loadSecurityParameter(context), trustQuery.MinReliability, forwardSource=forwardSource, budget=budget, entryPointCount=max(1, trustQuery.EntryPointCount))
+    LOGGER.info('Graph search finished with %s', budget)
 
     # Process graph search results and emit events
     if pathFound:
+        # Trustor and trustee are equal if there is no path
+        if (path is not None) and (not trustQuery.ReadOnly):
+            reachability_cache.storePath(context, trustQuery.Trustor, trustQuery.Trustee, path)
+            trust_memo.store(context, trustQuery.Trustor, trustQuery.Trustee, path, finalRating)
         context.add_event(
             event_type="attestation/trustpath",
-            attributes=[("verifier", str(trustQuery.Trustor)),("prover", str(trustQuery.Trustee)),("path", str(path)), ("finalRating", str(finalRating))])
+            attributes=[("verifier", str(trustQuery.Trustor)),("prover", str(trustQuery.Trustee)),("path", str(path)), ("finalRating", str(finalRating)), ("budgetExhausted", str(budget.exhausted))] + memoAttributes)
     else:
         context.add_event(
             event_type="attestation/entrypoint",
-            attributes=[("verifier", str(sender)),("path", str(path)), ("finalRating", str(finalRating)), ("entryPoint", str(entryPoint))])
+            attributes=[("verifier", str(sender)),("path", str(path)), ("finalRating", str(finalRating)), ("entryPoint", str(entryPoint)), ("budgetExhausted", str(budget.exhausted)), ("entryPoints", _encodeEntryPoints(entryPoints))] + memoAttributes)
+
+# Answers a trust query for a device class with a single search from all devices of the class
+def _handleTrusteeClassQuery(context, trustQuery, sender):
+    members = storage_functions.fetchAdminIndex(context).devicesOfClass(trustQuery.TrusteeClass)
+    budget = graph_search.SearchBudget.fromSystemConfig(storage_functions.fetchSystemConfig(context))
+    pathFound, finalRating, entryPoint, path, entryPoints = graph_search.buildPathFromAny(context, members, trustQuery.Trustor, storage_functions.loadSecurityParameter(context), trustQuery.MinReliability, budget=budget, entryPointCount=max(1, trustQuery.EntryPointCount))
+    LOGGER.info('Search from %s devices of class %s finished with %s', len(members), trustQuery.TrusteeClass, budget)
+
+    classAttributes = [("trusteeClass", str(trustQuery.TrusteeClass))]
+    if pathFound:
+        # The path starts with the reached device, the trustor itself is of the class if there is no path
+        prover = path.split(',')[0] if path is not None else trustQuery.Trustor
+        context.add_event(
+            event_type="attestation/trustpath",
+            attributes=[("verifier", str(trustQuery.Trustor)),("prover", str(prover)),("path", str(path)), ("finalRating", str(finalRating)), ("budgetExhausted", str(budget.exhausted))] + classAttributes)
+    else:
+        context.add_event(
+            event_type="attestation/entrypoint",
+            attributes=[("verifier", str(sender)),("path", str(path)), ("finalRating", str(finalRating)), ("entryPoint", str(entryPoint)), ("budgetExhausted", str(budget.exhausted)), ("entryPoints", _encodeEntryPoints(entryPoints))] + classAttributes)
+
+'''
+Handling of multi-target trust query submission
+
+All trustees of the query share one search: with the reverse index (BidirectionalSearch of the
+system config) a single search expands forwards from the trustor, otherwise the searches from
+the trustees share the evidences read and scored once. Trustees in the cache of a hot trustor
+are answered from the cache. The memo is neither read nor written.
+
+Input:
+    context - current blockchain state
+    trustQuery - submitted TrustQueryMulti from the transaction payload
+    sender - sender public key
+Output:
+    trustpath - event for each trustee with a path that fulfils its minReliability
+    no_trustpath - event for each other trustee
+'''
+def handleTrustQueryMulti(context, trustQuery, sender):
+    LOGGER.info('Multi-target trust query received from %s.',
+                sender)
+
+    _validate_trust_query_multi(context, trustQuery, sender)
+    if trustQuery.ReadOnly:
+        state_view.setReadOnly(context)
+
+    # A trustee listed several times is searched with its lowest minReliability
+    thresholds = {}
+    for target in trustQuery.Targets:
+        if (target.Trustee not in thresholds) or (target.MinReliability < thresholds[target.Trustee]):
+            thresholds[target.Trustee] = target.MinReliability
+
+    # Trustees in the cache of a hot trustor with a reliable enough path need no search
+    results = {}
+    if trustQuery.Trustor in reachability_cache.fetchHotTrustors(context):
+        for trustee, minReliability in thresholds.items():
+            cached = reachability_cache.lookupPath(context, trustQuery.Trustor, trustee)
+            if (cached is not None) and (cached[0] >= minReliability):
+                results[trustee] = cached
+    pending = {trustee: minReliability for trustee, minReliability in thresholds.items() if trustee not in results}
+
+    # All searches of the transaction share one budget
+    SystemConfig = storage_functions.fetchSystemConfig(context)
+    budget = graph_search.SearchBudget.fromSystemConfig(SystemConfig)
+    securityParameter = storage_functions.loadSecurityParameter(context)
+    if SystemConfig.BidirectionalSearch:
+        results.update(graph_search.buildPathsFromVerifier(context, trustQuery.Trustor, pending, securityParameter, storage_functions.getIssuedEvidenceLists, budget))
+    else:
+        evidenceCache = {}
+        for trustee, minReliability in pending.items():
+            pathFound, finalRating, _, path, _ = graph_search.buildPath(context, trustee, trustQuery.Trustor, securityParameter, minReliability, budget=budget, evidenceCache=evidenceCache)
+            if pathFound:
+                results[trustee] = (finalRating, path)
+    LOGGER.info('Multi-target search for %s trustees finished with %s', len(pending), budget)
+
+    # One event per trustee of the query
+    for target in trustQuery.Targets:
+        result = results.get(target.Trustee)
+        if (result is not None) and (result[0] >= target.MinReliability):
+            finalRating, path = result
+            context.add_event(
+                event_type="attestation/trustpath",
+                attributes=[("verifier", str(trustQuery.Trustor)),("prover", str(target.Trustee)),("path", str(path)), ("finalRating", str(finalRating)), ("budgetExhausted", str(budget.exhausted))])
+        else:
+            context.add_event(
+                event_type="attestation/no_trustpath",
+                attributes=[("verifier", str(trustQuery.Trustor)),("prover", str(target.Trustee)),("minReliability", str(target.MinReliability)), ("budgetExhausted", str(budget.exhausted))])
+
+'''
+Handling of a path verification
+
+The evidences of the hops of a known trust path are read with a single state request and scored at
+the current block time, each hop with its most reliable evidence like in the search. The transaction
+never writes to the state, expired evidences are left to the expiry sweep.
+
+Input:
+    context - current blockchain state
+    verification - submitted PathVerification from the transaction payload
+    sender - sender public key
+Output:
+    path_verification - event with the current rating of the path, whether it fulfils minReliability
+                        and the first hop without a valid evidence as prover>verifier
+'''
+def handlePathVerification(context, verification, sender):
+    LOGGER.info('Path verification received from %s.',
+                sender)
+
+    state_view.setReadOnly(context)
+    nodes = verification.Path.split(',') + [verification.Trustor]
+    _validate_path_verification(context, verification, nodes, sender)
+
+    hops = list(zip(nodes[:-1], nodes[1:]))
+    evidenceLists = storage_functions.getEvidenceListsForEdges(context, hops)
+    # Multiply the scores from the prover side like the search
+    finalRating = 1
+    failedHop = ''
+    for prover, verifier in hops:
+        evidenceList = evidenceLists[(prover, verifier)]
+        score = float(numpy.max(scoreEvidenceList(context, evidenceList))) if evidenceList != [] else 0
+        if score <= 0:
+            failedHop = '{}>{}'.format(prover, verifier)
+            finalRating = 0
+            break
+        finalRating *= score
+    valid = (not failedHop) and (finalRating >= verification.MinReliability)
+    LOGGER.info('Path %s verified with TrustScore: %s, valid: %s', verification.Path, finalRating, valid)
+
+    context.add_event(
+        event_type="attestation/path_verification",
+        attributes=[("verifier", str(verification.Trustor)),("prover", str(nodes[0])),("path", str(verification.Path)), ("finalRating", str(finalRating)), ("valid", str(valid)), ("failedHop", failedHop)])
+
+# Encodes the ranked entry points for the entrypoint event, best first
+# Format: entryPoint:finalRating:path entries separated by ';', the path is comma separated
+def _encodeEntryPoints(entryPoints):
+    return ';'.join('{}:{}:{}'.format(entryPoint, rating, path) for entryPoint, rating, path in entryPoints)
 
 '''
 calculateEdgeTrustScore function to calculate the reliability for a given evidence
@@ -100,9 +287,8 @@ def calculateEdgeTrustScore(context, evidence):
     if (x <= xmin):
         trustScore = 1
     elif (xmin < x <= xmax):
-        # Parse and evaluate time function: 
-        # eval() does not need to be sanitized, administration transaction family input only by administrators
-        trustScore = eval(_dedent_string(timeFunction))
+        # Evaluate the compiled time function, compilation is cached per function string
+        trustScore = float(_evaluateTimeFunction(timeFunction, x))
     else:
         trustScore = 0
         # Delete evidence from state due to expiration
@@ -112,17 +298,69 @@ def calculateEdgeTrustScore(context, evidence):
     finalTrustScore = trustScore * reliabilityScore
     return finalTrustScore
 
+'''
+scoreEvidenceList function to calculate the reliability of all evidences of an evidence list at once
+
+Input: 
+    context - current blockchain state
+    evidenceList - EvidenceList of one prover
+Output:
+    scores - numpy array with the final score for each evidence / edge, in list order
+'''
+def scoreEvidenceList(context, evidenceList):
+    evidences = evidenceList.Evidences
+    scores = numpy.zeros(len(evidences))
+    if len(evidences) == 0:
+        return scores
+    # Calculate the age of all evidences
+    currentTimestamp = block_info_functions.readLastBlockTime(context)
+    timestamps = numpy.fromiter((evidence.Timestamp for evidence in evidences), dtype=numpy.float64, count=len(evidences))
+    ages = currentTimestamp - timestamps
+    # Group the evidences by attestation type, each group shares one set of properties
+    groups = {}
+    for position, evidence in enumerate(evidences):
+        groups.setdefault(evidence.AttestationType, []).append(position)
+    adminIndex = storage_functions.fetchAdminIndex(context)
+    for attestationType, positions in groups.items():
+        evidenceProperties = adminIndex.lookupProperties(attestationType)
+        if evidenceProperties is None:
+            raise InvalidTransaction('Could not find properties attributes for evidence')
+        xmin = evidenceProperties.xmin
+        xmax = evidenceProperties.xmax
+        assert xmin <= xmax
+        positions = numpy.array(positions)
+        x = ages[positions]
+        # Apply the xmin / xmax rule to the whole group
+        trustScores = numpy.zeros(len(positions))
+        trustScores[x <= xmin] = 1
+        decaying = (xmin < x) & (x <= xmax)
+        if decaying.any():
+            trustScores[decaying] = _evaluateTimeFunction(evidenceProperties.TimeFunction, x[decaying])
+        # In addition to the time influence, add static reliability influence
+        scores[positions] = trustScores * evidenceProperties.ReliabilityScore
+        # Delete evidences from state due to expiration
+        for position in positions[x > xmax]:
+            storage_functions._deleteEvidence(context, evidences[position])
+            LOGGER.info('Deleting evidence')
+    return scores
+
+# Evaluates a time function for one evidence age or an array of ages
+# Arithmetic errors and results that are not finite reject the transaction, scores are clamped to [0, 1]
+def _evaluateTimeFunction(timeFunction, x):
+    try:
+        # NumPy returns inf or nan for a division by zero or an overflow unless told to raise
+        with numpy.errstate(all='raise'):
+            trustScores = numpy.asarray(time_function.compileTimeFunction(timeFunction)(x), dtype=numpy.float64)
+    except (time_function.TimeFunctionError, ArithmeticError) as err:
+        raise InvalidTransaction('Invalid time function for evidence: {}'.format(err))
+    if not numpy.isfinite(trustScores).all():
+        raise InvalidTransaction('Time function for evidence is not finite: {}'.format(timeFunction))
+    return numpy.clip(trustScores, 0, 1)
+
 # Helper function to format a timestamp in a readable way
 def formatTimestamp(timestamp):
     return datetime.datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
 
-# Dedents a given string
-# Needed for the attestation properties function parser (eval) in calculateEdgeTrustScore
-def _dedent_string(string):
-    if string and string[0] == '\n':
-        string = string[1:]
-    return textwrap.dedent(string)
-
 # Calculates the temporal proximity of evidence submission time and current time
 def _getTimeDifference(context, evidence):
     currentTimestamp = block_info_functions.readLastBlockTime(context)
@@ -136,15 +374,49 @@ def _validate_trust_query(context, trustQuery, sender):
         assert (_validate_vrfID(context, trustQuery.Trustor) == True)
     except:
             raise InvalidTransaction('Trustor Assertion Error')
-    try:
-        assert (_validate_prvID(context, trustQuery.Trustee) == True)
-    except:
-        raise InvalidTransaction('Trustee Assertion Error')
+    if trustQuery.TrusteeClass:
+        # A class query names no single trustee, the class must have devices
+        if trustQuery.Trustee or not storage_functions.fetchAdminIndex(context).devicesOfClass(trustQuery.TrusteeClass):
+            raise InvalidTransaction('Trustee Class Assertion Error')
+    else:
+        try:
+            assert (_validate_prvID(context, trustQuery.Trustee) == True)
+        except:
+            raise InvalidTransaction('Trustee Assertion Error')
     # 2. minReliability in [0,1]
     try:
         assert (_validate_minReliability(trustQuery.MinReliability) == True)
     except:
             raise InvalidTransaction('minReliability Assertion Error')
+    # 3. The number of requested entry points is bounded
+    if trustQuery.EntryPointCount > MAX_ENTRY_POINT_COUNT:
+        raise InvalidTransaction('EntryPointCount exceeds the maximum of {}'.format(MAX_ENTRY_POINT_COUNT))
+
+# Validation of multi-target trust query transaction
+def _validate_trust_query_multi(context, trustQuery, sender):
+    # 1. The number of trustees is bounded
+    if not trustQuery.Targets:
+        raise InvalidTransaction('Trust query without trustees')
+    if len(trustQuery.Targets) > MAX_QUERY_TARGETS:
+        raise InvalidTransaction('Trust query exceeds the maximum of {} trustees'.format(MAX_QUERY_TARGETS))
+    # 2. Every target is valid on its own
+    for target in trustQuery.Targets:
+        _validate_trust_query(context, trust_query_pb2.TrustQuery(
+            Trustor=trustQuery.Trustor, Trustee=target.Trustee, MinReliability=target.MinReliability), sender)
+
+# Validation of path verification transaction
+def _validate_path_verification(context, verification, nodes, sender):
+    # 1. The trustor is a legitimate participating peer
+    if not _validate_vrfID(context, verification.Trustor):
+        raise InvalidTransaction('Trustor Assertion Error')
+    # 2. The path is free of cycles and within SecurityParameter hops
+    if (not all(nodes)) or (len(set(nodes)) < len(nodes)):
+        raise InvalidTransaction('Path Assertion Error')
+    if len(nodes) - 1 > storage_functions.loadSecurityParameter(context):
+        raise InvalidTransaction('Path exceeds the SecurityParameter')
+    # 3. minReliability in [0,1]
+    if not _validate_minReliability(verification.MinReliability):
+        raise InvalidTransaction('minReliability Assertion Error')
 
 # Function for minReliability validation
 def _validate_minReliability(minReliability):
@@ -155,22 +427,8 @@ def _validate_minReliability(minReliability):
 
 # Function for trustor validation
 def _validate_vrfID(context, vrfID):
-    deviceList = storage_functions.fetchDeviceList(context)
-    if deviceList == []:
-        LOGGER.info('Device List is empty')
-    else:
-        for device in deviceList.Devices:
-            if (vrfID == device.DeviceIdentity):
-                return True
-    return False
+    return storage_functions.fetchAdminIndex(context).isDevice(vrfID)
 
 # Function for trustee validation
 def _validate_prvID(context, prvID):
-    deviceList = storage_functions.fetchDeviceList(context)
-    if deviceList == []:
-        LOGGER.info('Device List is empty')
-    else:
-        for device in deviceList.Devices:
-            if (prvID == device.DeviceIdentity):
-                return True
-    return False
+    return storage_functions.fetchAdminIndex(context).isDevice(prvID)
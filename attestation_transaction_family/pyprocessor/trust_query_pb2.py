@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=_b('\n\x11trust_query.proto\"F\n\nTrustQuery\x12\x0f\n\x07Trustor\x18\x01 \x01(\t\x12\x0f\n\x07Trustee\x18\x02 \x01(\t\x12\x16\n\x0eMinReliability\x18\x03 \x01(\x02\x62\x06proto3')
+  serialized_pb=_b('\n\x11trust_query.proto\"\x87\x01\n\nTrustQuery\x12\x0f\n\x07Trustor\x18\x01 \x01(\t\x12\x0f\n\x07Trustee\x18\x02 \x01(\t\x12\x16\n\x0eMinReliability\x18\x03 \x01(\x02\x12\x17\n\x0f\x45ntryPointCount\x18\x04 \x01(\r\x12\x10\n\x08ReadOnly\x18\x05 \x01(\x08\x12\x14\n\x0cTrusteeClass\x18\x06 \x01(\t\"I\n\x10PathVerification\x12\x0f\n\x07Trustor\x18\x01 \x01(\t\x12\x0c\n\x04Path\x18\x02 \x01(\t\x12\x16\n\x0eMinReliability\x18\x03 \x01(\x02\"6\n\x0bTrustTarget\x12\x0f\n\x07Trustee\x18\x01 \x01(\t\x12\x16\n\x0eMinReliability\x18\x02 \x01(\x02\"S\n\x0fTrustQueryMulti\x12\x0f\n\x07Trustor\x18\x01 \x01(\t\x12\x1d\n\x07Targets\x18\x02 \x03(\x0b\x32\x0c.TrustTarget\x12\x10\n\x08ReadOnly\x18\x03 \x01(\x08\x62\x06proto3')
 )
 
 
@@ -54,6 +54,110 @@ _TRUSTQUERY = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='EntryPointCount', full_name='TrustQuery.EntryPointCount', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ReadOnly', full_name='TrustQuery.ReadOnly', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='TrusteeClass', full_name='TrustQuery.TrusteeClass', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=22,
+  serialized_end=157,
+)
+
+
+_PATHVERIFICATION = _descriptor.Descriptor(
+  name='PathVerification',
+  full_name='PathVerification',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Trustor', full_name='PathVerification.Trustor', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Path', full_name='PathVerification.Path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MinReliability', full_name='PathVerification.MinReliability', index=2,
+      number=3, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=159,
+  serialized_end=232,
+)
+
+
+_TRUSTTARGET = _descriptor.Descriptor(
+  name='TrustTarget',
+  full_name='TrustTarget',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Trustee', full_name='TrustTarget.Trustee', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MinReliability', full_name='TrustTarget.MinReliability', index=1,
+      number=2, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -66,11 +170,60 @@ _TRUSTQUERY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=21,
-  serialized_end=91,
+  serialized_start=234,
+  serialized_end=288,
 )
 
+
+_TRUSTQUERYMULTI = _descriptor.Descriptor(
+  name='TrustQueryMulti',
+  full_name='TrustQueryMulti',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Trustor', full_name='TrustQueryMulti.Trustor', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Targets', full_name='TrustQueryMulti.Targets', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ReadOnly', full_name='TrustQueryMulti.ReadOnly', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=290,
+  serialized_end=373,
+)
+
+_TRUSTQUERYMULTI.fields_by_name['Targets'].message_type = _TRUSTTARGET
 DESCRIPTOR.message_types_by_name['TrustQuery'] = _TRUSTQUERY
+DESCRIPTOR.message_types_by_name['PathVerification'] = _PATHVERIFICATION
+DESCRIPTOR.message_types_by_name['TrustTarget'] = _TRUSTTARGET
+DESCRIPTOR.message_types_by_name['TrustQueryMulti'] = _TRUSTQUERYMULTI
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 TrustQuery = _reflection.GeneratedProtocolMessageType('TrustQuery', (_message.Message,), dict(
@@ -80,5 +233,26 @@ TrustQuery = _reflection.GeneratedProtocolMessageType('TrustQuery', (_message.Me
   ))
 _sym_db.RegisterMessage(TrustQuery)
 
+PathVerification = _reflection.GeneratedProtocolMessageType('PathVerification', (_message.Message,), dict(
+  DESCRIPTOR = _PATHVERIFICATION,
+  __module__ = 'trust_query_pb2'
+  # @@protoc_insertion_point(class_scope:PathVerification)
+  ))
+_sym_db.RegisterMessage(PathVerification)
+
+TrustTarget = _reflection.GeneratedProtocolMessageType('TrustTarget', (_message.Message,), dict(
+  DESCRIPTOR = _TRUSTTARGET,
+  __module__ = 'trust_query_pb2'
+  # @@protoc_insertion_point(class_scope:TrustTarget)
+  ))
+_sym_db.RegisterMessage(TrustTarget)
+
+TrustQueryMulti = _reflection.GeneratedProtocolMessageType('TrustQueryMulti', (_message.Message,), dict(
+  DESCRIPTOR = _TRUSTQUERYMULTI,
+  __module__ = 'trust_query_pb2'
+  # @@protoc_insertion_point(class_scope:TrustQueryMulti)
+  ))
+_sym_db.RegisterMessage(TrustQueryMulti)
+
 
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,79 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Fixtures of the attestation transaction family tests.
+
+The tests apply transactions through the transaction handler against the
+in-memory state of the benchmarks. Every transaction is restricted to the
+addresses the client declares for it, like by the validator:
+    cd attestation_transaction_family && python3 -m pytest tests
+'''
+
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'pyclient'))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'benchmarks'))
+
+import pytest
+import bench_common
+import block_info_pb2
+import attmgr_tp
+import attmgr_client
+import address_calculator
+
+NAMESPACE = address_calculator._hash(address_calculator.FAMILY_NAME.encode('utf-8'))[0:6]
+
+class RecordingClient(attmgr_client.AttestationManagerClient):
+    '''
+    Client that records the transactions it would send instead of sending them to the REST API.
+    '''
+    def __init__(self):
+        super(RecordingClient, self).__init__('http://localhost:8008')
+        self.transactions = []
+
+    def _wrap_and_send(self, action, data, input_address_list, output_address_list, wait=None):
+        self.transactions.append((action, data, input_address_list, output_address_list))
+
+class Network(object):
+    '''
+    Applies the transactions of the client with their declared addresses to the in-memory state.
+    '''
+    def __init__(self, context):
+        self.context = context
+        self.client = RecordingClient()
+        self.handler = attmgr_tp.AttestationTransactionHandler(NAMESPACE)
+
+    def apply(self, send, *args, **kwargs):
+        '''Call a method of the client and apply the recorded transaction.'''
+        send(*args, **kwargs)
+        action, data, inputs, outputs = self.client.transactions.pop()
+        bench_common.applyTransaction(self.handler, self.context, action, data, inputs, outputs)
+
+    def setBlock(self, blockNumber, timestamp):
+        '''Append a block with a timestamp to the block info.'''
+        self.context.state['00b10c01' + 62*'0'] = block_info_pb2.BlockInfoConfig(
+            latest_block=blockNumber).SerializeToString()
+        self.context.state['00b10c00' + hex(blockNumber)[2:].zfill(62)] = block_info_pb2.BlockInfo(
+            block_num=blockNumber, timestamp=timestamp).SerializeToString()
+
+    def events(self, eventType):
+        '''Return the attributes of the events of a type as dictionaries.'''
+        return [dict(attributes) for event, attributes in self.context.events if event == eventType]
+
+@pytest.fixture
+def network():
+    context = bench_common.AuthorizingContext()
+    bench_common.loadAdministrationState(context)
+    return Network(context)
@@ -0,0 +1,35 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the block info reads.
+'''
+
+import bench_common
+import state_view
+import block_info_functions
+
+# Competing forks have different blocks with the same number
+def test_block_time_of_forks(network):
+    forkTimes = []
+    for timestamp in [bench_common.BLOCK_TIME + 10, bench_common.BLOCK_TIME + 20]:
+        network.setBlock(bench_common.BLOCK_NUMBER + 1, timestamp)
+        forkTimes.append(block_info_functions.readLastBlockTime(state_view.StateView(network.context)))
+    assert forkTimes == [bench_common.BLOCK_TIME + 10, bench_common.BLOCK_TIME + 20]
+
+# The block time is read once per transaction
+def test_block_time_per_transaction(network):
+    context = state_view.StateView(network.context)
+    assert block_info_functions.readLastBlockTime(context) == bench_common.BLOCK_TIME
+    network.context.resetCounters()
+    assert block_info_functions.readLastBlockTime(context) == bench_common.BLOCK_TIME
+    assert network.context.roundTrips == 0
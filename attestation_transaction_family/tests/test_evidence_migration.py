@@ -0,0 +1,79 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the migration of legacy evidence lists.
+'''
+
+import bench_common
+import evidence_pb2
+import address_calculator
+import evidence_expiry
+
+EDGES = bench_common.scaleFreeEdges(60, 2)
+NODES = sorted({node for edge in EDGES for node in edge})
+PROVERS = sorted({prover for verifier, prover in EDGES})
+
+def _evidenceList(context, address):
+    return evidence_pb2.EvidenceList.FromString(context.state[address]).Evidences
+
+# Returns the addresses of the expiry index buckets in the state
+def _expiryBuckets(context):
+    shardPrefixes = tuple(address_calculator._expiryShardPrefix(shard) for shard in range(address_calculator.EXPIRY_INDEX_SHARDS))
+    return [address for address in context.state if address.startswith(shardPrefixes) and not address.endswith('f' * 60)]
+
+# Legacy lists stored before the expiry index have evidences without ExpiresAt
+def test_migration_of_legacy_lists_without_expiry(network):
+    bench_common.loadDevices(network.context, NODES)
+    bench_common.storeEdges(network.context, EDGES)
+
+    network.apply(network.client.migrateEvidence, PROVERS)
+
+    assert network.events('attestation/evidence_migration') == [
+        {'migratedProvers': str(len(PROVERS)), 'migratedEvidences': str(len(EDGES))}]
+    for verifier, prover in EDGES:
+        assert address_calculator._assembleAddress(prover) not in network.context.state
+        evidences = _evidenceList(network.context, address_calculator._assembleEdgeAddress(prover, verifier))
+        assert [evidence.ExpiresAt for evidence in evidences] == [bench_common.BLOCK_TIME + 1200]
+    assert _expiryBuckets(network.context)
+
+# Migrated evidences are removed by the sweep once they expired
+def test_sweep_of_migrated_evidences(network):
+    bench_common.loadDevices(network.context, NODES)
+    bench_common.storeEdges(network.context, EDGES)
+    network.apply(network.client.migrateEvidence, PROVERS)
+
+    network.setBlock(bench_common.BLOCK_NUMBER + 1, bench_common.BLOCK_TIME + 600)
+    network.apply(network.client.sweepExpired)
+    for verifier, prover in EDGES:
+        assert address_calculator._assembleEdgeAddress(prover, verifier) in network.context.state
+
+    network.setBlock(bench_common.BLOCK_NUMBER + 2, bench_common.BLOCK_TIME + 1200 + evidence_expiry.EXPIRY_BUCKET_SECONDS)
+    network.apply(network.client.sweepExpired)
+    for verifier, prover in EDGES:
+        assert address_calculator._assembleEdgeAddress(prover, verifier) not in network.context.state
+    assert _expiryBuckets(network.context) == []
+
+# Older evidences of the same verifier and attestation type are dropped when a legacy list is moved
+def test_migration_compacts_legacy_lists(network):
+    bench_common.loadDevices(network.context, NODES)
+    verifier, prover = EDGES[0]
+    evidences = [bench_common.makeEvidence(verifier, prover, timestamp=bench_common.BLOCK_TIME - age) for age in [300, 100, 200]]
+    evidences.append(bench_common.makeEvidence(verifier, prover, attestationType='TPM'))
+    network.context.state[address_calculator._assembleAddress(prover)] = evidence_pb2.EvidenceList(
+        Evidences=evidences).SerializeToString()
+
+    network.apply(network.client.migrateEvidence, [prover])
+
+    kept = _evidenceList(network.context, address_calculator._assembleEdgeAddress(prover, verifier))
+    assert [(evidence.AttestationType, evidence.Timestamp) for evidence in kept] == [
+        ('DIAT', bench_common.BLOCK_TIME - 100), ('TPM', bench_common.BLOCK_TIME)]
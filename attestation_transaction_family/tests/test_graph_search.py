@@ -0,0 +1,100 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the trust path searches from the prover side and from both ends.
+'''
+
+import pytest
+import bench_common
+import evidence_pb2
+import systemconfig_pb2
+import trust_query_pb2
+import graph_search
+import state_view
+import storage_functions
+
+EDGES = bench_common.scaleFreeEdges(200, 2)
+NODES = sorted({node for edge in EDGES for node in edge})
+PAIRS = bench_common.samplePairs(EDGES, 100)
+SECURITY_PARAMETER = 4
+MIN_RELIABILITY = 0.5
+
+@pytest.fixture
+def graph(network):
+    bench_common.loadDevices(network.context, NODES)
+    for first in range(0, len(EDGES), 100):
+        evidences = [bench_common.makeEvidence(verifier, prover) for verifier, prover in EDGES[first:first + 100]]
+        network.apply(network.client.submitEvidenceList, evidence_pb2.EvidenceList(Evidences=evidences).SerializeToString())
+    # The searches below are called directly and may read the whole namespace
+    network.context.authorize([''], [''])
+    return network
+
+def _search(network, trustor, trustee, bidirectional, budget=None):
+    forwardSource = storage_functions.getIssuedEvidenceLists if bidirectional else None
+    return graph_search.buildPath(state_view.StateView(network.context), trustee, trustor, SECURITY_PARAMETER,
+                                  MIN_RELIABILITY, forwardSource=forwardSource, budget=budget)
+
+# Checks that every hop of a path from the trustee to the trustor is an edge of the graph
+def _assertPath(trustor, trustee, path):
+    nodes = path.split(',') + [trustor]
+    assert nodes[0] == trustee
+    assert len(nodes) - 1 <= SECURITY_PARAMETER
+    for prover, verifier in zip(nodes[:-1], nodes[1:]):
+        assert (verifier, prover) in EDGES
+
+def test_bidirectional_search_finds_the_most_reliable_path(graph):
+    found = 0
+    for trustor, trustee in PAIRS:
+        backward = _search(graph, trustor, trustee, False)
+        bidirectional = _search(graph, trustor, trustee, True)
+        assert bidirectional[0] == backward[0]
+        if backward[0]:
+            assert bidirectional[1] == pytest.approx(backward[1])
+            _assertPath(trustor, trustee, bidirectional[3])
+            found += 1
+    assert found > 0
+
+# A path found before the budget ran out is returned and no better than the path of an unlimited search
+def test_searches_under_an_exhausted_budget(graph):
+    foundExhausted = {False: 0, True: 0}
+    for trustor, trustee in PAIRS:
+        unlimited = _search(graph, trustor, trustee, False)
+        for maxExpandedNodes in range(1, 10):
+            for bidirectional in [False, True]:
+                budget = graph_search.SearchBudget(maxExpandedNodes=maxExpandedNodes)
+                pathFound, finalRating, entryPoint, path, entryPoints = _search(graph, trustor, trustee, bidirectional, budget)
+                if not pathFound:
+                    continue
+                assert unlimited[0]
+                assert MIN_RELIABILITY <= finalRating <= unlimited[1] + 1e-9
+                _assertPath(trustor, trustee, path)
+                foundExhausted[bidirectional] += budget.exhausted
+    assert foundExhausted[True] > 0
+
+def _foundWithExhaustedBudget(network, trustor, trustee, maxExpandedNodes):
+    budget = graph_search.SearchBudget(maxExpandedNodes=maxExpandedNodes)
+    return _search(network, trustor, trustee, True, budget)[0] and budget.exhausted
+
+def test_trust_query_reports_the_exhausted_budget(graph):
+    trustor, trustee, maxExpandedNodes = next(
+        (trustor, trustee, maxExpandedNodes) for trustor, trustee in PAIRS for maxExpandedNodes in range(1, 10)
+        if _foundWithExhaustedBudget(graph, trustor, trustee, maxExpandedNodes))
+    graph.context.state[storage_functions.system_config_address] = systemconfig_pb2.Systemconfig(
+        SecurityParameter=SECURITY_PARAMETER, MaximumExpandedNodes=maxExpandedNodes, BidirectionalSearch=1).SerializeToString()
+
+    query = trust_query_pb2.TrustQuery(Trustor=trustor, Trustee=trustee, MinReliability=MIN_RELIABILITY, ReadOnly=True)
+    graph.apply(graph.client.submitTrustQuery, query.SerializeToString(), readOnly=True)
+    trustPaths = graph.events('attestation/trustpath')
+    assert len(trustPaths) == 1
+    assert trustPaths[0]['budgetExhausted'] == 'True'
+    _assertPath(trustor, trustee, trustPaths[0]['path'])
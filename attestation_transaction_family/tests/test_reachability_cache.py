@@ -0,0 +1,106 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the trust path caches of hot trustors against the graph search.
+'''
+
+import pytest
+import bench_common
+import evidence_pb2
+import trust_query_pb2
+import reachability_cache
+
+# Chain of devices, the trustor attests the next one and can attest the last one directly later
+CHAIN = ['0000C1', '0000C2', '0000C3']
+EDGES = bench_common.scaleFreeEdges(60, 2)
+NODES = sorted({node for edge in EDGES for node in edge})
+
+def _submitEdges(network, edges, hotTrustors=False):
+    evidenceList = evidence_pb2.EvidenceList(Evidences=[bench_common.makeEvidence(verifier, prover) for verifier, prover in edges])
+    network.apply(network.client.submitEvidenceList, evidenceList.SerializeToString(), hotTrustors=hotTrustors)
+
+def _submitChain(network):
+    bench_common.loadDevices(network.context, CHAIN)
+    _submitEdges(network, zip(CHAIN[:-1], CHAIN[1:]))
+    network.apply(network.client.registerHotTrustors, [CHAIN[0]])
+    network.setBlock(bench_common.BLOCK_NUMBER + 1, bench_common.BLOCK_TIME + 60)
+
+def _lookupPath(network, trustor, trustee):
+    network.context.authorize([''], [''])
+    return reachability_cache.lookupPath(network.context, trustor, trustee)
+
+def _trustQuery(network, trustor, trustee, readOnly=True):
+    query = trust_query_pb2.TrustQuery(Trustor=trustor, Trustee=trustee, MinReliability=0.1, ReadOnly=readOnly)
+    network.apply(network.client.submitTrustQuery, query.SerializeToString(), readOnly=readOnly)
+
+# Returns the rating of the answer to a read-only trust query for every trustee, None without a path
+def _ratings(network, trustor, trustees):
+    ratings = []
+    for trustee in trustees:
+        answered = len(network.events('attestation/trustpath'))
+        _trustQuery(network, trustor, trustee)
+        trustPaths = network.events('attestation/trustpath')[answered:]
+        ratings.append(float(trustPaths[0]['finalRating']) if trustPaths else None)
+    return ratings
+
+# Returns the ratings of the cache and of the graph search, which answers once the trustor is unregistered
+def _cachedAndSearchedRatings(network, trustor, trustees):
+    cached = _ratings(network, trustor, trustees)
+    network.apply(network.client.registerHotTrustors, [trustor], register=False)
+    return cached, _ratings(network, trustor, trustees)
+
+def test_cache_follows_submissions_with_hot_trustors(network):
+    _submitChain(network)
+    _submitEdges(network, [(CHAIN[0], CHAIN[2])], hotTrustors=True)
+
+    reliability, path = _lookupPath(network, CHAIN[0], CHAIN[2])
+    assert path == CHAIN[2]
+    cached, searched = _cachedAndSearchedRatings(network, CHAIN[0], CHAIN[1:])
+    assert cached == pytest.approx(searched)
+    assert cached[1] == pytest.approx(reliability)
+
+# The direct evidence is not relaxed into the cache, the entry over the chain is stale
+def test_stale_entry_falls_back_to_search(network):
+    _submitChain(network)
+    _submitEdges(network, [(CHAIN[0], CHAIN[2])])
+
+    assert _lookupPath(network, CHAIN[0], CHAIN[2]) is None
+    cached, searched = _cachedAndSearchedRatings(network, CHAIN[0], CHAIN[1:])
+    assert cached == pytest.approx(searched)
+
+# A trust query that is not read-only stores the path of its search as current entry
+def test_search_refreshes_stale_entry(network):
+    _submitChain(network)
+    _submitEdges(network, [(CHAIN[0], CHAIN[2])])
+    network.setBlock(bench_common.BLOCK_NUMBER + 2, bench_common.BLOCK_TIME + 120)
+
+    _trustQuery(network, CHAIN[0], CHAIN[2], readOnly=False)
+    reliability, path = _lookupPath(network, CHAIN[0], CHAIN[2])
+    assert path == CHAIN[2]
+    assert reliability == pytest.approx(float(network.events('attestation/trustpath')[-1]['finalRating']))
+
+# Half of the graph is submitted before the registration and the rest later without updating the cache,
+# the answers of the hot trustor never differ from the graph search
+def test_cache_answers_equal_search_after_submissions_without_hot_trustors(network):
+    bench_common.loadDevices(network.context, NODES)
+    half = len(EDGES) // 2
+    _submitEdges(network, EDGES[:half])
+    trustor = max(NODES, key=lambda node: sum(verifier == node for verifier, prover in EDGES[:half]))
+    network.apply(network.client.registerHotTrustors, [trustor])
+
+    network.setBlock(bench_common.BLOCK_NUMBER + 1, bench_common.BLOCK_TIME + 300)
+    _submitEdges(network, EDGES[half:])
+    trustees = [node for node in NODES if node != trustor]
+    cached, searched = _cachedAndSearchedRatings(network, trustor, trustees)
+    assert any(rating is not None for rating in searched)
+    assert cached == pytest.approx(searched)
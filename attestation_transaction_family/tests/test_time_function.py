@@ -0,0 +1,64 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the compilation of the TimeFunction of the attestation properties.
+'''
+
+import pytest
+import bench_common
+import properties_pb2
+import storage_functions
+import time_function
+
+@pytest.mark.parametrize('timeFunction, x, score', [
+    ('-0.003333333*x + 1.2', 90, 0.9),
+    ('\n    -0.001666667*x + 2\n', 600, 1.0),
+    ('x**2', 3, 9),
+    ('-x**-1', 4, -0.25),
+    ('(x + 1)**8', 1, 256),
+    ('x**4 * x**4 / 2', 2, 128),
+    ('2**8 - x % 7', 9, 254),
+])
+def test_accepted_time_functions(timeFunction, x, score):
+    assert time_function.compileTimeFunction(timeFunction)(x) == pytest.approx(score)
+
+@pytest.mark.parametrize('timeFunction', [
+    'x**9',
+    'x**0.5',
+    'x**x',
+    '(x**8)**8',
+    '(x**2 + 1)**2',
+    '(9**8)**8',
+    'x**8 * x',
+    'x*x*x*x*x*x*x*x*x',
+    'y + 1',
+    '__import__("os")',
+    'x if x else 1',
+    'True + x',
+    '"x" * 2',
+    '-0.001*x +',
+])
+def test_rejected_time_functions(timeFunction):
+    with pytest.raises(time_function.TimeFunctionError):
+        time_function.compileTimeFunction(timeFunction)
+
+def test_arithmetic_errors_are_time_function_errors():
+    with pytest.raises(time_function.TimeFunctionError):
+        time_function.compileTimeFunction('1/(x-x)')(5)
+
+def test_properties_of_the_administration_data_are_accepted():
+    context = bench_common.MemoryContext()
+    bench_common.loadAdministrationState(context)
+    propertiesList = properties_pb2.PropertiesList.FromString(context.state[storage_functions.properties_address])
+    for properties in propertiesList.Properties:
+        time_function.compileTimeFunction(properties.TimeFunction)(properties.xmin)
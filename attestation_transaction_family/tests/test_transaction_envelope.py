@@ -0,0 +1,59 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the decoding of transaction payloads.
+'''
+
+import pytest
+import cbor
+import bench_common
+import evidence_pb2
+import trust_query_pb2
+import transaction_envelope_pb2
+import attmgr_tp
+
+from sawtooth_sdk.processor.exceptions import InvalidTransaction
+
+MESSAGES = [
+    ('submitEvidence', bench_common.makeEvidence('0794', '098D')),
+    ('submitEvidenceList', evidence_pb2.EvidenceList(Evidences=[bench_common.makeEvidence('0794', '098D')])),
+    ('trustQuery', trust_query_pb2.TrustQuery(Trustor='0794', Trustee='073B', MinReliability=0.5, ReadOnly=True)),
+    ('migrateEvidence', evidence_pb2.IdentityList(Identities=['098D', '073B'])),
+]
+
+@pytest.fixture
+def handler():
+    return attmgr_tp.AttestationTransactionHandler('fadc96')
+
+@pytest.mark.parametrize('action,message', MESSAGES)
+def test_both_formats_decode_to_the_message(handler, action, message):
+    envelope = transaction_envelope_pb2.AttestationEnvelope(Version=attmgr_tp.ENVELOPE_VERSION)
+    getattr(envelope, action).CopyFrom(message)
+    fromCbor = handler._decode_transaction(cbor.dumps({'Action': action, 'Payload': message.SerializeToString()}))
+    fromEnvelope = handler._decode_transaction(envelope.SerializeToString())
+    assert fromCbor == fromEnvelope == (action, message)
+
+# Envelopes of clients that set the serialized message as bytes field are encoded the same
+def test_envelope_with_serialized_message(handler):
+    data = MESSAGES[0][1].SerializeToString()
+    payload = b'\x08\x01' + b'\x12' + bytes([len(data)]) + data
+    assert handler._decode_transaction(payload) == MESSAGES[0]
+
+def test_sweep_payload_stays_empty(handler):
+    envelope = transaction_envelope_pb2.AttestationEnvelope(Version=attmgr_tp.ENVELOPE_VERSION, sweepExpired=b'')
+    assert handler._decode_transaction(envelope.SerializeToString()) == ('sweepExpired', b'')
+    assert handler._decode_transaction(cbor.dumps({'Action': 'sweepExpired', 'Payload': b''})) == ('sweepExpired', b'')
+
+def test_invalid_message_in_cbor_map(handler):
+    with pytest.raises(InvalidTransaction):
+        handler._decode_transaction(cbor.dumps({'Action': 'trustQuery', 'Payload': b'\xff\xff'}))
@@ -0,0 +1,91 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the memoization of trust query results.
+'''
+
+import bench_common
+import evidence_pb2
+import trust_query_pb2
+import address_calculator
+import evidence_expiry
+
+# Chain of devices, every device attests the next one
+CHAIN = ['0000B1', '0000B2', '0000B3']
+# Lifetime of a DIAT evidence
+LIFETIME = 1200
+# The second evidence of the chain is submitted later and outlives the first one
+DELAY = 600
+
+# Submits the evidences of the chain, the second one DELAY seconds after the first one
+def _submitChain(network):
+    bench_common.loadDevices(network.context, CHAIN)
+    network.apply(network.client.submitEvidence, bench_common.makeEvidence(CHAIN[0], CHAIN[1]).SerializeToString(), CHAIN[1])
+    network.setBlock(bench_common.BLOCK_NUMBER + 1, bench_common.BLOCK_TIME + DELAY)
+    network.apply(network.client.submitEvidence, bench_common.makeEvidence(CHAIN[1], CHAIN[2]).SerializeToString(), CHAIN[2])
+
+def _trustQuery(network):
+    query = trust_query_pb2.TrustQuery(Trustor=CHAIN[0], Trustee=CHAIN[-1], MinReliability=0.1)
+    network.apply(network.client.submitTrustQuery, query.SerializeToString())
+    return network.events('attestation/trustpath')[-1]
+
+def _memoIndex(network, prover):
+    data = network.context.state.get(address_calculator._assembleMemoIndexAddress(prover))
+    return list(evidence_pb2.MemoIndex.FromString(data).Addresses) if data else []
+
+MEMO_ADDRESS = address_calculator._assembleTrustMemoAddress(CHAIN[0], CHAIN[-1])
+
+def test_repeated_query_is_answered_from_the_memo(network):
+    _submitChain(network)
+    first = _trustQuery(network)
+    assert first['memoHit'] == 'False'
+    assert MEMO_ADDRESS in network.context.state
+    assert _memoIndex(network, CHAIN[1]) == [MEMO_ADDRESS]
+    assert _memoIndex(network, CHAIN[2]) == [MEMO_ADDRESS]
+
+    second = _trustQuery(network)
+    assert second['memoHit'] == 'True'
+    assert second['path'] == first['path']
+    assert second['finalRating'] == first['finalRating']
+
+# The sweep deletes the first evidence of the path and with it the memo
+def test_memo_is_invalidated_by_deleted_evidence(network):
+    _submitChain(network)
+    _trustQuery(network)
+
+    network.setBlock(bench_common.BLOCK_NUMBER + 2, bench_common.BLOCK_TIME + LIFETIME + evidence_expiry.EXPIRY_BUCKET_SECONDS)
+    network.apply(network.client.sweepExpired)
+    assert address_calculator._assembleEdgeAddress(CHAIN[1], CHAIN[0]) not in network.context.state
+    assert MEMO_ADDRESS not in network.context.state
+    assert _memoIndex(network, CHAIN[1]) == []
+
+    # The next query is not answered from the memo and finds no path
+    query = trust_query_pb2.TrustQuery(Trustor=CHAIN[0], Trustee=CHAIN[-1], MinReliability=0.1)
+    network.apply(network.client.submitTrustQuery, query.SerializeToString())
+    assert network.events('attestation/entrypoint')[-1]['memoHit'] == 'False'
+
+# An expired memo is deleted by the lookup and removed from the index of every prover on its path,
+# also from the index of the prover whose evidence is still valid
+def test_expired_memo_is_removed_from_the_memo_indexes(network):
+    _submitChain(network)
+    _trustQuery(network)
+
+    network.setBlock(bench_common.BLOCK_NUMBER + 2, bench_common.BLOCK_TIME + LIFETIME + 1)
+    query = trust_query_pb2.TrustQuery(Trustor=CHAIN[0], Trustee=CHAIN[-1], MinReliability=0.1)
+    network.apply(network.client.submitTrustQuery, query.SerializeToString())
+    assert network.events('attestation/entrypoint')[-1]['memoHit'] == 'False'
+    assert MEMO_ADDRESS not in network.context.state
+    # The evidence of the last prover is valid until DELAY seconds later and was not deleted
+    assert address_calculator._assembleEdgeAddress(CHAIN[2], CHAIN[1]) in network.context.state
+    assert _memoIndex(network, CHAIN[1]) == []
+    assert _memoIndex(network, CHAIN[2]) == []
@@ -0,0 +1,69 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+'''
+Tests of the scoring of evidences by trust queries.
+'''
+
+import pytest
+import bench_common
+import properties_pb2
+import trust_query_pb2
+import storage_functions
+
+from sawtooth_sdk.processor.exceptions import InvalidTransaction
+
+# Chain of devices, every device attests the next one
+CHAIN = ['0000A1', '0000A2', '0000A3']
+# Age of the evidences between xmin and xmax of DIAT, so the time function is evaluated
+AGE = 900
+
+# Submits the evidences of the chain and lets them age, the processor stamps them with the block time
+def _submitChain(network):
+    bench_common.loadDevices(network.context, CHAIN)
+    for verifier, prover in zip(CHAIN[:-1], CHAIN[1:]):
+        evidence = bench_common.makeEvidence(verifier, prover)
+        network.apply(network.client.submitEvidence, evidence.SerializeToString(), prover)
+    network.setBlock(bench_common.BLOCK_NUMBER + 1, bench_common.BLOCK_TIME + AGE)
+
+def _setTimeFunction(network, attestationType, timeFunction):
+    propertiesList = properties_pb2.PropertiesList.FromString(
+        network.context.state[storage_functions.properties_address])
+    for properties in propertiesList.Properties:
+        if properties.AttestationType == attestationType:
+            properties.TimeFunction = timeFunction
+    network.context.state[storage_functions.properties_address] = propertiesList.SerializeToString()
+
+def _trustQuery(network, trustor, trustee):
+    query = trust_query_pb2.TrustQuery(Trustor=trustor, Trustee=trustee, MinReliability=0.1, ReadOnly=True)
+    network.apply(network.client.submitTrustQuery, query.SerializeToString(), readOnly=True)
+
+def test_decaying_score(network):
+    _submitChain(network)
+    _trustQuery(network, CHAIN[0], CHAIN[-1])
+    trustPaths = network.events('attestation/trustpath')
+    assert len(trustPaths) == 1
+    edgeScore = (-0.001666667 * AGE + 2) * 0.99
+    assert float(trustPaths[0]['finalRating']) == pytest.approx(edgeScore ** 2, rel=1e-4)
+
+def test_division_by_zero_in_time_function(network):
+    _submitChain(network)
+    _setTimeFunction(network, 'DIAT', '1/(x-x)')
+    with pytest.raises(InvalidTransaction):
+        _trustQuery(network, CHAIN[0], CHAIN[-1])
+
+def test_scores_are_clamped(network):
+    _submitChain(network)
+    _setTimeFunction(network, 'DIAT', '5 + 0*x')
+    _trustQuery(network, CHAIN[0], CHAIN[-1])
+    trustPaths = network.events('attestation/trustpath')
+    assert float(trustPaths[0]['finalRating']) == pytest.approx(0.99 ** 2, rel=1e-4)
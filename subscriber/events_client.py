@@ -112,9 +112,11 @@ def listen_to_events(delta_filters=None):
                 prv = event.attributes[1].value
                 writeEdgeData(vrf, prv)
             elif (event.event_type == "attestation/evidence_deletion"):
-                vrf = event.attributes[0].value
-                prv = event.attributes[1].value
-                deleteEdgeData(vrf, prv)
+                # One event summarizes all deleted evidences of a prover
+                attributes = {attribute.key: attribute.value for attribute in event.attributes}
+                prv = attributes['prover']
+                for vrf in attributes['verifiers'].split(','):
+                    deleteEdgeData(vrf, prv)
             elif (event.event_type == "attestation/trustpath"):
                 trustQueryHits +=1
             elif (event.event_type == "attestation/entrypoint"):